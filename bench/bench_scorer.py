@@ -0,0 +1,273 @@
+# bench/bench_scorer.py
+# ─────────────────────────────────────────────
+#  Benchmark for scorer.rank_articles on synthetic candidate pools.
+#
+#  Pools of 1k / 10k / 100k articles are generated with a realistic mix:
+#    publishedAt  spread over the last three days, weighted to the
+#                 morning; a few missing or malformed
+#    source       tier 1 / tier 2 names from config.SOURCE_TIERS (some as
+#                 variants, e.g. "Reuters México") and unknown outlets
+#    headline     market vocabulary plus the story's own names
+#    content      --content-words words: the story's names, market terms,
+#                 a Zipf-like general vocabulary, filler; topics at random
+#    overlap      --overlap of the articles are lightly reworded copies
+#                 of an earlier one (syndication)
+#
+#  Each pool is timed end-to-end through rank_articles, and each stage
+#  is timed on its own: freshness, authority, relevance, story dedup
+#  (against a throwaway index of 70 covered stories) and the uniqueness
+#  filter. Peak memory comes from tracemalloc. The databases rank_articles
+#  touches are pointed at a temp dir, so data/ is never read or written.
+#
+#  Results are appended to bench/results/bench_scorer.jsonl with the git
+#  commit, one line per run. --compare prints this run against the
+#  previous one.
+#
+#  Usage (run from repo root):
+#    python bench/bench_scorer.py                        # 1k, 10k, 100k
+#    python bench/bench_scorer.py --sizes 1000 10000 --repeat 3 --compare
+# ─────────────────────────────────────────────
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+
+REPO_ROOT    = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_PATH = os.path.join(REPO_ROOT, "bench", "results", "bench_scorer.jsonl")
+sys.path.insert(0, os.path.join(REPO_ROOT, "bot"))
+
+_TMP = tempfile.mkdtemp(prefix="bench_scorer_")
+os.environ["STORY_INDEX_DB"]   = os.path.join(_TMP, "story_index.db")
+os.environ["ARTICLE_STORE_DB"] = os.path.join(_TMP, "article_store.db")
+
+import numpy as np  # noqa: E402
+
+import scorer  # noqa: E402
+import story_index  # noqa: E402
+from config import MAX_ARTICLES_FOR_CLAUDE, SOURCE_TIERS, TOPICS, TOPICS_EN  # noqa: E402
+from uniqueness import filter_unique  # noqa: E402
+
+NOW = datetime(2026, 4, 2, 12, 0, 0, tzinfo=timezone.utc)
+
+_VOCAB = (
+    "peso dólar Banxico tasa inflación bolsa petróleo Pemex aranceles remesas deuda bonos "
+    "crecimiento PIB empleo inversión exportaciones importaciones Hacienda presupuesto "
+    "gobierno Congreso reforma bancos crédito consumo industria manufactura automotriz "
+    "nearshoring T-MEC Canadá China Estados Unidos Fed rendimiento volatilidad riesgo "
+    "calificación Moody's S&P analistas pronóstico trimestre anual récord caída alza"
+).split()
+_FILLER = "el la de en y a que por con para los las un una del se su al más".split()
+_UNKNOWN_SOURCES = [
+    "El Sol de México", "Forbes México", "Proceso", "Xataka", "Yahoo Finanzas", "La Jornada",
+    "Blog Financiero", "Noticias MX", "Diario de Yucatán", "Business Insider", "Investing.com",
+]
+_TOPIC_WORDS = TOPICS + TOPICS_EN
+# Story-specific names (companies, officials, places): each story draws a few,
+# so unrelated stories share little beyond the common vocabulary
+_ENTITIES = [f"{a}{b}" for a in ("Grupo", "Banco", "Minera", "Fondo", "Sen", "Gob", "Puerto", "Cía")
+             for b in range(250)]
+# General vocabulary: 8,192 pseudo-words drawn with Zipf-like weights
+_SYLLABLES = ["ca", "de", "mi", "no", "ra", "ti", "so", "lu", "pe", "ve", "ga", "bo", "zu", "fi", "le", "tro"]
+_LEXICON   = [a + b + c for a in _SYLLABLES for b in _SYLLABLES for c in _SYLLABLES[:8]] * 2
+_LEXICON   = [w + ("s" if i >= len(_LEXICON) // 2 else "") for i, w in enumerate(_LEXICON)]
+_LEX_CUM   = np.cumsum(1 / np.arange(1, len(_LEXICON) + 1) ** 0.7).tolist()
+
+
+def _published_at(rng: random.Random) -> str | None:
+    roll = rng.random()
+    if roll < 0.03:
+        return None
+    if roll < 0.05:
+        return "not-a-date"
+    hours = rng.choices([rng.uniform(0, 6), rng.uniform(6, 12), rng.uniform(12, 24), rng.uniform(24, 72)],
+                        weights=[40, 25, 20, 15])[0]
+    return (NOW - timedelta(hours=hours)).isoformat().replace("+00:00", "Z")
+
+
+def _source(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.25:
+        name = rng.choice(SOURCE_TIERS["tier1"])
+        return name + rng.choice(["", "", " México", " Línea"])
+    if roll < 0.55:
+        return rng.choice(SOURCE_TIERS["tier2"])
+    return rng.choice(_UNKNOWN_SOURCES)
+
+
+def _story(rng: random.Random) -> tuple[str, list[str]]:
+    """A headline and the entity names its story is about."""
+    entities = rng.sample(_ENTITIES, 4)
+    words = rng.choices(_VOCAB, k=rng.randint(4, 9)) + entities[:2]
+    rng.shuffle(words)
+    return " ".join(words), entities
+
+
+def _reword(headline: str, rng: random.Random) -> str:
+    words = headline.split()
+    if len(words) > 3:
+        words.pop(rng.randrange(len(words)))
+    words.insert(rng.randrange(len(words) + 1), rng.choice(_VOCAB))
+    return " ".join(words)
+
+
+def _content(rng: random.Random, n_words: int, entities: list[str]) -> str:
+    words = []
+    for _ in range(n_words):
+        roll = rng.random()
+        if roll < 0.01:
+            words.append(rng.choice(_TOPIC_WORDS))
+        elif roll < 0.08:
+            words.append(rng.choice(entities))
+        elif roll < 0.12:
+            words.append(rng.choice(_VOCAB))
+        elif roll < 0.60:
+            words.append(rng.choices(_LEXICON, cum_weights=_LEX_CUM)[0])
+        else:
+            words.append(rng.choice(_FILLER))
+    return " ".join(words)
+
+
+def make_pool(size: int, overlap: float = 0.2, content_words: int = 300, seed: int = 0) -> list[dict]:
+    """size synthetic candidates in the shape fetch_news returns."""
+    rng = random.Random(seed)
+    pool: list[dict] = []
+    for i in range(size):
+        if pool and rng.random() < overlap:
+            base    = rng.choice(pool)
+            title   = _reword(base["title"], rng)
+            content = _reword(base["content"], rng)
+        else:
+            title, entities = _story(rng)
+            content = _content(rng, content_words, entities)
+        pool.append({
+            "title": title, "content": content, "source": _source(rng),
+            "url": f"https://example.com/{seed}/{i}", "publishedAt": _published_at(rng),
+        })
+    return pool
+
+
+def _measure(fn, repeat: int) -> dict:
+    """Best-of-repeat wall time, then peak traced memory of one more call."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": round(best, 5), "peak_kb": round(peak / 1024, 1)}
+
+
+def bench_pool(pool: list[dict], repeat: int) -> dict:
+    def freshness():
+        scorer._freshness_column(np.array([scorer._hours_old(a.get("publishedAt"), NOW) for a in pool]))
+
+    def authority():
+        scorer._authority_score.cache_clear()
+        [scorer._authority_score(a.get("source") or "") for a in pool]
+
+    def relevance():
+        scorer._relevance_column(pool, TOPICS)
+
+    def story_dedup():
+        story_index.max_similarity(pool, today=NOW.date())
+
+    ranked = [pool[i] for i in np.argsort(-scorer.score_articles(pool, NOW), kind="stable")]
+
+    def uniqueness():
+        filter_unique(ranked, MAX_ARTICLES_FOR_CLAUDE)
+
+    def rank():
+        scorer.rank_articles(pool, now=NOW)
+
+    stages = {
+        "freshness": freshness, "authority": authority, "relevance": relevance,
+        "story_dedup": story_dedup, "uniqueness": uniqueness, "rank_articles": rank,
+    }
+    return {name: _measure(fn, repeat) for name, fn in stages.items()}
+
+
+def _seed_story_index() -> None:
+    """70 covered stories (a week of issues) so story dedup does its real work."""
+    covered = make_pool(70, seed=99)
+    for day in range(7):
+        issue = (NOW.date() - timedelta(days=day + 1)).isoformat()
+        story_index.add_stories(covered[day * 10:(day + 1) * 10], issue)
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes: list[int], repeat: int, overlap: float, content_words: int, seed: int) -> dict:
+    _seed_story_index()
+    results = {
+        "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"), "commit": _git_commit(),
+        "repeat": repeat, "overlap": overlap, "content_words": content_words, "seed": seed, "sizes": {},
+    }
+    for size in sizes:
+        pool = make_pool(size, overlap, content_words, seed)
+        results["sizes"][str(size)] = bench_pool(pool, repeat)
+    return results
+
+
+def print_report(results: dict, previous: dict | None = None) -> None:
+    for size, stages in results["sizes"].items():
+        before = (previous or {}).get("sizes", {}).get(size, {})
+        label = f" vs {previous['commit'] or previous['ts']}" if before else ""
+        print(f"\n── {int(size):,} articles{label} ──")
+        print(f"{'stage':<14} {'seconds':>9} {'µs/article':>11} {'peak KB':>9}" + ("  change" if before else ""))
+        for name, r in stages.items():
+            line = (f"{name:<14} {r['seconds']:>9.4f} {r['seconds'] / int(size) * 1e6:>11.1f} "
+                    f"{r['peak_kb']:>9.0f}")
+            if name in before and before[name]["seconds"]:
+                line += f"  {r['seconds'] / before[name]['seconds'] - 1:+.0%}"
+            print(line)
+
+
+def _previous(path: str) -> dict | None:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        lines = [line for line in f if line.strip()]
+    return json.loads(lines[-1]) if lines else None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark rank_articles on synthetic pools")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per stage (best is kept)")
+    parser.add_argument("--overlap", type=float, default=0.2, help="Share of reworded duplicate headlines")
+    parser.add_argument("--content-words", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--results", default=RESULTS_PATH, help="JSONL file the run is appended to")
+    parser.add_argument("--compare", action="store_true", help="Show change against the previous saved run")
+    args = parser.parse_args()
+
+    previous = _previous(args.results) if args.compare else None
+    results  = run(args.sizes, args.repeat, args.overlap, args.content_words, args.seed)
+    print_report(results, previous)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.results)), exist_ok=True)
+    with open(args.results, "a", encoding="utf-8") as f:
+        f.write(json.dumps(results) + "\n")
+    print(f"\nResults appended to {args.results}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
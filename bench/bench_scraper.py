@@ -0,0 +1,186 @@
+# bench/bench_scraper.py
+# ─────────────────────────────────────────────
+#  Offline benchmark for scraper.py extraction.
+#
+#  Runs every page of a versioned corpus (bench/scraper_corpus/<version>/)
+#  through both extraction paths — extract_text (full BeautifulSoup
+#  parse) and the streaming extractor — with no network, and reports
+#  per page: pages/sec, peak memory, extracted length, and a quality
+#  check against the manifest's expected text.
+#
+#  Usage (run from repo root):
+#    python bench/bench_scraper.py                      # latest corpus
+#    python bench/bench_scraper.py --version v1 --iterations 20
+#    python bench/bench_scraper.py --out bench_output.json
+#    python bench/bench_scraper.py --add URL            # snapshot a live page
+#
+#  Exit status is 1 if any page fails its quality check, so the harness
+#  can gate selector or parser changes before they reach the cron.
+#
+#  Manifest entries: {"file", "url", "expected"} where expected is
+#  null (extraction must return None) or
+#  {"prefix", "min_chars", "must_not_contain": [...]}.
+#
+#  The learned-selector database extraction reads and writes is pointed
+#  at a temp dir, so data/ is never read or written.
+# ─────────────────────────────────────────────
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+REPO_ROOT  = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS_DIR = os.path.join(REPO_ROOT, "bench", "scraper_corpus")
+sys.path.insert(0, os.path.join(REPO_ROOT, "bot"))
+
+_TMP = tempfile.mkdtemp(prefix="bench_scraper_")
+os.environ["LEARNED_SELECTORS_DB"] = os.path.join(_TMP, "learned_selectors.db")
+
+from scraper import extract_text, _extract_stream, _CHUNK_BYTES  # noqa: E402
+
+MAX_CHARS = 3000
+
+
+def latest_version() -> str:
+    versions = sorted(d for d in os.listdir(CORPUS_DIR) if os.path.isdir(os.path.join(CORPUS_DIR, d)))
+    return versions[-1]
+
+
+def load_corpus(version: str) -> list[dict]:
+    """Manifest entries with the page bytes attached under "html"."""
+    root = os.path.join(CORPUS_DIR, version)
+    with open(os.path.join(root, "manifest.json"), encoding="utf-8") as f:
+        manifest = json.load(f)
+    pages = []
+    for entry in manifest["pages"]:
+        with open(os.path.join(root, entry["file"]), "rb") as f:
+            pages.append({**entry, "html": f.read()})
+    return pages
+
+
+def _full_parse(page: dict) -> str | None:
+    return extract_text(page["html"].decode("utf-8"), page["url"], MAX_CHARS)
+
+
+def _streaming(page: dict) -> str | None:
+    data = page["html"]
+    chunks = (data[i:i + _CHUNK_BYTES] for i in range(0, len(data), _CHUNK_BYTES))
+    return _extract_stream(chunks, page["url"], MAX_CHARS, "utf-8")
+
+
+EXTRACTORS = {"full": _full_parse, "streaming": _streaming}
+
+
+def check_quality(text: str | None, expected: dict | None) -> list[str]:
+    """Problems with an extraction versus its manifest entry; [] means pass."""
+    if expected is None:
+        return [] if text is None else [f"expected None, got {len(text)} chars"]
+    if text is None:
+        return ["expected text, got None"]
+    problems = []
+    if not text.startswith(expected["prefix"]):
+        problems.append(f"prefix mismatch: {text[:60]!r}")
+    if len(text) < expected["min_chars"]:
+        problems.append(f"too short: {len(text)} < {expected['min_chars']}")
+    for needle in expected.get("must_not_contain", []):
+        if needle in text:
+            problems.append(f"contains boilerplate {needle!r}")
+    return problems
+
+
+def bench_page(page: dict, extract, iterations: int) -> dict:
+    """Time one extractor on one page, then measure its peak memory on a single run."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        text = extract(page)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    extract(page)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "file":       page["file"],
+        "bytes":      len(page["html"]),
+        "pages_sec":  iterations / elapsed if elapsed else float("inf"),
+        "peak_kb":    peak / 1024,
+        "chars":      len(text or ""),
+        "problems":   check_quality(text, page.get("expected")),
+    }
+
+
+def run(version: str, iterations: int) -> dict:
+    pages   = load_corpus(version)
+    results = {"version": version, "iterations": iterations, "modes": {}}
+    for mode, extract in EXTRACTORS.items():
+        results["modes"][mode] = [bench_page(p, extract, iterations) for p in pages]
+    return results
+
+
+def print_report(results: dict) -> None:
+    for mode, rows in results["modes"].items():
+        print(f"\n── {mode} ({results['version']}, {results['iterations']} iterations) ──")
+        print(f"{'page':<28} {'KB':>6} {'pages/s':>8} {'peak KB':>8} {'chars':>6}  quality")
+        for r in rows:
+            quality = "ok" if not r["problems"] else "FAIL: " + "; ".join(r["problems"])
+            print(f"{r['file']:<28} {r['bytes'] / 1024:>6.0f} {r['pages_sec']:>8.1f} "
+                  f"{r['peak_kb']:>8.0f} {r['chars']:>6}  {quality}")
+        total_time = sum(1 / r["pages_sec"] for r in rows)
+        print(f"{'total':<28} {'':>6} {len(rows) / total_time:>8.1f} "
+              f"{max(r['peak_kb'] for r in rows):>8.0f}")
+
+
+def add_page(url: str, version: str) -> None:
+    """Download url into the corpus and pin its current extraction as expected."""
+    from utils import http
+    from scraper import _domain
+
+    root = os.path.join(CORPUS_DIR, version)
+    manifest_path = os.path.join(root, "manifest.json")
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    response = http.get(url, timeout=15)
+    response.raise_for_status()
+    fname = _domain(url).replace(".", "_") + f"_{len(manifest['pages'])}.html"
+    with open(os.path.join(root, fname), "wb") as f:
+        f.write(response.content)
+
+    text = extract_text(response.content.decode(response.encoding or "utf-8", "replace"), url, MAX_CHARS)
+    expected = None if text is None else {"prefix": text[:200], "min_chars": len(text), "must_not_contain": []}
+    manifest["pages"].append({"file": fname, "url": url, "expected": expected})
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    print(f"Added {fname} ({len(response.content) / 1024:.0f} KB, {len(text or '')} chars). "
+          f"Review the expected entry in {manifest_path}.")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline scraper extraction benchmark")
+    parser.add_argument("--version", default=None, help="Corpus version (default: latest)")
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--out", default=None, help="Write results as JSON to this path")
+    parser.add_argument("--add", metavar="URL", default=None, help="Snapshot a live page into the corpus")
+    args = parser.parse_args()
+
+    version = args.version or latest_version()
+    if args.add:
+        add_page(args.add, version)
+        return 0
+
+    results = run(version, args.iterations)
+    print_report(results)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    failed = any(r["problems"] for rows in results["modes"].values() for r in rows)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+# bench/bench_uniqueness.py
+# ─────────────────────────────────────────────
+#  Benchmark for the rank_articles uniqueness filter (uniqueness.py).
+#
+#  Builds candidate pools from the stories of the saved digests
+#  (digests/*.json, both languages). Each pool is padded to the requested
+#  size with reworded copies: words dropped, swapped or appended, the
+#  way syndicated and follow-up headlines differ. Each pool then runs
+#  through the indexed filter and through the pairwise pass it replaced.
+#  The benchmark checks that both select the same articles in the same
+#  order and reports the time each takes. Pools are filtered with no
+#  limit, which is the worst case for the pairwise pass.
+#
+#  Usage (run from repo root):
+#    python bench/bench_uniqueness.py                       # 1k, 10k
+#    python bench/bench_uniqueness.py --sizes 1000 10000 50000 --body
+#    python bench/bench_uniqueness.py --out bench_output.json
+#
+#  Exit status is 1 if any selection differs from the pairwise pass.
+# ─────────────────────────────────────────────
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+REPO_ROOT  = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIGEST_DIR = os.path.join(REPO_ROOT, "digests")
+sys.path.insert(0, os.path.join(REPO_ROOT, "bot"))
+
+from uniqueness import filter_unique, headline_words, body_shingles  # noqa: E402
+from config import UNIQUENESS_OVERLAP  # noqa: E402
+
+_FILLERS = ["hoy", "según", "analistas", "update", "live", "reuters", "exclusiva", "mercados", "en", "vivo"]
+
+
+def load_stories(digest_dir: str = DIGEST_DIR) -> list[dict]:
+    """Every story of every saved digest, as an article dict."""
+    stories = []
+    for filename in sorted(f for f in os.listdir(digest_dir) if f.endswith(".json")):
+        with open(os.path.join(digest_dir, filename), encoding="utf-8") as f:
+            digest = json.load(f).get("digest", {})
+        for lang in ("es", "en"):
+            for s in digest.get(lang, {}).get("stories", []):
+                if s.get("headline"):
+                    stories.append({"title": s["headline"], "content": s.get("body", ""),
+                                    "source": s.get("source", ""), "url": s.get("url", "")})
+    return stories
+
+
+def _reword(text: str, rng: random.Random) -> str:
+    words = text.split()
+    for _ in range(rng.randint(1, 3)):
+        op = rng.random()
+        if op < 0.4 and len(words) > 2:
+            words.pop(rng.randrange(len(words)))
+        elif op < 0.7 and len(words) > 1:
+            i, j = rng.randrange(len(words)), rng.randrange(len(words))
+            words[i], words[j] = words[j], words[i]
+        else:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(_FILLERS))
+    return " ".join(words)
+
+
+def build_pool(stories: list[dict], size: int, seed: int = 0) -> list[dict]:
+    """size articles: the stories first, then reworded copies of random ones."""
+    rng  = random.Random(seed)
+    pool = [dict(s) for s in stories[:size]]
+    while len(pool) < size:
+        base = rng.choice(stories)
+        pool.append({**base, "title": _reword(base["title"], rng),
+                     "content": _reword(base["content"], rng), "url": f"{base['url']}#{len(pool)}"})
+    rng.shuffle(pool)
+    return pool
+
+
+def pairwise_filter(articles: list[dict], limit: int, threshold: float, use_body: bool) -> list[dict]:
+    """The pairwise greedy pass rank_articles used before the index, extended to bodies."""
+    accepted, accepted_words, accepted_bodies = [], [], []
+    for article in articles:
+        words = headline_words(article)
+        if words and accepted_words and max(
+            len(words & w) / len(words) for w in accepted_words
+        ) >= threshold:
+            continue
+        shingles = body_shingles(article) if use_body else set()
+        if shingles and accepted_bodies and max(
+            len(shingles & b) / len(shingles) for b in accepted_bodies
+        ) >= threshold:
+            continue
+        accepted.append(article)
+        accepted_words.append(words)
+        accepted_bodies.append(shingles)
+        if len(accepted) >= limit:
+            break
+    return accepted
+
+
+def _timed(fn, *args) -> tuple[list, float]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def run(sizes: list[int], use_body: bool, seed: int) -> tuple[list[dict], bool]:
+    stories = load_stories()
+    rows, ok = [], True
+    for size in sizes:
+        pool = build_pool(stories, size, seed)
+        modes = [False, True] if use_body else [False]
+        for body in modes:
+            indexed, t_indexed   = _timed(filter_unique, pool, size, UNIQUENESS_OVERLAP, body)
+            pairwise, t_pairwise = _timed(pairwise_filter, pool, size, UNIQUENESS_OVERLAP, body)
+            same = [a["url"] for a in indexed] == [a["url"] for a in pairwise]
+            ok = ok and same
+            rows.append({
+                "size": size, "body": body, "accepted": len(indexed), "same": same,
+                "indexed_s": round(t_indexed, 4), "pairwise_s": round(t_pairwise, 4),
+                "speedup": round(t_pairwise / t_indexed, 1) if t_indexed else None,
+            })
+    return rows, ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the uniqueness filter against the pairwise pass")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--body", action="store_true", help="Also benchmark the body-shingle mode")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    rows, ok = run(args.sizes, args.body, args.seed)
+    print(f"{'size':>7} {'body':>5} {'kept':>6} {'same':>5} {'indexed':>9} {'pairwise':>9} {'speedup':>8}")
+    for r in rows:
+        print(f"{r['size']:>7} {str(r['body']):>5} {r['accepted']:>6} {str(r['same']):>5} "
+              f"{r['indexed_s']:>8.3f}s {r['pairwise_s']:>8.3f}s {r['speedup'] or '-':>7}x")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+    if not ok:
+        print("Selections differ from the pairwise pass.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+# ─────────────────────────────────────────────
+#  article_store.py  —  Every fetched article, across all runs
+#
+#  One row per URL: title, source, publishedAt, the scraped content, the
+#  fetch time, the run that last fetched or considered it, and the issue
+#  date it was selected for (NULL if never picked). Articles are not
+#  scored here: rank_articles scores the pool when it is used, since
+#  freshness depends on the time of the run. (Databases created before
+#  this keep an unused score column.)
+#  An FTS5 index over title + content backs search().
+#
+#  Uses:
+#    prefetch.py         adds each overnight pass; main.py with
+#                        USE_PREFETCH_POOL reads the pool back (load_pool)
+#    main.py             records every run's candidates and marks the
+#                        stories Claude picked (mark_selected)
+#    storage.py          cross-day dedup: recent_selected_urls() is an
+#                        indexed lookup instead of a scan of digests/
+#    story_index.py      backfills its similarity index from the
+#                        selected rows (selected_articles)
+#    mock_data.py        mock runs replay a real run's article pool
+#
+#  Unselected rows older than ARTICLE_STORE_RETENTION_DAYS are pruned on
+#  every prefetch pass; selected rows are kept.
+#
+#  CLI (run from bot/):
+#    python article_store.py --backfill          # import digests/ stories
+#    python article_store.py --search "banxico tasas"
+#
+#  Default DB path: data/article_store.db (repo root).
+#  Override with ARTICLE_STORE_DB, or pass db_path for tests.
+# ─────────────────────────────────────────────
+
+import argparse
+import json
+import os
+import sqlite3
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from config import ARTICLE_STORE_RETENTION_DAYS, DIGEST_DIR
+
+_DEFAULT_DB = os.path.join(
+    os.path.dirname(__file__), "..", "data", "article_store.db"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    url           TEXT    NOT NULL UNIQUE,
+    title         TEXT    NOT NULL,
+    source        TEXT    NOT NULL,
+    published_at  TEXT    NOT NULL DEFAULT '',
+    content       TEXT    NOT NULL,
+    fetched_at    REAL    NOT NULL,
+    run_id        TEXT,
+    selected_on   TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_articles_fetched  ON articles (fetched_at);
+CREATE INDEX IF NOT EXISTS idx_articles_run      ON articles (run_id);
+CREATE INDEX IF NOT EXISTS idx_articles_selected ON articles (selected_on);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, content, content='articles', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, content)
+    VALUES ('delete', old.id, old.title, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF title, content ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, content)
+    VALUES ('delete', old.id, old.title, old.content);
+    INSERT INTO articles_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+"""
+
+_COLUMNS = "url, title, source, published_at, content"
+
+
+def _resolve_path(db_path: Optional[str]) -> str:
+    path = (db_path or "").strip() or os.environ.get("ARTICLE_STORE_DB", _DEFAULT_DB)
+    parent = os.path.dirname(os.path.abspath(path))
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    return path
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Bring a pool-only database (no run_id / selected_on / FTS) up to the current schema."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(articles)")}
+    if columns and "run_id" not in columns:
+        conn.execute("ALTER TABLE articles ADD COLUMN run_id TEXT")
+        conn.execute("ALTER TABLE articles ADD COLUMN selected_on TEXT")
+        conn.executescript(_SCHEMA)
+        conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+
+
+def _connect(db_path: Optional[str]) -> sqlite3.Connection:
+    conn = sqlite3.connect(_resolve_path(db_path), timeout=10)
+    _migrate(conn)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _to_article(row: tuple) -> Dict:
+    url, title, source, published_at, content = row
+    return {"title": title, "content": content, "source": source, "url": url, "publishedAt": published_at}
+
+
+def add_articles(
+    articles: List[Dict],
+    run_id: Optional[str] = None,
+    db_path: Optional[str] = None,
+) -> int:
+    """
+    Insert articles not already stored. Returns how many were new.
+
+    Articles already stored keep their content and fetch time; when
+    run_id is given it replaces theirs, so a run's pool can be read back
+    with load_run() even when it came from an earlier prefetch pass.
+    """
+    now = time.time()
+    rows = [
+        (a["url"], a.get("title", ""), a.get("source", ""), a.get("publishedAt", ""),
+         a.get("content", ""), now, run_id)
+        for a in articles
+    ]
+    with _connect(db_path) as conn:
+        existing = set()
+        for i in range(0, len(rows), 500):
+            chunk = [r[0] for r in rows[i:i + 500]]
+            existing.update(u for (u,) in conn.execute(
+                f"SELECT url FROM articles WHERE url IN ({','.join('?' * len(chunk))})", chunk,
+            ))
+        conn.executemany(
+            """
+            INSERT INTO articles
+                (url, title, source, published_at, content, fetched_at, run_id)
+            VALUES (?,?,?,?,?,?,?)
+            ON CONFLICT (url) DO UPDATE SET run_id = COALESCE(excluded.run_id, articles.run_id)
+            """,
+            rows,
+        )
+    return len({r[0] for r in rows} - existing)
+
+
+def _story_article(story: Dict) -> Dict:
+    """A digest story in article shape; the story body stands in for the scraped content."""
+    return {"title": story.get("headline", ""), "content": story.get("body", ""),
+            "source": story.get("source", ""), "url": story["url"], "publishedAt": ""}
+
+
+def mark_selected(stories: List[Dict], issue_date: str, db_path: Optional[str] = None) -> int:
+    """
+    Flag the digest stories picked for the issue of issue_date (YYYY-MM-DD).
+    A story whose URL has no row (Claude's URL differs from the fetched
+    one, or the run's add_articles failed) is inserted from the story
+    itself, so cross-day dedup still sees it. Returns how many were inserted.
+    """
+    articles = [_story_article(s) for s in stories if s.get("url")]
+    added = add_articles(articles, run_id=issue_date, db_path=db_path)
+    with _connect(db_path) as conn:
+        conn.executemany(
+            "UPDATE articles SET selected_on = MAX(COALESCE(selected_on, ''), ?) WHERE url = ?",
+            [(issue_date, a["url"]) for a in articles],
+        )
+    return added
+
+
+def has_selections(db_path: Optional[str] = None) -> bool:
+    with _connect(db_path) as conn:
+        return conn.execute("SELECT 1 FROM articles WHERE selected_on IS NOT NULL LIMIT 1").fetchone() is not None
+
+
+def selected_dates(since: str, db_path: Optional[str] = None) -> set:
+    """Issue dates (YYYY-MM-DD) on or after since that have selected articles."""
+    with _connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT DISTINCT selected_on FROM articles WHERE selected_on >= ?", (since,)
+        ).fetchall()
+    return {d for (d,) in rows}
+
+
+def recent_selected_urls(days: int = 5, today: Optional[date] = None, db_path: Optional[str] = None) -> set:
+    """URLs selected for the issues of the last `days` days, not counting today."""
+    today = today or date.today()
+    since = (today - timedelta(days=days)).isoformat()
+    with _connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT url FROM articles WHERE selected_on >= ? AND selected_on < ?",
+            (since, today.isoformat()),
+        ).fetchall()
+    return {url for (url,) in rows}
+
+
+def selected_articles(db_path: Optional[str] = None) -> List[Dict]:
+    """Every article picked for an issue, oldest issue first, with its selected_on date."""
+    with _connect(db_path) as conn:
+        rows = conn.execute(
+            f"SELECT {_COLUMNS}, selected_on FROM articles WHERE selected_on IS NOT NULL ORDER BY selected_on, id"
+        ).fetchall()
+    return [{**_to_article(r[:5]), "selected_on": r[5]} for r in rows]
+
+
+def known_urls(hours: float, db_path: Optional[str] = None) -> set:
+    """URLs added in the last `hours` — passed to the fetcher so they are not scraped again."""
+    since = time.time() - hours * 3600
+    with _connect(db_path) as conn:
+        rows = conn.execute("SELECT url FROM articles WHERE fetched_at >= ?", (since,)).fetchall()
+    return {url for (url,) in rows}
+
+
+def load_pool(
+    hours: float,
+    exclude_urls: Optional[set] = None,
+    db_path: Optional[str] = None,
+) -> List[Dict]:
+    """
+    Articles added in the last `hours`, oldest fetch first, in the shape
+    fetch_news returns. URLs in exclude_urls (already covered by recent
+    digests) are left out.
+    """
+    since = time.time() - hours * 3600
+    exclude_urls = exclude_urls or set()
+    with _connect(db_path) as conn:
+        rows = conn.execute(
+            f"SELECT {_COLUMNS} FROM articles WHERE fetched_at >= ? ORDER BY fetched_at, id",
+            (since,),
+        ).fetchall()
+    return [_to_article(r) for r in rows if r[0] not in exclude_urls]
+
+
+def load_run(run_id: str, db_path: Optional[str] = None) -> List[Dict]:
+    """Every article the given run fetched or considered, oldest fetch first."""
+    with _connect(db_path) as conn:
+        rows = conn.execute(
+            f"SELECT {_COLUMNS} FROM articles WHERE run_id = ? ORDER BY fetched_at, id",
+            (run_id,),
+        ).fetchall()
+    return [_to_article(r) for r in rows]
+
+
+def search(query: str, limit: int = 20, db_path: Optional[str] = None) -> List[Dict]:
+    """
+    Full-text search over title + content (FTS5 query syntax), best match
+    first. Each result also carries fetched_at, run_id and selected_on.
+    """
+    with _connect(db_path) as conn:
+        rows = conn.execute(
+            """
+            SELECT a.url, a.title, a.source, a.published_at, a.content,
+                   a.fetched_at, a.run_id, a.selected_on
+            FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid
+            WHERE articles_fts MATCH ? ORDER BY bm25(articles_fts) LIMIT ?
+            """,
+            (query, limit),
+        ).fetchall()
+    return [
+        {**_to_article(r[:5]), "fetched_at": r[5], "run_id": r[6], "selected_on": r[7]}
+        for r in rows
+    ]
+
+
+def backfill_from_digests(
+    digest_dir: str = DIGEST_DIR,
+    db_path: Optional[str] = None,
+    dates: Optional[set] = None,
+) -> int:
+    """
+    Import the stories of the saved digests (only those for `dates`, if
+    given) as selected articles. Returns how many were new.
+    """
+    if not os.path.exists(digest_dir):
+        return 0
+    added = 0
+    for filename in sorted(f for f in os.listdir(digest_dir) if f.endswith(".json")):
+        issue_date = filename[:-5]
+        if dates is not None and issue_date not in dates:
+            continue
+        try:
+            with open(os.path.join(digest_dir, filename), encoding="utf-8") as f:
+                digest = json.load(f).get("digest", {})
+            fetched_at = datetime.fromisoformat(issue_date).timestamp()
+        except (OSError, ValueError) as e:
+            print(f"  [article_store] Skipping {filename}: {e}")
+            continue
+        stories = [s for s in digest.get("es", digest).get("stories", []) if s.get("url")]
+        added += mark_selected(stories, issue_date, db_path=db_path)
+        with _connect(db_path) as conn:
+            conn.executemany(
+                "UPDATE articles SET fetched_at = MIN(fetched_at, ?) WHERE url = ?",
+                [(fetched_at, s["url"]) for s in stories],
+            )
+    return added
+
+
+def prune(db_path: Optional[str] = None) -> int:
+    """Delete unselected rows older than ARTICLE_STORE_RETENTION_DAYS. Returns how many were removed."""
+    cutoff = time.time() - ARTICLE_STORE_RETENTION_DAYS * 86400
+    with _connect(db_path) as conn:
+        return conn.execute(
+            "DELETE FROM articles WHERE fetched_at < ? AND selected_on IS NULL", (cutoff,)
+        ).rowcount
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Article store maintenance")
+    parser.add_argument("--backfill", action="store_true", help="Import stories from digests/")
+    parser.add_argument("--search", metavar="QUERY", help="Full-text search (FTS5 syntax)")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.backfill:
+        print(f"Imported {backfill_from_digests()} stories from {DIGEST_DIR}")
+    if args.search:
+        for hit in search(args.search, limit=args.limit):
+            picked = f"  [selected {hit['selected_on']}]" if hit["selected_on"] else ""
+            print(f"{hit['source'][:20]:<20} {hit['title'][:80]}{picked}\n{'':<20} {hit['url']}")
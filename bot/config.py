@@ -87,10 +87,79 @@ TOPICS                 = ["finanzas", "economía", "México", "comercio", "merca
 LANGUAGE               = "es"
 TOPICS_EN              = ["emerging markets", "global trade", "Federal Reserve", "China economy", "commodities", "geopolitics", "tariffs"]
 LANGUAGE_EN            = "en"
+# (topics, language) batches fetched concurrently. Order matters: when the same
+# URL turns up in several batches, the earliest batch keeps it. A future PT
+# batch goes at the end.
+LANGUAGE_BATCHES       = [(TOPICS, LANGUAGE), (TOPICS_EN, LANGUAGE_EN)]
 MAX_ARTICLES_PER_TOPIC  = 5
 MAX_ARTICLES_PER_SOURCE = 1   # cap per outlet across all topics
 MAX_ARTICLE_CHARS       = 3000
 
+# NewsAPI query coalescing: set COALESCE_QUERIES=true to send each language's
+# topics as OR queries (up to COALESCE_MAX_TOPICS per query, at most
+# NEWSAPI_MAX_QUERY_CHARS once URL-encoded). Results are matched back to their
+# topics locally; a topic with fewer than MAX_ARTICLES_PER_TOPIC matches gets its
+# own query. Close to, not identical to, per-topic queries (see fetcher.py).
+COALESCE_QUERIES        = os.environ.get("COALESCE_QUERIES", "false").lower() == "true"
+COALESCE_MAX_TOPICS     = 4
+COALESCED_PAGE_SIZE     = 100   # NewsAPI maximum
+NEWSAPI_MAX_QUERY_CHARS = 500
+
+# Article scraping runs on a bounded thread pool.
+SCRAPE_MAX_WORKERS    = 8   # concurrent scrapes overall
+SCRAPE_MAX_PER_DOMAIN = 2   # concurrent scrapes against any one outlet
+
+# Per-domain scrape health (domain_health.py). Timeouts adapt per outlet
+# between the floor and SCRAPE_TIMEOUT; an outlet failing BREAKER_FAILURE_RATE
+# of its last BREAKER_WINDOW attempts is skipped until BREAKER_COOLDOWN_HOURS
+# pass. The breaker looks at a shorter window than the timeouts so an outlet
+# that recovers is let back in after a few good scrapes.
+SCRAPE_TIMEOUT         = 8     # seconds
+SCRAPE_TIMEOUT_FLOOR   = 3     # seconds
+DOMAIN_HEALTH_WINDOW   = 50    # attempts kept per domain
+BREAKER_WINDOW         = 10    # most recent attempts the breaker judges
+BREAKER_MIN_SAMPLES    = 5
+BREAKER_FAILURE_RATE   = 0.8
+BREAKER_COOLDOWN_HOURS = 24
+
+# Async fetch engine: set FETCH_ASYNC=true to run NewsAPI queries and scrapes
+# on one asyncio event loop (fetcher.fetch_news_async) instead of threads.
+FETCH_ASYNC               = os.environ.get("FETCH_ASYNC", "false").lower() == "true"
+FETCH_ASYNC_MAX_IN_FLIGHT = 100  # open connections across all hosts
+
+# Scrape cache (scrape_cache.py): reruns within the TTL reuse extracted text;
+# stale entries are revalidated with a conditional GET. SCRAPE_CACHE=false disables.
+SCRAPE_CACHE_ENABLED     = os.environ.get("SCRAPE_CACHE", "true").lower() == "true"
+SCRAPE_CACHE_TTL_HOURS   = float(os.environ.get("SCRAPE_CACHE_TTL_HOURS", "12"))
+SCRAPE_CACHE_MAX_ENTRIES = 5000
+
+# Streaming extraction: pages are parsed incrementally as they download and
+# reading stops once enough body text is in hand, or at SCRAPE_MAX_BYTES.
+# Non-HTML responses are rejected from their headers. SCRAPE_STREAMING=false
+# restores the download-everything-then-parse path.
+SCRAPE_STREAMING = os.environ.get("SCRAPE_STREAMING", "true").lower() == "true"
+SCRAPE_MAX_BYTES = 2_000_000
+
+# Parser processes: set SCRAPE_PARSE_PROCESSES to the number of worker
+# processes that run HTML extraction, leaving the scrape threads or event loop
+# to do network I/O only. 0 (default) parses in the I/O thread.
+SCRAPE_PARSE_PROCESSES = int(os.environ.get("SCRAPE_PARSE_PROCESSES", "0"))
+
+# Learned selectors (learned_selectors.py): for outlets missing from the
+# scraper's hand-written selectors, the best body container on each scraped
+# page is recorded; the one that wins SELECTOR_LEARN_PAGES pages is kept and
+# used on later runs. After SELECTOR_LEARN_MAX_PAGES pages with no winner the
+# domain stays on the generic <p> scan. Set SELECTOR_LEARNING=false to disable.
+SELECTOR_LEARNING        = os.environ.get("SELECTOR_LEARNING", "true").lower() == "true"
+SELECTOR_LEARN_PAGES     = 3
+SELECTOR_LEARN_MAX_PAGES = 10
+
+# Near-duplicate bodies (fingerprint.py): syndicated copies of one story whose
+# 64-bit SimHashes differ in at most NEAR_DUP_MAX_DISTANCE bits collapse to the
+# most authoritative source. Bodies under NEAR_DUP_MIN_CHARS are not compared.
+NEAR_DUP_MAX_DISTANCE = 3
+NEAR_DUP_MIN_CHARS    = 400
+
 # ── Domain allowlist ─────────────────────────
 # NewsAPI accepts up to 20 domains as a comma-separated string.
 # Only articles from these outlets will be fetched.
@@ -144,6 +213,62 @@ SOURCE_TIERS = {
 # Maximum number of articles passed to Claude after scoring.
 MAX_ARTICLES_FOR_CLAUDE = 12
 
+# Uniqueness filter (uniqueness.py): ranked candidates sharing UNIQUENESS_OVERLAP
+# or more of their headline words with an already-accepted headline are dropped.
+# Set UNIQUENESS_BODY_SHINGLES=true to apply the same test to body 3-shingles.
+UNIQUENESS_OVERLAP       = 0.6
+UNIQUENESS_BODY_SHINGLES = os.environ.get("UNIQUENESS_BODY_SHINGLES", "false").lower() == "true"
+
+# Cross-day story dedup (story_index.py): a candidate whose headline+body vector
+# has cosine similarity >= STORY_DEDUP_THRESHOLD with a story picked in the last
+# STORY_DEDUP_DAYS calendar days is the same event under a new URL. STORY_DEDUP_MODE:
+# demote (score × STORY_DEDUP_PENALTY, default), drop, or off. Follow-ups that
+# move a story forward typically score 0.3–0.45 against the earlier coverage.
+STORY_DEDUP_MODE      = os.environ.get("STORY_DEDUP_MODE", "demote").lower()
+STORY_DEDUP_DAYS      = 5
+STORY_DEDUP_THRESHOLD = 0.5
+STORY_DEDUP_PENALTY   = 0.5
+
+# Pre-scrape ranking: set PRESCRAPE_RANKING=true to rank candidates on NewsAPI
+# metadata first and scrape only the top MAX_ARTICLES_FOR_CLAUDE + PRESCRAPE_MARGIN.
+PRESCRAPE_RANKING = os.environ.get("PRESCRAPE_RANKING", "false").lower() == "true"
+PRESCRAPE_MARGIN  = 8
+
+# Pre-fetch pool: prefetch.py polls NewsAPI overnight into article_store.py.
+# Set USE_PREFETCH_POOL=true so main.py ranks the pool (articles pooled in the
+# last PREFETCH_POOL_HOURS) instead of fetching; an empty pool falls back to
+# a live fetch.
+USE_PREFETCH_POOL            = os.environ.get("USE_PREFETCH_POOL", "false").lower() == "true"
+PREFETCH_INTERVAL_MINUTES    = 60
+PREFETCH_POOL_HOURS          = 18
+ARTICLE_STORE_RETENTION_DAYS = 180   # unselected articles; selected ones are kept
+
+# ── Summarizer ────────────────────────────────
+# SUMMARIZER_MODE: batch (one blocking call, default), stream or tool. In stream
+# mode the reply is checked as it arrives; one that stops being valid digest JSON
+# is abandoned and requested again, up to SUMMARIZER_STREAM_RETRIES times, and
+# the last attempt falls through to the usual JSON repair call. In tool mode the
+# digest is the input of a schema-checked tool call and is never repaired.
+SUMMARIZER_MODE           = os.environ.get("SUMMARIZER_MODE", "batch").lower()
+SUMMARIZER_MODEL          = "claude-sonnet-4-6"
+SUMMARIZER_STREAM_RETRIES = 1
+
+# ES-first: set SUMMARIZER_TRANSLATE=true to have SUMMARIZER_MODEL write only the
+# Spanish edition. The email goes out from it while the English edition is
+# translated in the background, one TRANSLATION_MODEL call per section (editor
+# note, narrative thread, each story), at most TRANSLATION_MAX_WORKERS at once.
+SUMMARIZER_TRANSLATE    = os.environ.get("SUMMARIZER_TRANSLATE", "false").lower() == "true"
+TRANSLATION_MODEL       = "claude-haiku-4-5"
+TRANSLATION_MAX_WORKERS = 8
+
+# Token budget (token_budget.py): the article text in the summarizer prompt is
+# held to SUMMARIZER_ARTICLE_TOKENS (local estimate). Each article keeps up to
+# ARTICLE_MIN_TOKENS; the rest is shared by scorer score and content is cut at
+# sentence boundaries. 12 articles at MAX_ARTICLE_CHARS come to ~9k tokens, so
+# the default only bites when MAX_ARTICLES_FOR_CLAUDE is raised. 0 disables.
+SUMMARIZER_ARTICLE_TOKENS = int(os.environ.get("SUMMARIZER_ARTICLE_TOKENS", "12000"))
+ARTICLE_MIN_TOKENS        = 150
+
 # ── Market tickers (Yahoo Finance symbols) ────
 # Main ticker bar: global macro conditions
 TICKER_SYMBOLS = [
@@ -0,0 +1,221 @@
+# ─────────────────────────────────────────────
+#  domain_health.py  —  Per-domain scrape health + circuit breaker
+#
+#  Every scrape attempt is recorded per outlet: latency, and an
+#  outcome of ok | short (under 100 chars: paywall/stub) | timeout |
+#  http_error | error. The last DOMAIN_HEALTH_WINDOW attempts per
+#  domain persist across runs.
+#
+#  scraper.py uses the history two ways:
+#    scrape_timeout()  — domains that answer quickly, or that mostly
+#                        time out anyway, get a shorter timeout than
+#                        the flat SCRAPE_TIMEOUT
+#    is_tripped()      — domains failing nearly every attempt are
+#                        skipped (the fetcher falls back to the NewsAPI
+#                        description) until BREAKER_COOLDOWN_HOURS pass
+#                        without an attempt; the next scrape is a probe
+#
+#  Report (run from bot/):
+#    python domain_health.py
+#
+#  Default DB path: data/domain_health.db (repo root).
+#  Override with DOMAIN_HEALTH_DB, or pass db_path for tests.
+# ─────────────────────────────────────────────
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from config import (
+    SCRAPE_TIMEOUT, SCRAPE_TIMEOUT_FLOOR, DOMAIN_HEALTH_WINDOW,
+    BREAKER_WINDOW, BREAKER_MIN_SAMPLES, BREAKER_FAILURE_RATE, BREAKER_COOLDOWN_HOURS,
+)
+
+_DEFAULT_DB = os.path.join(
+    os.path.dirname(__file__), "..", "data", "domain_health.db"
+)
+
+OUTCOMES = ("ok", "short", "timeout", "http_error", "error")
+
+_lock = threading.Lock()
+_history: Optional[Dict[str, List[tuple]]] = None   # domain -> [(ts, latency, outcome, chars)]
+_pending: List[tuple] = []                          # (domain, ts, latency, outcome, chars)
+
+
+def _resolve_path(db_path: Optional[str]) -> str:
+    path = (db_path or "").strip() or os.environ.get("DOMAIN_HEALTH_DB", _DEFAULT_DB)
+    parent = os.path.dirname(os.path.abspath(path))
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    return path
+
+
+def _connect(db_path: Optional[str]) -> sqlite3.Connection:
+    conn = sqlite3.connect(_resolve_path(db_path), timeout=10)
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS scrape_events (
+        id       INTEGER PRIMARY KEY AUTOINCREMENT,
+        domain   TEXT    NOT NULL,
+        ts       REAL    NOT NULL,
+        latency  REAL    NOT NULL,
+        outcome  TEXT    NOT NULL,
+        chars    INTEGER NOT NULL DEFAULT 0
+    )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_scrape_events_domain ON scrape_events (domain, ts)")
+    return conn
+
+
+def _load(db_path: Optional[str] = None) -> Dict[str, List[tuple]]:
+    """Recent history per domain, read from disk once per process. Call with _lock held."""
+    global _history
+    if _history is None:
+        _history = {}
+        try:
+            with _connect(db_path) as conn:
+                rows = conn.execute(
+                    "SELECT domain, ts, latency, outcome, chars FROM scrape_events ORDER BY ts"
+                ).fetchall()
+        except sqlite3.Error as e:
+            print(f"  [domain_health] Could not read history (non-fatal): {e}")
+            rows = []
+        for domain, ts, latency, outcome, chars in rows:
+            _history.setdefault(domain, []).append((ts, latency, outcome, chars))
+        for events in _history.values():
+            del events[:-DOMAIN_HEALTH_WINDOW]
+    return _history
+
+
+def record(domain: str, latency: float, outcome: str, chars: int = 0) -> None:
+    """Record one scrape attempt. Visible to is_tripped() immediately; persisted on flush()."""
+    now = time.time()
+    with _lock:
+        events = _load().setdefault(domain, [])
+        events.append((now, latency, outcome, chars))
+        del events[:-DOMAIN_HEALTH_WINDOW]
+        _pending.append((domain, now, latency, outcome, chars))
+
+
+def flush(db_path: Optional[str] = None) -> None:
+    """Write pending attempts to disk and prune each domain to its last DOMAIN_HEALTH_WINDOW rows."""
+    with _lock:
+        batch = list(_pending)
+        _pending.clear()
+    if not batch:
+        return
+    try:
+        with _connect(db_path) as conn:
+            conn.executemany(
+                "INSERT INTO scrape_events (domain, ts, latency, outcome, chars) VALUES (?,?,?,?,?)",
+                batch,
+            )
+            for domain in {row[0] for row in batch}:
+                conn.execute(
+                    """
+                    DELETE FROM scrape_events WHERE domain = ? AND id NOT IN (
+                        SELECT id FROM scrape_events WHERE domain = ? ORDER BY ts DESC LIMIT ?
+                    )
+                    """,
+                    (domain, domain, DOMAIN_HEALTH_WINDOW),
+                )
+    except sqlite3.Error as e:
+        print(f"  [domain_health] Could not save history (non-fatal): {e}")
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[k]
+
+
+def scrape_timeout(domain: str) -> float:
+    """
+    Per-domain scrape timeout in seconds.
+
+    1.5x the domain's p95 successful latency, clamped to
+    [SCRAPE_TIMEOUT_FLOOR, SCRAPE_TIMEOUT]. A domain that times out on
+    30%+ of attempts gets the floor: waiting the full SCRAPE_TIMEOUT
+    rarely pays off there. SCRAPE_TIMEOUT until there are
+    BREAKER_MIN_SAMPLES attempts to go on.
+    """
+    with _lock:
+        events = list(_load().get(domain, []))
+    if len(events) < BREAKER_MIN_SAMPLES:
+        return SCRAPE_TIMEOUT
+    timeouts = sum(1 for e in events if e[2] == "timeout")
+    if timeouts / len(events) >= 0.3:
+        return SCRAPE_TIMEOUT_FLOOR
+    ok_latencies = [e[1] for e in events if e[2] in ("ok", "short")]
+    if len(ok_latencies) < BREAKER_MIN_SAMPLES:
+        return SCRAPE_TIMEOUT
+    return max(SCRAPE_TIMEOUT_FLOOR, min(SCRAPE_TIMEOUT, _percentile(ok_latencies, 95) * 1.5))
+
+
+def is_tripped(domain: str) -> bool:
+    """
+    True when scraping this domain should be skipped: of its last
+    BREAKER_WINDOW attempts, at least BREAKER_MIN_SAMPLES were made and
+    BREAKER_FAILURE_RATE or more of them failed (anything but ok), and the last attempt was within
+    BREAKER_COOLDOWN_HOURS. Once the cooldown lapses one probe goes
+    through; its result re-arms or resets the breaker.
+    """
+    with _lock:
+        events = list(_load().get(domain, []))[-BREAKER_WINDOW:]
+    if len(events) < BREAKER_MIN_SAMPLES:
+        return False
+    failures = sum(1 for e in events if e[2] != "ok")
+    if failures / len(events) < BREAKER_FAILURE_RATE:
+        return False
+    return time.time() - events[-1][0] < BREAKER_COOLDOWN_HOURS * 3600
+
+
+def build_report() -> List[Dict]:
+    """One row per domain with outcome rates and latency percentiles, worst first."""
+    with _lock:
+        history = {d: list(e) for d, e in _load().items()}
+    rows = []
+    for domain, events in history.items():
+        n = len(events)
+        latencies = [e[1] for e in events]
+        rates = {o: sum(1 for e in events if e[2] == o) / n for o in OUTCOMES}
+        rows.append({
+            "domain":  domain,
+            "samples": n,
+            **{f"{o}_rate": r for o, r in rates.items()},
+            "p50":     _percentile(latencies, 50),
+            "p90":     _percentile(latencies, 90),
+            "timeout": scrape_timeout(domain),
+            "tripped": is_tripped(domain),
+        })
+    rows.sort(key=lambda r: (r["ok_rate"], -r["p90"]))
+    return rows
+
+
+def format_report(rows: List[Dict]) -> str:
+    lines = [
+        f"{'domain':<26} {'n':>4} {'ok':>5} {'short':>6} {'tmout':>6} {'http':>5} {'err':>5} "
+        f"{'p50':>6} {'p90':>6} {'tmo':>5}  status",
+    ]
+    for r in rows:
+        status = "TRIPPED" if r["tripped"] else ""
+        if r["samples"] >= BREAKER_MIN_SAMPLES and r["ok_rate"] < 1 - BREAKER_FAILURE_RATE:
+            status = (status + " blocklist?").strip()
+        lines.append(
+            f"{r['domain']:<26} {r['samples']:>4} {r['ok_rate']:>5.0%} {r['short_rate']:>6.0%} "
+            f"{r['timeout_rate']:>6.0%} {r['http_error_rate']:>5.0%} {r['error_rate']:>5.0%} "
+            f"{r['p50']:>5.1f}s {r['p90']:>5.1f}s {r['timeout']:>4.1f}s  {status}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    rows = build_report()
+    if not rows:
+        print("No scrape history yet.")
+    else:
+        print(format_report(rows))
@@ -0,0 +1,138 @@
+# ─────────────────────────────────────────────
+#  fetch_metrics.py  —  Fetch-stage instrumentation
+#
+#  fetcher.py and scraper.py record one event per NewsAPI query, per
+#  scrape and per topic selection:
+#    newsapi  topic, language, seconds, bytes, status, results
+#    scrape   url, domain, seconds, bytes, status, outcome, chars,
+#             cache (hit | revalidate | miss)
+#    select   topic, accepted, rejected {seen_url | removed | blocklist |
+#             source_cap | empty_content: n}
+#
+#  At the end of [2/5] main.py calls report(). It appends the run's events
+#  to a JSONL log (one line per event, tagged with the run id) and prints
+#  per-topic and per-domain summary tables, which show where fetch time
+#  goes and what each topic and outlet yields.
+#
+#  Default log path: data/fetch_metrics.jsonl (repo root).
+#  Override with FETCH_METRICS_LOG.
+# ─────────────────────────────────────────────
+
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+_DEFAULT_LOG = os.path.join(
+    os.path.dirname(__file__), "..", "data", "fetch_metrics.jsonl"
+)
+
+REJECT_REASONS = ("seen_url", "removed", "blocklist", "source_cap", "empty_content")
+
+_lock = threading.Lock()
+_events: List[Dict] = []
+
+
+def record(kind: str, **fields) -> None:
+    """Add one event to the current run. Thread-safe."""
+    with _lock:
+        _events.append({"kind": kind, "ts": time.time(), **fields})
+
+
+def snapshot() -> List[Dict]:
+    with _lock:
+        return list(_events)
+
+
+def reset() -> None:
+    with _lock:
+        _events.clear()
+
+
+def write_run_log(events: List[Dict], path: Optional[str] = None) -> str:
+    """Append events to the JSONL log, one line each, under a fresh run id. Returns the path."""
+    path = (path or "").strip() or os.environ.get("FETCH_METRICS_LOG", _DEFAULT_LOG)
+    parent = os.path.dirname(os.path.abspath(path))
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    with open(path, "a", encoding="utf-8") as f:
+        for event in events:
+            f.write(json.dumps({"run": run_id, **event}, ensure_ascii=False) + "\n")
+    return path
+
+
+def summarize(events: List[Dict]) -> tuple[List[Dict], List[Dict]]:
+    """Per-topic and per-domain rows, most expensive first."""
+    topics: Dict[str, Dict] = {}
+    for e in events:
+        if e["kind"] not in ("newsapi", "select"):
+            continue
+        row = topics.setdefault(e["topic"], {
+            "topic": e["topic"], "seconds": 0.0, "bytes": 0, "results": 0,
+            "accepted": 0, **{r: 0 for r in REJECT_REASONS},
+        })
+        if e["kind"] == "newsapi":
+            row["seconds"] += e["seconds"]
+            row["bytes"]   += e["bytes"]
+            row["results"] += e["results"]
+        else:
+            row["accepted"] += e["accepted"]
+            for reason, n in e["rejected"].items():
+                row[reason] = row.get(reason, 0) + n
+
+    domains: Dict[str, Dict] = {}
+    for e in events:
+        if e["kind"] != "scrape":
+            continue
+        row = domains.setdefault(e["domain"], {
+            "domain": e["domain"], "scrapes": 0, "cached": 0, "ok": 0,
+            "seconds": 0.0, "bytes": 0, "chars": 0,
+        })
+        row["scrapes"] += 1
+        row["cached"]  += e["cache"] == "hit"
+        row["ok"]      += e["outcome"] == "ok"
+        row["seconds"] += e["seconds"]
+        row["bytes"]   += e["bytes"]
+        row["chars"]   += e["chars"]
+
+    by_cost = lambda r: -r["seconds"]
+    return sorted(topics.values(), key=by_cost), sorted(domains.values(), key=by_cost)
+
+
+def format_summary(events: List[Dict]) -> str:
+    topic_rows, domain_rows = summarize(events)
+    lines = [
+        f"  {'topic':<22} {'time':>6} {'KB':>6} {'hits':>5} {'kept':>5} "
+        f"{'seen':>5} {'rmvd':>5} {'block':>5} {'cap':>5} {'empty':>5}",
+    ]
+    for r in topic_rows:
+        lines.append(
+            f"  {r['topic'][:22]:<22} {r['seconds']:>5.1f}s {r['bytes'] / 1024:>6.0f} {r['results']:>5} "
+            f"{r['accepted']:>5} {r['seen_url']:>5} {r['removed']:>5} {r['blocklist']:>5} "
+            f"{r['source_cap']:>5} {r['empty_content']:>5}"
+        )
+    lines.append("")
+    lines.append(f"  {'domain':<26} {'n':>4} {'cache':>5} {'ok':>4} {'time':>7} {'KB':>7} {'chars':>7}")
+    for r in domain_rows:
+        lines.append(
+            f"  {r['domain'][:26]:<26} {r['scrapes']:>4} {r['cached']:>5} {r['ok']:>4} "
+            f"{r['seconds']:>6.1f}s {r['bytes'] / 1024:>7.0f} {r['chars']:>7}"
+        )
+    return "\n".join(lines)
+
+
+def report(path: Optional[str] = None) -> None:
+    """Write the run's events to the JSONL log, print the summary tables, and start a new run."""
+    events = snapshot()
+    reset()
+    if not events:
+        return
+    print(format_summary(events))
+    try:
+        written = write_run_log(events, path)
+        print(f"  [metrics] {len(events)} fetch events appended to {written}")
+    except OSError as e:
+        print(f"  [metrics] Could not write run log (non-fatal): {e}")
@@ -2,59 +2,192 @@
 #  fetcher.py  —  News articles from NewsAPI
 # ─────────────────────────────────────────────
 
-import requests
-from urllib.parse import urlparse
-from scraper import scrape_article
+import asyncio
+import re
+import time
+import unicodedata
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlparse
+from scraper import scrape_articles, scrape_articles_async
+from scorer import rank_articles
+from fingerprint import collapse_near_duplicates
+import fetch_metrics
 from config import (
-    NEWS_API_KEY, TOPICS, LANGUAGE, TOPICS_EN, LANGUAGE_EN,
+    NEWS_API_KEY, LANGUAGE_BATCHES,
     MAX_ARTICLES_PER_TOPIC, MAX_ARTICLE_CHARS,
     MAX_ARTICLES_PER_SOURCE, NEWS_DOMAINS_STR, NEWS_DOMAIN_BLOCKLIST,
+    FETCH_ASYNC_MAX_IN_FLIGHT, MAX_ARTICLES_FOR_CLAUDE,
+    PRESCRAPE_RANKING, PRESCRAPE_MARGIN,
+    COALESCE_QUERIES, COALESCE_MAX_TOPICS, COALESCED_PAGE_SIZE, NEWSAPI_MAX_QUERY_CHARS,
 )
+from utils import http
 
 
-def _fetch_topic_batch(
-    topics: list[str],
-    language: str,
-    seen_urls: set[str],
-) -> list[dict]:
-    """Fetch articles for a list of topics in a given language. Mutates seen_urls."""
-    articles = []
+def _topic_url(topic: str, language: str, page_size: int = MAX_ARTICLES_PER_TOPIC) -> str:
+    return (
+        f"https://newsapi.org/v2/everything"
+        f"?q={topic}&language={language}"
+        f"&sortBy=publishedAt&pageSize={page_size}"
+        f"&domains={NEWS_DOMAINS_STR}"
+        f"&apiKey={NEWS_API_KEY}"
+    )
+
+
+def _query_topic(topic: str, language: str, page_size: int = MAX_ARTICLES_PER_TOPIC) -> list[dict]:
+    """Raw NewsAPI results for one topic (or OR query). Returns [] on any request error."""
+    print(f"  [fetcher] Topic ({language}): {topic}")
+    start, status, size, articles = time.monotonic(), None, 0, []
+    try:
+        response = http.get(_topic_url(topic, language, page_size), timeout=10)
+        status, size = response.status_code, len(response.content)
+        articles = response.json().get("articles", [])
+    except Exception as e:
+        print(f"  [fetcher] Error: {e}")
+    fetch_metrics.record(
+        "newsapi", topic=topic, language=language, seconds=time.monotonic() - start,
+        bytes=size, status=status, results=len(articles),
+    )
+    return articles
+
+
+# ── Query coalescing ──────────────────────────
+#
+# With COALESCE_QUERIES on, a language's topics go out as a few OR
+# queries instead of one request each. Each merged query asks for a full
+# page, and its results are matched back to topics locally: a topic keeps
+# the newest MAX_ARTICLES_PER_TOPIC results that mention it. A topic with
+# fewer local matches than that falls back to its own query. Source caps
+# and selection are unchanged because the per-topic result lists keep
+# their shape.
+#
+# Caveat: this approximates the per-topic queries, it is not identical to
+# them. NewsAPI matches against the full article body, but _mentions only
+# sees the truncated title/description/content fields. An article that
+# matched a topic on its body alone and is newer than the topic's local
+# matches is missed. That is why COALESCE_QUERIES defaults to off.
+
+def _normalize(text: str) -> str:
+    """Lowercase and strip accents, so "economía" matches "economia"."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _or_clause(topic: str) -> str:
+    return f"({topic})" if " " in topic else topic
+
+
+def _or_query(group: list[str]) -> str:
+    return group[0] if len(group) == 1 else " OR ".join(_or_clause(t) for t in group)
+
+
+def _plan_queries(topics: list[str]) -> list[list[str]]:
+    """Group topics, in order, into OR queries that fit NewsAPI's length limit."""
+    if not COALESCE_QUERIES:
+        return [[t] for t in topics]
+    groups: list[list[str]] = []
     for topic in topics:
-        print(f"  [fetcher] Topic ({language}): {topic}")
-        url = (
-            f"https://newsapi.org/v2/everything"
-            f"?q={topic}&language={language}"
-            f"&sortBy=publishedAt&pageSize={MAX_ARTICLES_PER_TOPIC}"
-            f"&domains={NEWS_DOMAINS_STR}"
-            f"&apiKey={NEWS_API_KEY}"
-        )
-        try:
-            data = requests.get(url, timeout=10).json()
-        except Exception as e:
-            print(f"  [fetcher] Error: {e}")
+        if groups and len(groups[-1]) < COALESCE_MAX_TOPICS:
+            candidate = groups[-1] + [topic]
+            if len(quote(_or_query(candidate))) <= NEWSAPI_MAX_QUERY_CHARS:
+                groups[-1] = candidate
+                continue
+        groups.append([topic])
+    return groups
+
+
+def _mentions(topic: str, article: dict) -> bool:
+    """True if every word of topic appears as a whole word in the article's NewsAPI fields."""
+    text = _normalize(" ".join(article.get(k) or "" for k in ("title", "description", "content")))
+    return all(re.search(rf"\b{re.escape(w)}\b", text) for w in _normalize(topic).split())
+
+
+def _fan_out(group: list[str], raw: list[dict]) -> tuple[dict[str, list[dict]], list[str]]:
+    """Split a merged query's results per topic. Returns (results by topic, topics to re-query)."""
+    by_topic: dict[str, list[dict]] = {}
+    starved:  list[str] = []
+    for topic in group:
+        matched = [a for a in raw if _mentions(topic, a)][:MAX_ARTICLES_PER_TOPIC]
+        if len(matched) < MAX_ARTICLES_PER_TOPIC:
+            starved.append(topic)
+        else:
+            by_topic[topic] = matched
+    return by_topic, starved
+
+
+def _query_topics(topics: list[str], language: str) -> list[tuple[str, list[dict]]]:
+    """(topic, raw NewsAPI results) for each topic, in order, coalescing queries when enabled."""
+    by_topic: dict[str, list[dict]] = {}
+    for group in _plan_queries(topics):
+        if len(group) == 1:
+            by_topic[group[0]] = _query_topic(group[0], language)
             continue
+        fanned, starved = _fan_out(group, _query_topic(_or_query(group), language, COALESCED_PAGE_SIZE))
+        by_topic.update(fanned)
+        for topic in starved:
+            by_topic[topic] = _query_topic(topic, language)
+    return [(t, by_topic[t]) for t in topics]
+
+
+def _select_articles(
+    results: list[tuple[str, list[dict]]],
+    seen_urls: set[str],
+    scraped: dict[str, str | None],
+) -> tuple[list[dict], list[str], list[tuple[str, dict[str, int], dict[str, int]]]]:
+    """
+    Replay the per-topic selection loop over already-fetched NewsAPI results.
+
+    Applies, in topic order: seen-URL dedup, [Removed] and blocklist filters,
+    the per-topic source cap, and the scrape-or-description content fallback.
+    `scraped` holds the scrape result for every URL scraped so far; a URL not
+    in it is assumed to yield content and is returned in `pending` so the
+    caller can scrape it and replay. Once `pending` is empty the articles
+    match what the old one-URL-at-a-time loop produced, whatever order the
+    scrapes finished in. Mutates seen_urls.
+
+    Returns (articles, pending, per-topic counts). Each count entry is
+    (topic, articles per source, rejections per fetch_metrics reason).
+    """
+    articles: list[dict] = []
+    pending:  list[str]  = []
+    counts:   list[tuple[str, dict[str, int], dict[str, int]]] = []
 
+    for topic, raw_articles in results:
         topic_source_count: dict[str, int] = {}
+        rejected: dict[str, int] = {}
 
-        for a in data.get("articles", []):
+        def _reject(reason: str) -> None:
+            rejected[reason] = rejected.get(reason, 0) + 1
+
+        for a in raw_articles:
             article_url = a.get("url", "")
             if not article_url or article_url in seen_urls:
+                _reject("seen_url")
                 continue
             if "[Removed]" in a.get("title", ""):
+                _reject("removed")
                 continue
             article_domain = urlparse(article_url).netloc.lower().removeprefix("www.")
             if article_domain in NEWS_DOMAIN_BLOCKLIST:
+                _reject("blocklist")
                 continue
 
             source_name = a.get("source", {}).get("name", "Unknown")
             if topic_source_count.get(source_name, 0) >= MAX_ARTICLES_PER_SOURCE:
+                _reject("source_cap")
                 continue
 
             seen_urls.add(article_url)
 
-            full_text = scrape_article(article_url, max_chars=MAX_ARTICLE_CHARS)
+            if article_url not in scraped:
+                pending.append(article_url)
+                topic_source_count[source_name] = topic_source_count.get(source_name, 0) + 1
+                continue
+
+            full_text = scraped[article_url]
             content   = full_text if full_text else a.get("description", "")
             if not content:
+                _reject("empty_content")
                 continue
 
             topic_source_count[source_name] = topic_source_count.get(source_name, 0) + 1
@@ -66,18 +199,262 @@ def _fetch_topic_batch(
                 "publishedAt": a.get("publishedAt", ""),
             })
 
+        counts.append((topic, topic_source_count, rejected))
+
+    return articles, pending, counts
+
+
+def _query_batches(batches: list[tuple[list[str], str]]) -> list[list[tuple[str, list[dict]]]]:
+    """_query_topics for every language batch, concurrently. Results come back in batch order."""
+    with ThreadPoolExecutor(max_workers=max(1, len(batches))) as pool:
+        return list(pool.map(lambda batch: _query_topics(*batch), batches))
+
+
+# Scrape in waves: each replay surfaces the URLs the serial loop would have
+# scraped, assuming pending scrapes succeed. A failed scrape with no
+# description frees its source slot, so the next replay may queue one more.
+# Both engines run the same loop: _replay_wave, scrape the pending URLs,
+# repeat until none are pending, then _finish_waves. Only the scrape call
+# differs (thread pool or event loop).
+
+def _replay_wave(
+    results: list[list[tuple[str, list[dict]]]],
+    seen_urls: set[str],
+    scraped: dict[str, str | None],
+) -> tuple[list[tuple], set[str], list[str]]:
+    """
+    Replay selection for every language batch against the scrapes so far.
+    Returns (selections, URLs selected, URLs still to scrape).
+
+    Selection replays the batches in order against one seen-URL set, so a
+    URL found in several batches always goes to the earliest, the same as
+    fetching the batches one after another.
+    """
+    selected_urls = set(seen_urls)
+    selections = [_select_articles(r, selected_urls, scraped) for r in results]
+    pending = [url for _, batch_pending, _ in selections for url in batch_pending]
+    return selections, selected_urls, pending
+
+
+def _finish_waves(selections: list[tuple], selected_urls: set[str], seen_urls: set[str]) -> list[list[dict]]:
+    """Report the final selection and return articles per batch. Mutates seen_urls."""
+    seen_urls.update(selected_urls)
+    for _, _, counts in selections:
+        _report_topic_counts(counts)
+    return [articles for articles, _, _ in selections]
+
+
+def _fetch_batches(
+    results: list[list[tuple[str, list[dict]]]],
+    seen_urls: set[str],
+) -> list[list[dict]]:
+    """
+    Select and scrape every language batch together. Returns articles per
+    batch. Mutates seen_urls.
+    """
+    scraped: dict[str, str | None] = {}
+    while True:
+        selections, selected_urls, pending = _replay_wave(results, seen_urls, scraped)
+        if not pending:
+            return _finish_waves(selections, selected_urls, seen_urls)
+        scraped.update(scrape_articles(pending, max_chars=MAX_ARTICLE_CHARS))
+
+
+def _report_topic_counts(counts: list[tuple[str, dict[str, int], dict[str, int]]]) -> None:
+    """Print each topic's final selection and record it in fetch_metrics."""
+    for topic, topic_source_count, rejected in counts:
         topic_sources = list(topic_source_count.keys())
-        print(f"  [fetcher] '{topic}': {sum(topic_source_count.values())} articles from {len(topic_sources)} sources: {topic_sources}")
+        accepted      = sum(topic_source_count.values())
+        print(f"  [fetcher] '{topic}': {accepted} articles from {len(topic_sources)} sources: {topic_sources}")
+        fetch_metrics.record("select", topic=topic, accepted=accepted, rejected=rejected)
 
-    return articles
+
+# ── Pre-scrape ranking ────────────────────────
+#
+# With PRESCRAPE_RANKING on, candidates are first ranked on NewsAPI
+# metadata alone (title + description stand in for the body) and only
+# the top MAX_ARTICLES_FOR_CLAUDE + PRESCRAPE_MARGIN get scraped. The
+# full-content re-rank in main.run then picks the final set from those.
+
+def _prescrape_candidates(
+    results: list[list[tuple[str, list[dict]]]],
+    seen_urls: set[str],
+) -> tuple[list[list[dict]], list[str]]:
+    """
+    Select candidates per batch without scraping and shortlist the URLs worth
+    scraping. Every candidate is assumed to have content, as in the first
+    scrape wave: the description (or title) stands in for the body while
+    ranking, and a candidate with neither is kept on a blank stand-in, so
+    it is judged on its scraped text in _prescrape_finish rather than
+    rejected as empty. Mutates seen_urls.
+
+    Returns (candidates per batch, shortlisted URLs).
+    """
+    stand_in = {
+        a["url"]: a.get("description") or a.get("title") or " "
+        for batch in results for _, raw_articles in batch for a in raw_articles if a.get("url")
+    }
+    candidates = []
+    for batch in results:
+        articles, _, counts = _select_articles(batch, seen_urls, stand_in)
+        _report_topic_counts(counts)
+        candidates.append(articles)
+
+    pool      = [a for batch in candidates for a in batch]
+    shortlist = rank_articles(pool, limit=MAX_ARTICLES_FOR_CLAUDE + PRESCRAPE_MARGIN)
+    print(f"  [fetcher] Pre-scrape ranking: scraping {len(shortlist)} of {len(pool)} candidates")
+    return candidates, [a["url"] for a in shortlist]
+
+
+def _prescrape_finish(
+    results: list[list[tuple[str, list[dict]]]],
+    candidates: list[list[dict]],
+    scraped: dict[str, str | None],
+) -> list[list[dict]]:
+    """Keep the shortlisted candidates, in fetch order, with their scraped content."""
+    descriptions = {
+        a["url"]: a.get("description", "")
+        for batch in results for _, raw_articles in batch for a in raw_articles if a.get("url")
+    }
+    finished = []
+    for batch in candidates:
+        kept = []
+        for a in batch:
+            if a["url"] not in scraped:
+                continue
+            content = scraped[a["url"]] or descriptions.get(a["url"], "")
+            if content:
+                kept.append({**a, "content": content})
+        finished.append(kept)
+    return finished
+
+
+def _collapse_duplicates(articles: list[dict], language: str) -> list[dict]:
+    kept = collapse_near_duplicates(articles)
+    if len(kept) < len(articles):
+        print(f"  [fetcher] Collapsed {len(articles) - len(kept)} near-duplicate {language} article(s)")
+    return kept
+
+
+def _merge_batches(
+    batch_articles: list[list[dict]],
+    batches: list[tuple[list[str], str]],
+    label: str = "",
+) -> list[dict]:
+    """Collapse near-duplicates within each language batch and concatenate in batch order."""
+    languages = [language for _, language in batches]
+    collapsed = [_collapse_duplicates(a, lang) for a, lang in zip(batch_articles, languages)]
+    all_articles = [a for batch in collapsed for a in batch]
+    per_language = " + ".join(f"{len(b)} {lang.upper()}" for b, lang in zip(collapsed, languages))
+    print(f"  [fetcher] {per_language} = {len(all_articles)} articles collected total{label}")
+    return all_articles
 
 
 def fetch_news(prior_urls: set[str] | None = None) -> list[dict]:
+    """
+    Fetch every LANGUAGE_BATCHES batch. NewsAPI queries for all batches run
+    concurrently and scrapes share one pool. The result is the same as
+    fetching the batches one after another, earlier batches first.
+    """
     seen_urls = set(prior_urls) if prior_urls else set()
+    results   = _query_batches(LANGUAGE_BATCHES)
 
-    es_articles = _fetch_topic_batch(TOPICS, LANGUAGE, seen_urls)
-    en_articles = _fetch_topic_batch(TOPICS_EN, LANGUAGE_EN, seen_urls)
-    all_articles = es_articles + en_articles
+    if PRESCRAPE_RANKING:
+        candidates, shortlist = _prescrape_candidates(results, seen_urls)
+        scraped = scrape_articles(shortlist, max_chars=MAX_ARTICLE_CHARS)
+        batch_articles = _prescrape_finish(results, candidates, scraped)
+    else:
+        batch_articles = _fetch_batches(results, seen_urls)
+    return _merge_batches(batch_articles, LANGUAGE_BATCHES)
 
-    print(f"  [fetcher] {len(es_articles)} ES + {len(en_articles)} EN = {len(all_articles)} articles collected total")
-    return all_articles
+
+# ── Async engine ──────────────────────────────
+
+def _async_client() -> httpx.AsyncClient:
+    return http.async_client(max_connections=FETCH_ASYNC_MAX_IN_FLIGHT)
+
+
+async def _query_topic_async(
+    client: httpx.AsyncClient, topic: str, language: str, page_size: int = MAX_ARTICLES_PER_TOPIC,
+) -> list[dict]:
+    """Async counterpart of _query_topic."""
+    start, status, size, articles = time.monotonic(), None, 0, []
+    try:
+        response = await client.get(_topic_url(topic, language, page_size))
+        status, size = response.status_code, len(response.content)
+        articles = response.json().get("articles", [])
+    except Exception as e:
+        print(f"  [fetcher] Error ({language}: {topic}): {e}")
+    fetch_metrics.record(
+        "newsapi", topic=topic, language=language, seconds=time.monotonic() - start,
+        bytes=size, status=status, results=len(articles),
+    )
+    return articles
+
+
+async def _query_batches_async(
+    client: httpx.AsyncClient,
+    batches: list[tuple[list[str], str]],
+) -> list[list[tuple[str, list[dict]]]]:
+    """_query_topics for every batch at once: all planned queries, then any starved-topic re-queries."""
+    plans = [(language, group) for topics, language in batches for group in _plan_queries(topics)]
+    for language, group in plans:
+        print(f"  [fetcher] Topic ({language}): {_or_query(group)}")
+    raw = await asyncio.gather(*(
+        _query_topic_async(client, _or_query(group), language,
+                           COALESCED_PAGE_SIZE if len(group) > 1 else MAX_ARTICLES_PER_TOPIC)
+        for language, group in plans
+    ))
+
+    by_topic: dict[tuple[str, str], list[dict]] = {}
+    retry:    list[tuple[str, str]] = []
+    for (language, group), articles in zip(plans, raw):
+        if len(group) == 1:
+            by_topic[(language, group[0])] = articles
+            continue
+        fanned, starved = _fan_out(group, articles)
+        by_topic.update({(language, t): a for t, a in fanned.items()})
+        retry.extend((language, t) for t in starved)
+
+    for language, topic in retry:
+        print(f"  [fetcher] Topic ({language}): {topic}")
+    requeried = await asyncio.gather(*(_query_topic_async(client, t, lang) for lang, t in retry))
+    by_topic.update(zip(retry, requeried))
+
+    return [[(t, by_topic[(language, t)]) for t in topics] for topics, language in batches]
+
+
+async def _fetch_batches_async(
+    client: httpx.AsyncClient,
+    results: list[list[tuple[str, list[dict]]]],
+    seen_urls: set[str],
+) -> list[list[dict]]:
+    """_fetch_batches with the scrape waves on the event loop."""
+    scraped: dict[str, str | None] = {}
+    while True:
+        selections, selected_urls, pending = _replay_wave(results, seen_urls, scraped)
+        if not pending:
+            return _finish_waves(selections, selected_urls, seen_urls)
+        scraped.update(await scrape_articles_async(client, pending, max_chars=MAX_ARTICLE_CHARS))
+
+
+async def fetch_news_async(prior_urls: set[str] | None = None) -> list[dict]:
+    """
+    fetch_news on a single event loop: every NewsAPI query in every language
+    goes out at once, then article scrapes run in waves on the same client.
+    Selection is replayed in batch order exactly as fetch_news does, so the
+    returned list is identical.
+    """
+    seen_urls = set(prior_urls) if prior_urls else set()
+
+    async with _async_client() as client:
+        results = await _query_batches_async(client, LANGUAGE_BATCHES)
+
+        if PRESCRAPE_RANKING:
+            candidates, shortlist = _prescrape_candidates(results, seen_urls)
+            scraped = await scrape_articles_async(client, shortlist, max_chars=MAX_ARTICLE_CHARS)
+            batch_articles = _prescrape_finish(results, candidates, scraped)
+        else:
+            batch_articles = await _fetch_batches_async(client, results, seen_urls)
+
+    return _merge_batches(batch_articles, LANGUAGE_BATCHES, label=" (async)")
@@ -0,0 +1,104 @@
+# ─────────────────────────────────────────────
+#  fingerprint.py  —  Near-duplicate article bodies
+#
+#  Syndicated wire copy (Reuters/AP reprinted by infobae, El
+#  Financiero, ...) arrives under different URLs, so URL dedup lets it
+#  through. Each scraped body gets a 64-bit SimHash over word
+#  3-shingles. Bodies within NEAR_DUP_MAX_DISTANCE bits of each other
+#  are the same story, and only the most authoritative copy (per
+#  config.SOURCE_TIERS) is kept.
+#
+#  Candidate pairs are found through a band index. Split the 64 bits
+#  into NEAR_DUP_MAX_DISTANCE + 1 bands; two hashes that differ in at
+#  most that many bits must agree exactly on at least one band
+#  (pigeonhole). No pair within the threshold is missed, and most
+#  bodies are never compared.
+# ─────────────────────────────────────────────
+
+import hashlib
+import re
+
+from config import NEAR_DUP_MAX_DISTANCE, NEAR_DUP_MIN_CHARS
+from scorer import _authority_score
+
+_BITS  = 64
+_WORDS = re.compile(r"\w+", re.UNICODE)
+
+
+def _shingles(text: str, size: int = 3) -> list[str]:
+    words = _WORDS.findall(text.lower())
+    if len(words) < size:
+        return [" ".join(words)] if words else []
+    return [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of text over word 3-shingles. Stable across runs (blake2b, not hash())."""
+    counts = [0] * _BITS
+    for shingle in _shingles(text):
+        h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(_BITS):
+            counts[bit] += 1 if (h >> bit) & 1 else -1
+    return sum(1 << bit for bit in range(_BITS) if counts[bit] > 0)
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def _bands(h: int, n_bands: int) -> list[tuple[int, int]]:
+    """(band index, band value) pairs covering all 64 bits in n_bands contiguous slices."""
+    edges = [round(i * _BITS / n_bands) for i in range(n_bands + 1)]
+    return [
+        (i, (h >> lo) & ((1 << (hi - lo)) - 1))
+        for i, (lo, hi) in enumerate(zip(edges, edges[1:]))
+    ]
+
+
+def collapse_near_duplicates(
+    articles: list[dict],
+    max_distance: int = NEAR_DUP_MAX_DISTANCE,
+) -> list[dict]:
+    """
+    Drop near-duplicate bodies, keeping the highest-authority copy of each.
+
+    Articles with content shorter than NEAR_DUP_MIN_CHARS (typically a
+    NewsAPI description standing in for a failed scrape) are too short to
+    fingerprint reliably and always kept. Within a cluster the copy with
+    the best scorer authority wins; ties go to the earliest fetched. The
+    survivors keep their original order.
+    """
+    n_bands  = max_distance + 1
+    index: dict[tuple[int, int], list[int]] = {}   # band -> cluster ids
+    clusters: list[dict] = []                      # {"hash", "best"}
+    cluster_of: dict[int, int] = {}                # article position -> cluster id
+
+    for pos, article in enumerate(articles):
+        content = article.get("content") or ""
+        if len(content) < NEAR_DUP_MIN_CHARS:
+            continue
+        h = simhash(content)
+        bands = _bands(h, n_bands)
+
+        match = None
+        for band in bands:
+            for cid in index.get(band, []):
+                if hamming(h, clusters[cid]["hash"]) <= max_distance:
+                    match = cid
+                    break
+            if match is not None:
+                break
+
+        if match is None:
+            match = len(clusters)
+            clusters.append({"hash": h, "best": pos})
+            for band in bands:
+                index.setdefault(band, []).append(match)
+        else:
+            best = articles[clusters[match]["best"]]
+            if _authority_score(article.get("source") or "") > _authority_score(best.get("source") or ""):
+                clusters[match]["best"] = pos
+        cluster_of[pos] = match
+
+    keep = {c["best"] for c in clusters}
+    return [a for pos, a in enumerate(articles) if pos not in cluster_of or pos in keep]
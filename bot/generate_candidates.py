@@ -20,7 +20,7 @@ import os
 import pathlib
 from datetime import date
 
-import requests
+from utils import http
 
 from config import DIGEST_DIR
 from image_candidates import generate_image_candidates
@@ -47,7 +47,7 @@ def _send_context_message(
     parts.append("Choose the visual angle that best matches the lead story.")
     text = "\n".join(parts)
     try:
-        resp = requests.post(
+        resp = http.post(
             f"https://api.telegram.org/bot{token}/sendMessage",
             json={"chat_id": chat_id, "text": text},
             timeout=10,
@@ -101,7 +101,7 @@ def _send_candidate_photos(
 
         try:
             with open(path, "rb") as photo_file:
-                resp = requests.post(
+                resp = http.post(
                     f"https://api.telegram.org/bot{token}/sendPhoto",
                     data={
                         "chat_id": chat_id,
@@ -129,7 +129,7 @@ def _send_control_message(token: str, chat_id: str, issue_date: str) -> None:
     }
 
     try:
-        resp = requests.post(
+        resp = http.post(
             f"https://api.telegram.org/bot{token}/sendMessage",
             json={
                 "chat_id":      chat_id,
@@ -0,0 +1,162 @@
+# ─────────────────────────────────────────────
+#  json_stream.py  —  Incremental JSON checker for streamed replies
+#
+#  The summarizer's stream mode feeds Claude's reply here chunk by
+#  chunk. The checker runs the JSON grammar one character at a time
+#  (no buffering of the document) and raises Divergence as soon as the
+#  reply stops being a possible digest:
+#    - a character no JSON grammar state accepts (unescaped newline in
+#      a string, missing comma, stray bracket, bad literal, ...)
+#    - a top-level key other than "es" / "en"
+#  Text before the opening '{' (a preamble, a ``` fence) is skipped, as
+#  clean_and_parse does, and counted in `skipped`; it is not worth a
+#  regeneration.
+#  It also tracks where it is in the document, so the caller can see
+#  when the first es.stories[] object closes (time-to-first-story).
+#  Anything after the closing '}' is ignored, as clean_and_parse does.
+# ─────────────────────────────────────────────
+
+import re
+
+_NUMBER   = re.compile(r"-?(0|[1-9]\d*)(\.\d+)?([eE][+-]?\d+)?$")
+_LITERALS = {"true", "false", "null"}
+_LITERAL_CHARS = set("0123456789+-.eEtruefalsn")
+_TOP_KEYS = {"es", "en"}
+
+
+class Divergence(ValueError):
+    """The streamed text can no longer become a valid digest."""
+
+
+class JsonStreamChecker:
+    """Feed text chunks with feed(); raises Divergence on the first impossible character."""
+
+    def __init__(self):
+        self.state    = "start"   # start, value, key_or_close, key, colon, after_value, done
+        self.frames: list[dict] = []   # open containers: {"type": "{" | "[", "name": key in parent}
+        self.key      = None      # last key read in the innermost object
+        self.stories  = 0         # es.stories[] objects closed so far
+        self.chars    = 0
+        self.skipped  = 0         # non-space characters before the opening '{'
+        self._string  = None      # None, or list of chars of the string being read
+        self._is_key  = False
+        self._escape  = False
+        self._literal = ""
+
+    @property
+    def done(self) -> bool:
+        return self.state == "done"
+
+    def _fail(self, what: str) -> None:
+        raise Divergence(f"{what} at character {self.chars}")
+
+    def feed(self, chunk: str) -> None:
+        for ch in chunk:
+            self.chars += 1
+            if self.state == "done":
+                return
+            self._char(ch)
+
+    # ── grammar ─────────────────────────────────
+
+    def _char(self, ch: str) -> None:
+        if self._string is not None:
+            self._string_char(ch)
+            return
+        if self._literal:
+            if ch in _LITERAL_CHARS:
+                self._literal += ch
+                return
+            self._end_literal()
+        state = self.state
+        if state == "start":
+            if ch == "{":
+                self._open("{")
+            elif not ch.isspace():
+                self.skipped += 1
+        elif ch.isspace():
+            return
+        elif state in ("key_or_close", "key"):
+            if ch == '"':
+                self._string, self._is_key = [], True
+            elif ch == "}" and state == "key_or_close":
+                self._close("{")
+            else:
+                self._fail(f"expected a key, got {ch!r}")
+        elif state == "colon":
+            if ch != ":":
+                self._fail(f"expected ':', got {ch!r}")
+            self.state = "value"
+        elif state == "value":
+            self._value(ch)
+        elif state == "after_value":
+            if ch == ",":
+                self.state = "key" if self.frames[-1]["type"] == "{" else "value"
+            elif ch in "}]":
+                self._close("{" if ch == "}" else "[")
+            else:
+                self._fail(f"expected ',' or a closing bracket, got {ch!r}")
+
+    def _value(self, ch: str) -> None:
+        parent = self.frames[-1]
+        if ch == "]" and parent["type"] == "[" and parent["empty"]:
+            self._close("[")
+            return
+        parent["empty"] = False
+        if ch == "{":
+            self._open("{")
+        elif ch == "[":
+            self._open("[")
+        elif ch == '"':
+            self._string, self._is_key = [], False
+        elif ch in "-0123456789tfn":
+            self._literal = ch
+        else:
+            self._fail(f"expected a value, got {ch!r}")
+
+    def _string_char(self, ch: str) -> None:
+        if self._escape:
+            if ch not in '"\\/bfnrtu':
+                self._fail(f"bad escape \\{ch}")
+            self._escape = False
+        elif ch == "\\":
+            self._escape = True
+        elif ch == '"':
+            text, self._string = "".join(self._string), None
+            if self._is_key:
+                if len(self.frames) == 1 and text not in _TOP_KEYS:
+                    self._fail(f"unexpected top-level key {text!r}")
+                self.key, self.state = text, "colon"
+            else:
+                self.state = "after_value"
+            return
+        elif ch < " ":
+            self._fail("control character inside a string")
+        if self._is_key:
+            self._string.append(ch)
+
+    def _end_literal(self) -> None:
+        literal, self._literal = self._literal, ""
+        if literal not in _LITERALS and not _NUMBER.match(literal):
+            self._fail(f"bad literal {literal!r}")
+        self.state = "after_value"
+
+    def _open(self, kind: str) -> None:
+        name = self.key if self.frames and self.frames[-1]["type"] == "{" else None
+        self.frames.append({"type": kind, "name": name, "empty": True})
+        self.key   = None
+        self.state = "key_or_close" if kind == "{" else "value"
+
+    def _close(self, kind: str) -> None:
+        if not self.frames or self.frames[-1]["type"] != kind:
+            self._fail(f"unbalanced {'}' if kind == '{' else ']'}")
+        self.frames.pop()
+        if kind == "{" and self._in_es_stories():
+            self.stories += 1
+        self.key   = None
+        self.state = "after_value" if self.frames else "done"
+
+    def _in_es_stories(self) -> bool:
+        """True when the innermost open container is the es.stories array."""
+        return (len(self.frames) == 3 and self.frames[2]["type"] == "["
+                and self.frames[2]["name"] == "stories" and self.frames[1]["name"] == "es")
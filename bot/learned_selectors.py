@@ -0,0 +1,179 @@
+# ─────────────────────────────────────────────
+#  learned_selectors.py  —  Per-domain body selectors learned from pages
+#
+#  scraper._DOMAIN_SELECTORS is maintained by hand, and outlets missing
+#  from it get the slower, noisier generic <p> scan. For those outlets
+#  the scraper scores candidate containers on each scraped page
+#  (scraper._best_container) and reports the winning selector here. Once
+#  one selector has won SELECTOR_LEARN_PAGES of the domain's pages (a
+#  two-thirds majority), it is persisted and used like a hand-written
+#  entry on every later run. A domain that reaches SELECTOR_LEARN_MAX_PAGES
+#  observations without a winner stops being sampled.
+#
+#  Learned selectors use the .class form only, which the streaming
+#  extractor's matcher supports.
+#
+#  Report / maintenance (run from bot/):
+#    python learned_selectors.py
+#    python learned_selectors.py --forget example.com   # re-learn after a redesign
+#
+#  Default DB path: data/learned_selectors.db (repo root).
+#  Override with LEARNED_SELECTORS_DB, or pass db_path for tests.
+# ─────────────────────────────────────────────
+
+import argparse
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+from config import SELECTOR_LEARNING, SELECTOR_LEARN_PAGES, SELECTOR_LEARN_MAX_PAGES
+
+_DEFAULT_DB = os.path.join(
+    os.path.dirname(__file__), "..", "data", "learned_selectors.db"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    domain    TEXT    NOT NULL,
+    url       TEXT    NOT NULL,
+    selector  TEXT,
+    ts        REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_observations_domain ON observations (domain);
+CREATE TABLE IF NOT EXISTS learned (
+    domain      TEXT PRIMARY KEY,
+    selector    TEXT NOT NULL,
+    pages       INTEGER NOT NULL,
+    learned_at  REAL NOT NULL
+);
+"""
+
+_lock = threading.Lock()
+_learned: Optional[Dict[str, str]] = None          # domain -> selector
+_observed: Optional[Dict[str, List[str]]] = None   # domain -> selectors seen ("" = no candidate)
+
+
+def _resolve_path(db_path: Optional[str]) -> str:
+    path = (db_path or "").strip() or os.environ.get("LEARNED_SELECTORS_DB", _DEFAULT_DB)
+    parent = os.path.dirname(os.path.abspath(path))
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    return path
+
+
+def _connect(db_path: Optional[str]) -> sqlite3.Connection:
+    conn = sqlite3.connect(_resolve_path(db_path), timeout=10)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _load(db_path: Optional[str] = None) -> None:
+    """Read learned selectors and pending observations once per process. Call with _lock held."""
+    global _learned, _observed
+    if _learned is not None:
+        return
+    _learned, _observed = {}, {}
+    try:
+        with _connect(db_path) as conn:
+            _learned.update(conn.execute("SELECT domain, selector FROM learned"))
+            for domain, selector in conn.execute(
+                "SELECT domain, selector FROM observations ORDER BY ts"
+            ):
+                _observed.setdefault(domain, []).append(selector or "")
+    except sqlite3.Error as e:
+        print(f"  [selectors] Could not read learned selectors (non-fatal): {e}")
+
+
+def get(domain: str) -> Optional[str]:
+    """The learned selector for domain, or None."""
+    if not SELECTOR_LEARNING:
+        return None
+    with _lock:
+        _load()
+        return _learned.get(domain)
+
+
+def needs_learning(domain: str) -> bool:
+    """True while domain has no learned selector and is still worth sampling."""
+    if not SELECTOR_LEARNING:
+        return False
+    with _lock:
+        _load()
+        return domain not in _learned and len(_observed.get(domain, [])) < SELECTOR_LEARN_MAX_PAGES
+
+
+def _winner(selectors: List[str]) -> Optional[str]:
+    """The selector that won a two-thirds majority of at least SELECTOR_LEARN_PAGES pages."""
+    if len(selectors) < SELECTOR_LEARN_PAGES:
+        return None
+    selector, wins = Counter(selectors).most_common(1)[0]
+    if selector and wins >= SELECTOR_LEARN_PAGES and wins >= math.ceil(len(selectors) * 2 / 3):
+        return selector
+    return None
+
+
+def observe(domain: str, url: str, selector: Optional[str], db_path: Optional[str] = None) -> Optional[str]:
+    """
+    Record the best container selector found on one page of domain (None
+    when no candidate qualified). Returns the selector if this page
+    settled it.
+    """
+    now = time.time()
+    with _lock:
+        _load(db_path)
+        selectors = _observed.setdefault(domain, [])
+        selectors.append(selector or "")
+        winner = _winner(selectors)
+        if winner:
+            _learned[domain] = winner
+    try:
+        with _connect(db_path) as conn:
+            conn.execute(
+                "INSERT INTO observations (domain, url, selector, ts) VALUES (?,?,?,?)",
+                (domain, url, selector, now),
+            )
+            if winner:
+                conn.execute(
+                    "INSERT OR REPLACE INTO learned (domain, selector, pages, learned_at) VALUES (?,?,?,?)",
+                    (domain, winner, len(selectors), now),
+                )
+    except sqlite3.Error as e:
+        print(f"  [selectors] Could not save observation (non-fatal): {e}")
+    if winner:
+        print(f"  [selectors] Learned {winner!r} for {domain} from {len(selectors)} pages")
+    return winner
+
+
+def forget(domain: str, db_path: Optional[str] = None) -> None:
+    """Drop the learned selector and observations for domain so it is learned afresh."""
+    with _lock:
+        _load(db_path)
+        _learned.pop(domain, None)
+        _observed.pop(domain, None)
+    with _connect(db_path) as conn:
+        conn.execute("DELETE FROM learned WHERE domain = ?", (domain,))
+        conn.execute("DELETE FROM observations WHERE domain = ?", (domain,))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Learned per-domain extraction selectors")
+    parser.add_argument("--forget", metavar="DOMAIN", help="Drop a domain's selector so it is re-learned")
+    args = parser.parse_args()
+
+    if args.forget:
+        forget(args.forget)
+        print(f"Forgot {args.forget}")
+    with _lock:
+        _load()
+        learned, observed = dict(_learned), dict(_observed)
+    for domain in sorted(set(learned) | set(observed)):
+        seen = observed.get(domain, [])
+        status = learned.get(domain) or f"learning ({len(seen)}/{SELECTOR_LEARN_PAGES}+ pages)"
+        if domain not in learned and len(seen) >= SELECTOR_LEARN_MAX_PAGES:
+            status = "no consensus; generic scan"
+        print(f"{domain:<30} {status}")
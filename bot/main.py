@@ -5,6 +5,7 @@
 import os
 import sys
 import random
+import sqlite3
 from concurrent.futures import ThreadPoolExecutor
 
 # Add repo root to path so lib/ imports work from bot/
@@ -15,13 +16,17 @@ if _repo_root not in sys.path:
 from dotenv import load_dotenv
 load_dotenv()  # loads bot/.env when running from bot/; no-op if file absent
 from fetcher     import fetch_news
-from summarizer  import summarize_news
+import fetch_metrics
+import article_store
+import scraper
+import story_index
+from summarizer  import summarize_news, summarize_news_es_first, translate_edition
 from market_data import fetch_tickers, fetch_secondary_tickers, fetch_currency_table
-from storage     import save_digest, get_week_stories, get_recent_urls, is_friday
+from storage     import save_digest, load_digest, get_week_stories, get_recent_urls, is_friday
 from renderer    import build_html, build_plain
 from delivery    import send_email
 from archive     import save_pretty_issue
-from config      import DIGEST_DIR, ARCHIVE_DIR, AUTHOR_NAMES, AUTHOR_TITLES, MOCK_MODE, SKIP_EMAIL
+from config      import DIGEST_DIR, ARCHIVE_DIR, AUTHOR_NAMES, AUTHOR_TITLES, MOCK_MODE, SKIP_EMAIL, FETCH_ASYNC, USE_PREFETCH_POOL, PREFETCH_POOL_HOURS, SUMMARIZER_TRANSLATE
 from mock_data   import load_mock
 from wordcloud_gen import generate_wordcloud
 from image_gen   import generate_hero_image
@@ -36,6 +41,65 @@ def get_issue_number() -> int:
     return len([f for f in os.listdir(DIGEST_DIR) if f.endswith(".json")]) + 1
 
 
+def _record_articles(write) -> None:
+    """Run an article_store write; the store is bookkeeping, so a failure never stops the issue."""
+    try:
+        write()
+    except sqlite3.Error as e:
+        print(f"  [store] Could not update article store (non-fatal): {e}")
+
+
+def _english_edition(en_pending, digest_es: dict) -> dict:
+    """Wait for the background EN translation. The email is already out, so a failure only leaves the archive in Spanish."""
+    try:
+        return en_pending.result()
+    except Exception as e:
+        print(f"  [summarizer] English translation failed (non-fatal), archiving ES only: {e}")
+        return digest_es
+
+
+def _finish_english(today_str: str, saved: dict) -> None:
+    """
+    Complete an ES-first digest whose run died after the email went out
+    but before the English edition was saved: translate it, re-save the
+    digest, rebuild the archive page with the emailed byline and send the
+    Telegram notification, as run() would have. The email is not sent again.
+    """
+    digest  = saved["digest"]
+    market  = saved.get("market", {})
+    visual  = saved.get("visual")
+    pending = saved["en_pending"]
+    print(f"[RESUME] Digest for {today_str} has no English edition yet -- translating it")
+    try:
+        digest["en"] = translate_edition(digest["es"])
+    except Exception as e:
+        print(f"  [summarizer] English translation failed, archiving ES only: {e}")
+    save_digest(digest, market, visual=visual)
+
+    friday = is_friday()
+    wordcloud_filename = None
+    if friday:
+        print("  [wordcloud] Generating weekly word cloud...")
+        wordcloud_filename = generate_wordcloud()
+    save_pretty_issue(
+        digest             = digest,
+        tickers            = market.get("tickers", []),
+        secondary_tickers  = pending.get("secondary_tickers"),
+        currency           = market.get("currency", []),
+        week_stories       = get_week_stories() if friday else [],
+        issue_number       = get_issue_number(),
+        is_friday          = friday,
+        wordcloud_filename = wordcloud_filename,
+        author             = pending.get("author", ""),
+        visual             = visual,
+    )
+    send_telegram_issue_notification(
+        {**digest, "visual": visual},
+        today_str,
+        archive_url=digest.get("archive_url") or None,
+    )
+
+
 def run():
     print("=" * 50)
     print("  Mexico Finance Brief -- starting run")
@@ -51,6 +115,10 @@ def run():
     _digest_path = os.path.join(DIGEST_DIR, f"{today_str}.json")
     _force_run   = os.environ.get("FORCE_RUN", "").strip().lower() in {"true", "1", "yes", "on"}
     if os.path.exists(_digest_path) and not _force_run:
+        saved = load_digest(today_str)
+        if saved.get("en_pending"):    # ES-first run died before the EN edition was saved
+            _finish_english(today_str, saved)
+            return
         print(f"[SKIP] Digest already exists for {today_str}: {_digest_path}")
         return
 
@@ -65,6 +133,7 @@ def run():
         currency          = fut_currency.result()
 
     # -- 2+3. Fetch news + summarize (or load mock) --
+    en_pending = None  # Future for the EN edition when SUMMARIZER_TRANSLATE is on
     if MOCK_MODE:
         print("\n[2-3/5] MOCK MODE -- loading saved digest...")
         mock           = load_mock()
@@ -75,7 +144,24 @@ def run():
         print("\n[2/5] Fetching news articles...")
         prior_urls = get_recent_urls(days=5)
         print(f"  [dedup] Excluding {len(prior_urls)} URLs seen in the last 5 days")
-        articles = fetch_news(prior_urls=prior_urls)
+        articles = []
+        if USE_PREFETCH_POOL:
+            from fingerprint import collapse_near_duplicates
+            articles = collapse_near_duplicates(
+                article_store.load_pool(PREFETCH_POOL_HOURS, exclude_urls=prior_urls)
+            )
+            print(f"  [prefetch] {len(articles)} articles in the pre-fetched pool")
+            if not articles:
+                print("  [prefetch] Pool empty -- fetching live")
+        if not articles and FETCH_ASYNC:
+            import asyncio
+            from fetcher import fetch_news_async
+            articles = asyncio.run(fetch_news_async(prior_urls=prior_urls))
+        elif not articles:
+            articles = fetch_news(prior_urls=prior_urls)
+        scraper.shutdown_parse_pool()   # scraping is over; free the parser processes
+        fetch_metrics.report()
+        _record_articles(lambda: article_store.add_articles(articles, run_id=today_str))
         if not articles:
             print("  No articles found. Check your NewsAPI key or topics.")
             return
@@ -88,7 +174,10 @@ def run():
         if active_threads:
             print(f"  [threads] Active threads this week: {active_threads}")
         print(f"\n[3/5] Summarizing {len(articles)} articles with Claude...")
-        digest = summarize_news(articles, active_threads=active_threads)
+        if SUMMARIZER_TRANSLATE:
+            digest, en_pending = summarize_news_es_first(articles, active_threads=active_threads)
+        else:
+            digest = summarize_news(articles, active_threads=active_threads)
 
     digest_es = digest.get("es", digest)  # Spanish -- used in email
     digest_en = digest.get("en", digest)  # English -- used in archive toggle
@@ -99,10 +188,24 @@ def run():
     visual = generate_hero_image(digest, today_str, output_dir=_image_dir)
     print(f"  [visual] Category: {visual['hero_category']} | image: {'yes' if visual.get('hero_image') else 'skipped'}")
 
+    # Pick a random pen name + title — generated once so email and archive match
+    author = f"{random.choice(AUTHOR_NAMES)}, {random.choice(AUTHOR_TITLES)}"
+    print(f"  [author] Today's byline: {author}")
+
     # -- 4. Save digest to disk --
     print("\n[4/5] Saving digest...")
     digest["archive_url"] = build_issue_url(today_str)
-    save_digest(digest, {"tickers": tickers, "currency": currency}, visual=visual)
+    # ES-first: keep what the archive page needs in case the run dies before the EN edition
+    resume = {"author": author, "secondary_tickers": secondary_tickers} if en_pending is not None else None
+    save_digest(digest, {"tickers": tickers, "currency": currency}, visual=visual, en_pending=resume)
+    if not MOCK_MODE:
+        stories = [s for s in digest_es.get("stories", []) if s.get("url")]
+        _record_articles(lambda: article_store.mark_selected(stories, today_str))
+        # Index the fetched article; a pick whose URL matches none is indexed from its digest story
+        fetched = {a.get("url"): a for a in articles}
+        covered = [fetched.get(s["url"]) or {"title": s.get("headline", ""), "content": s.get("body", ""),
+                                             "url": s["url"]} for s in stories]
+        _record_articles(lambda: story_index.add_stories(covered, today_str))
 
     # ── 5. Build and send email ─────────────────────
     print("\n[5/5] Building and sending email...")
@@ -110,10 +213,6 @@ def run():
     week_stories = get_week_stories() if friday else []
     issue_num    = get_issue_number()
 
-    # Pick a random pen name + title — generated once so email and archive match
-    author = f"{random.choice(AUTHOR_NAMES)}, {random.choice(AUTHOR_TITLES)}"
-    print(f"  [author] Today's byline: {author}")
-
     # Generate word cloud on Fridays
     wordcloud_filename = None
     if friday:
@@ -139,6 +238,12 @@ def run():
         sentiment_label = digest_es.get("sentiment", {}).get("label_en", "Cautious")
         send_email(html, plain, sentiment_label=sentiment_label)
 
+    # ── ES-first: the archive waits for the English edition ──
+    if en_pending is not None:
+        print("\n[5.5/6] Waiting for the English edition...")
+        digest["en"] = _english_edition(en_pending, digest_es)
+        save_digest(digest, {"tickers": tickers, "currency": currency}, visual=visual)
+
     # ── 6. Save pretty HTML to archive ─────────────────
     print("\n[6/6] Saving to archive...")
     save_pretty_issue(
@@ -3,11 +3,11 @@
 # ─────────────────────────────────────────────
 
 import os
-import requests
 from config import (
     TICKER_SYMBOLS, SECONDARY_TICKER_GROUPS,
     CURRENCY_PAIRS, CURRENCY_BASES,
 )
+from utils import http
 
 
 # ── Tickers ───────────────────────────────────
@@ -26,8 +26,7 @@ def fetch_tickers() -> list[dict]:
             continue
         try:
             url     = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1d&range=5d"
-            headers = {"User-Agent": "Mozilla/5.0"}
-            data    = requests.get(url, headers=headers, timeout=8).json()
+            data    = http.get(url, timeout=8).json()
             result  = data["chart"]["result"][0]
             meta    = result["meta"]
             closes  = result["indicators"]["quote"][0]["close"]
@@ -105,8 +104,7 @@ def fetch_secondary_tickers() -> list[dict]:
         for label, symbol in group_cfg["tickers"]:
             try:
                 url     = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1d&range=2d"
-                headers = {"User-Agent": "Mozilla/5.0"}
-                data    = requests.get(url, headers=headers, timeout=8).json()
+                data    = http.get(url, timeout=8).json()
                 meta    = data["chart"]["result"][0]["meta"]
 
                 price     = meta.get("regularMarketPrice", 0)
@@ -149,8 +147,7 @@ def _fetch_yahoo_rate(symbol: str) -> tuple[float, float, float] | None:
     """
     try:
         url     = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1d&range=5d"
-        headers = {"User-Agent": "Mozilla/5.0"}
-        data    = requests.get(url, headers=headers, timeout=8).json()
+        data    = http.get(url, timeout=8).json()
         result  = data["chart"]["result"][0]
         meta    = result["meta"]
         closes  = result["indicators"]["quote"][0]["close"]
@@ -4,14 +4,17 @@
 #  When MOCK=true, main.py calls load_mock()
 #  instead of hitting NewsAPI or Anthropic.
 #  Loads the most recent bilingual digest from
-#  the digests/ folder and synthesises a fake
-#  articles list from the stored stories so the
-#  rest of the pipeline (renderer, archive,
-#  delivery) runs exactly as in production.
+#  the digests/ folder. The articles list is that
+#  run's real pool from the article store when it
+#  was recorded, else synthesised from the stored
+#  stories, so the rest of the pipeline (renderer,
+#  archive, delivery) runs exactly as in production.
 # ---------------------------------------------
 
 import os
 import json
+import sqlite3
+import article_store
 from config import DIGEST_DIR
 
 
@@ -33,9 +36,19 @@ def load_mock() -> dict:
     if "es" not in digest:
         raise ValueError(f"[mock] Digest at {path} is not bilingual (missing 'es' key).")
 
-    # Synthesise a minimal articles list from the ES stories
-    # so any code that inspects `articles` doesn't blow up.
-    articles = []
+    # Prefer the run's real article pool; otherwise synthesise a minimal
+    # articles list from the ES stories so any code that inspects
+    # `articles` doesn't blow up.
+    run_id = os.path.basename(path)[:-len(".json")]
+    try:
+        articles = article_store.load_run(run_id)
+    except sqlite3.Error as e:
+        print(f"  [mock] Article store unavailable (non-fatal): {e}")
+        articles = []
+    if articles:
+        print(f"  [mock] Loaded {len(articles)} articles from run {run_id} in the article store.")
+        return {"articles": articles, "digest": digest}
+
     for story in digest.get("es", {}).get("stories", []):
         articles.append({
             "title":   story.get("headline", ""),
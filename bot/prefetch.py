@@ -0,0 +1,79 @@
+# ─────────────────────────────────────────────
+#  prefetch.py  —  Overnight article pre-fetch
+#
+#  Polls NewsAPI and scrapes on a schedule, adding new articles to the
+#  local pool (article_store.py) with their fetch time. With
+#  USE_PREFETCH_POOL=true the morning main.py run ranks that pool
+#  instead of fetching, so its send time is bound by summarization
+#  alone and NewsAPI quota use is spread across the night.
+#
+#  Usage (run from bot/):
+#    python prefetch.py              # poll every PREFETCH_INTERVAL_MINUTES
+#    python prefetch.py --once       # one pass, for cron
+#
+#  Each pass skips URLs already in the pool or in recent digests, so
+#  only new articles are scraped.
+# ─────────────────────────────────────────────
+
+import argparse
+import time
+from datetime import datetime, timezone
+
+from dotenv import load_dotenv
+load_dotenv()
+
+import article_store
+import fetch_metrics
+import scraper
+from config import FETCH_ASYNC, PREFETCH_INTERVAL_MINUTES, PREFETCH_POOL_HOURS
+from fetcher import fetch_news
+from storage import get_recent_urls
+
+
+def prefetch_once() -> int:
+    """One poll: fetch articles not yet pooled and add them. Returns how many were added."""
+    started = datetime.now(timezone.utc)
+    print(f"\n[prefetch] Pass started {started.isoformat(timespec='seconds')}")
+    prior_urls = get_recent_urls(days=5) | article_store.known_urls(PREFETCH_POOL_HOURS)
+
+    if FETCH_ASYNC:
+        import asyncio
+        from fetcher import fetch_news_async
+        articles = asyncio.run(fetch_news_async(prior_urls=prior_urls))
+    else:
+        articles = fetch_news(prior_urls=prior_urls)
+
+    fetch_metrics.report()
+
+    run_id = "prefetch-" + started.strftime("%Y%m%dT%H%M%SZ")
+    added  = article_store.add_articles(articles, run_id=run_id)
+    pruned = article_store.prune()
+    print(f"  [prefetch] {added} new article(s) pooled"
+          + (f", {pruned} expired" if pruned else ""))
+    return added
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pre-fetch articles into the local pool")
+    parser.add_argument("--once", action="store_true", help="Run a single pass and exit")
+    parser.add_argument("--interval", type=float, default=PREFETCH_INTERVAL_MINUTES,
+                        help="Minutes between passes (default: %(default)s)")
+    args = parser.parse_args()
+
+    try:
+        while True:
+            try:
+                prefetch_once()
+            except Exception as e:
+                if args.once:
+                    raise
+                print(f"  [prefetch] Pass failed (will retry next interval): {e}")
+            if args.once:
+                return
+            time.sleep(args.interval * 60)
+    finally:
+        scraper.shutdown_parse_pool()
+
+
+if __name__ == "__main__":
+    main()
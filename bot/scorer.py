@@ -7,90 +7,188 @@
 #  uniqueness filter removes near-duplicate headlines.
 # ─────────────────────────────────────────────
 
+import re
+import sqlite3
 from datetime import datetime, timezone
+from functools import lru_cache
 
+import numpy as np
 
-def _freshness_score(published_at: str | None, now: datetime) -> float:
-    """0.1–1.0 based on hours since publication."""
+import story_index
+from config import (
+    SOURCE_TIERS, TOPICS,
+    STORY_DEDUP_MODE, STORY_DEDUP_DAYS, STORY_DEDUP_THRESHOLD, STORY_DEDUP_PENALTY,
+)
+from uniqueness import filter_unique
+
+# Composite weights (sum to 0.80): freshness, authority, relevance
+_WEIGHTS = np.array([0.30, 0.25, 0.25])
+
+# Freshness buckets: under 6h, 12h, 24h, older (or undated)
+_FRESH_HOURS  = np.array([6.0, 12.0, 24.0])
+_FRESH_VALUES = np.array([1.0, 0.7, 0.4, 0.1])
+
+
+def _tier_pattern(names: list[str]) -> re.Pattern | None:
+    """One case-insensitive substring matcher for a tier's source names."""
+    names = [n.lower() for n in names if n]
+    return re.compile("|".join(map(re.escape, names))) if names else None
+
+
+# Compiled once: a source is in a tier if any tier name is a substring of it
+_TIERS = [
+    (_tier_pattern(SOURCE_TIERS["tier1"]), 1.0),
+    (_tier_pattern(SOURCE_TIERS["tier2"]), 0.6),
+]
+
+
+def _hours_old(published_at: str | None, now: datetime) -> float:
+    """Hours since publication (future dates count as 0), or NaN if missing or malformed."""
     if not published_at:
-        return 0.1
+        return np.nan
     try:
         pub = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
         if pub.tzinfo is None:
             pub = pub.replace(tzinfo=timezone.utc)
-        hours_old = (now - pub).total_seconds() / 3600
-        hours_old = max(hours_old, 0)  # guard against future-dated articles
+        return max((now - pub).total_seconds() / 3600, 0)
     except Exception:
-        return 0.1
-    if hours_old < 6:   return 1.0
-    if hours_old < 12:  return 0.7
-    if hours_old < 24:  return 0.4
-    return 0.1
+        return np.nan
+
+
+def _freshness_column(hours: np.ndarray) -> np.ndarray:
+    """Map hours-old to freshness buckets; NaN (undated) falls in the last one."""
+    buckets = np.searchsorted(_FRESH_HOURS, hours, side="right")
+    buckets[np.isnan(hours)] = len(_FRESH_HOURS)
+    return _FRESH_VALUES[buckets]
 
 
+def _freshness_score(published_at: str | None, now: datetime) -> float:
+    """0.1–1.0 based on hours since publication."""
+    return float(_freshness_column(np.array([_hours_old(published_at, now)]))[0])
+
+
+@lru_cache(maxsize=4096)
 def _authority_score(source_name: str) -> float:
     """1.0 for Tier 1 sources, 0.6 for Tier 2, 0.3 for unknown."""
-    from config import SOURCE_TIERS
     name_lower = (source_name or "").lower()
-    if any(t.lower() in name_lower for t in SOURCE_TIERS["tier1"]):
-        return 1.0
-    if any(t.lower() in name_lower for t in SOURCE_TIERS["tier2"]):
-        return 0.6
+    for pattern, score in _TIERS:
+        if pattern is not None and pattern.search(name_lower):
+            return score
     return 0.3
 
 
+@lru_cache(maxsize=16)
+def _topic_matcher(topics: tuple[str, ...]) -> tuple[tuple[str, ...], int]:
+    """Lowercased topics, and the count of empty ones (which match any text)."""
+    return tuple(t.lower() for t in topics if t), sum(1 for t in topics if not t)
+
+
+def _relevance_column(articles: list[dict], topics: list[str]) -> np.ndarray:
+    """Normalized keyword overlap for each article; see _relevance_score."""
+    lowered, always = _topic_matcher(tuple(topics))
+    matches = np.fromiter(
+        (sum(1 for t in lowered if t in text) for text in (
+            (a.get("title", "") + " " + a.get("content", "")).lower() for a in articles
+        )),
+        dtype=float, count=len(articles),
+    )
+    return np.minimum((matches + always) / max(len(topics), 1), 1.0)
+
+
 def _relevance_score(article: dict, topics: list[str]) -> float:
     """Normalized keyword overlap between article text and configured topics."""
-    text = (article.get("title", "") + " " + article.get("content", "")).lower()
-    matches = sum(1 for t in topics if t.lower() in text)
-    return min(matches / max(len(topics), 1), 1.0)
+    return float(_relevance_column([article], topics)[0])
 
 
-def rank_articles(articles: list[dict], now: datetime | None = None) -> list[dict]:
+def score_articles(articles: list[dict], now: datetime | None = None) -> np.ndarray:
+    """
+    Weighted composite (freshness + authority + relevance) for every
+    article, as one array. Each factor is computed as a column for the
+    whole list: dates are parsed once each, tier lookups are cached per
+    source name, and the topic list is lowercased once.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+    if not articles:
+        return np.zeros(0)
+    freshness = _freshness_column(np.fromiter(
+        (_hours_old(a.get("publishedAt"), now) for a in articles), dtype=float, count=len(articles),
+    ))
+    authority = np.fromiter(
+        (_authority_score(a.get("source") or "") for a in articles), dtype=float, count=len(articles),
+    )
+    relevance = _relevance_column(articles, TOPICS)
+    return np.column_stack([freshness, authority, relevance]) @ _WEIGHTS
+
+
+def score_article(article: dict, now: datetime | None = None) -> float:
+    """Weighted composite (freshness + authority + relevance) for one article; max 0.80."""
+    return float(score_articles([article], now)[0])
+
+
+def _covered_mask(articles: list[dict], now: datetime | None) -> np.ndarray:
+    """True for articles too similar to a story already covered in the last STORY_DEDUP_DAYS days."""
+    if STORY_DEDUP_MODE not in ("demote", "drop") or not articles:
+        return np.zeros(len(articles), dtype=bool)
+    try:
+        similarity = story_index.max_similarity(
+            articles, STORY_DEDUP_DAYS, today=now.date() if now else None,
+        )
+    except sqlite3.Error as e:
+        print(f"  [scorer] Story index unavailable (non-fatal): {e}")
+        return np.zeros(len(articles), dtype=bool)
+    covered = similarity >= STORY_DEDUP_THRESHOLD
+    if covered.any():
+        print(f"  [scorer] {int(covered.sum())} article(s) match stories from the last "
+              f"{STORY_DEDUP_DAYS} days ({STORY_DEDUP_MODE})")
+    return covered
+
+
+def rank_articles(
+    articles: list[dict],
+    now: datetime | None = None,
+    limit: int | None = None,
+) -> list[dict]:
     """
-    Score and rank articles. Returns at most MAX_ARTICLES_FOR_CLAUDE articles.
+    Score and rank articles. Returns at most `limit` articles
+    (default MAX_ARTICLES_FOR_CLAUDE), each with its final composite
+    score set as article["score"]; articles not returned are not modified.
 
     Scoring weights (sum to 0.80; max composite score is 0.80):
       Freshness  30%  — recency of publication
       Authority  25%  — source tier (config.SOURCE_TIERS)
       Relevance  25%  — keyword overlap with config.TOPICS
 
+    Articles matching a story covered in the last STORY_DEDUP_DAYS days
+    (story_index.py) have their score multiplied by STORY_DEDUP_PENALTY, or
+    are dropped with STORY_DEDUP_MODE=drop.
+
     Uniqueness is handled as a post-sort greedy filter (not a weight):
-    articles with >60% headline word overlap against already-accepted
+    articles with >=60% headline word overlap against already-accepted
     articles are dropped. Overlap is measured from the candidate's perspective
     (len(candidate_words & accepted_words) / len(candidate_words)), so short
     headlines are filtered more aggressively than long ones — intentional.
+    See uniqueness.py.
     """
-    from config import TOPICS, MAX_ARTICLES_FOR_CLAUDE
-    if now is None:
-        now = datetime.now(timezone.utc)
-
-    # Score each article on the three weighted factors
-    scored = []
-    for article in articles:
-        f = _freshness_score(article.get("publishedAt"), now) * 0.30
-        a = _authority_score(article.get("source") or "")      * 0.25
-        r = _relevance_score(article, TOPICS)                  * 0.25
-        scored.append((f + a + r, article))
-
-    scored.sort(key=lambda x: x[0], reverse=True)
-
-    # Greedy uniqueness pass
-    accepted: list[dict] = []
-    accepted_words: list[set] = []
-
-    for _, article in scored:
-        headline_words = set(article.get("title", "").lower().split())
-        if headline_words and accepted_words:
-            max_overlap = max(
-                len(headline_words & existing) / len(headline_words)
-                for existing in accepted_words
-            )
-            if max_overlap >= 0.6:
-                continue
-        accepted.append(article)
-        accepted_words.append(headline_words)
-        if len(accepted) >= MAX_ARTICLES_FOR_CLAUDE:
-            break
-
-    return accepted
+    from config import MAX_ARTICLES_FOR_CLAUDE
+    if limit is None:
+        limit = MAX_ARTICLES_FOR_CLAUDE
+
+    # Score all articles on the three weighted factors at once; a stable
+    # sort keeps input order among equal scores
+    scores  = score_articles(articles, now)
+    covered = _covered_mask(articles, now)
+    if STORY_DEDUP_MODE == "demote":
+        scores = np.where(covered, scores * STORY_DEDUP_PENALTY, scores)
+    order  = np.argsort(-scores, kind="stable")
+    if STORY_DEDUP_MODE == "drop":
+        order = order[~covered[order]]
+    ranked = [articles[i] for i in order]
+
+    # Greedy uniqueness pass; only the picks get a score (token_budget
+    # weights article text by it), the rest of the pool is left as passed
+    picked   = filter_unique(ranked, limit)
+    score_of = {id(articles[i]): round(float(scores[i]), 4) for i in order}
+    for article in picked:
+        article["score"] = score_of[id(article)]
+    return picked
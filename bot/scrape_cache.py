@@ -0,0 +1,131 @@
+# ─────────────────────────────────────────────
+#  scrape_cache.py  —  On-disk cache for scrape_article
+#
+#  One row per article URL: the extracted text (NULL when the page
+#  yielded under 100 chars, so paywall stubs aren't re-downloaded
+#  either), the ETag / Last-Modified validators and the fetch time.
+#
+#  Within SCRAPE_CACHE_TTL_HOURS a hit skips the network entirely.
+#  After that the entry is revalidated with a conditional GET; a 304
+#  refreshes the timestamp and reuses the stored text.
+#  The table is capped at SCRAPE_CACHE_MAX_ENTRIES, least recently
+#  used first out.
+#
+#  Default DB path: data/scrape_cache.db (repo root).
+#  Override with SCRAPE_CACHE_DB, or pass db_path for tests.
+# ─────────────────────────────────────────────
+
+import os
+import sqlite3
+import time
+from typing import Dict, Optional
+
+from config import SCRAPE_CACHE_TTL_HOURS, SCRAPE_CACHE_MAX_ENTRIES
+
+_DEFAULT_DB = os.path.join(
+    os.path.dirname(__file__), "..", "data", "scrape_cache.db"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scrape_cache (
+    url            TEXT    PRIMARY KEY,
+    text           TEXT,
+    max_chars      INTEGER NOT NULL,
+    etag           TEXT,
+    last_modified  TEXT,
+    fetched_at     REAL    NOT NULL,
+    accessed_at    REAL    NOT NULL
+)
+"""
+
+
+def _resolve_path(db_path: Optional[str]) -> str:
+    path = (db_path or "").strip() or os.environ.get("SCRAPE_CACHE_DB", _DEFAULT_DB)
+    parent = os.path.dirname(os.path.abspath(path))
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    return path
+
+
+def _connect(db_path: Optional[str]) -> sqlite3.Connection:
+    conn = sqlite3.connect(_resolve_path(db_path), timeout=10)
+    conn.execute(_SCHEMA)
+    return conn
+
+
+def lookup(url: str, max_chars: int, db_path: Optional[str] = None) -> Optional[Dict]:
+    """
+    Return the cached entry for url, or None.
+
+    The entry has keys text (already cut to max_chars), etag,
+    last_modified and fresh (still inside the TTL). Entries stored with
+    a smaller max_chars than requested don't count: their text may be
+    truncated short of what the caller wants.
+    """
+    with _connect(db_path) as conn:
+        row = conn.execute(
+            "SELECT text, max_chars, etag, last_modified, fetched_at FROM scrape_cache WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        text, stored_max, etag, last_modified, fetched_at = row
+        if stored_max < max_chars and text is not None and len(text) >= stored_max:
+            return None
+        conn.execute("UPDATE scrape_cache SET accessed_at = ? WHERE url = ?", (time.time(), url))
+    return {
+        "text":          text[:max_chars] if text is not None else None,
+        "etag":          etag,
+        "last_modified": last_modified,
+        "fresh":         time.time() - fetched_at < SCRAPE_CACHE_TTL_HOURS * 3600,
+    }
+
+
+def validators(entry: Optional[Dict]) -> Dict[str, str]:
+    """Conditional-GET headers for a stale entry ({} when there is nothing to revalidate)."""
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def store(
+    url: str,
+    text: Optional[str],
+    max_chars: int,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+    db_path: Optional[str] = None,
+) -> None:
+    """Insert or replace the entry for url, then evict down to SCRAPE_CACHE_MAX_ENTRIES."""
+    now = time.time()
+    with _connect(db_path) as conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO scrape_cache
+                (url, text, max_chars, etag, last_modified, fetched_at, accessed_at)
+            VALUES (?,?,?,?,?,?,?)
+            """,
+            (url, text, max_chars, etag, last_modified, now, now),
+        )
+        conn.execute(
+            """
+            DELETE FROM scrape_cache WHERE url IN (
+                SELECT url FROM scrape_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (SCRAPE_CACHE_MAX_ENTRIES,),
+        )
+
+
+def mark_revalidated(url: str, db_path: Optional[str] = None) -> None:
+    """Restart the TTL after the origin answered 304 Not Modified."""
+    now = time.time()
+    with _connect(db_path) as conn:
+        conn.execute(
+            "UPDATE scrape_cache SET fetched_at = ?, accessed_at = ? WHERE url = ?",
+            (now, now, url),
+        )
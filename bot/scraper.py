@@ -2,17 +2,27 @@
 #  scraper.py  —  Full article text extractor
 # ─────────────────────────────────────────────
 
+import asyncio
+import atexit
+import multiprocessing
+import re
+import threading
+import time
+import httpx
 import requests
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from urllib.parse import urlparse
 from bs4 import BeautifulSoup
-
-HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    )
-}
+from lxml import etree
+import domain_health
+import fetch_metrics
+import learned_selectors
+import scrape_cache
+from config import (
+    SCRAPE_MAX_WORKERS, SCRAPE_MAX_PER_DOMAIN, SCRAPE_CACHE_ENABLED,
+    SCRAPE_STREAMING, SCRAPE_MAX_BYTES, SCRAPE_PARSE_PROCESSES,
+)
+from utils import http
 
 # Per-domain CSS selectors targeting the article body specifically.
 # Tried before the generic <p> scan to avoid nav/sidebar/related boilerplate.
@@ -35,33 +45,639 @@ _DOMAIN_SELECTORS = {
 }
 
 
-def scrape_article(url: str, max_chars: int = 3000) -> str | None:
-    try:
-        response = requests.get(url, headers=HEADERS, timeout=8)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "lxml")
-        for tag in soup(["script", "style", "nav", "footer", "aside", "header", "figure"]):
-            tag.decompose()
-
-        # Try domain-specific selector first
-        text   = ""
-        domain = urlparse(url).netloc.lower().removeprefix("www.")
-        sel    = _DOMAIN_SELECTORS.get(domain)
-        if sel:
-            container = soup.select_one(sel)
-            if container:
-                text = " ".join(p.get_text(separator=" ") for p in container.find_all("p"))
-                text = " ".join(text.split())
+def _domain(url: str) -> str:
+    return urlparse(url).netloc.lower().removeprefix("www.")
 
-        # Fall back to generic <p> scan
-        if len(text) < 100:
-            paragraphs = soup.find_all("p")
-            text = " ".join(p.get_text(separator=" ") for p in paragraphs)
+
+def _selector_for(domain: str) -> str | None:
+    """The hand-written selector for domain, else one learned from its pages."""
+    return _DOMAIN_SELECTORS.get(domain) or learned_selectors.get(domain)
+
+
+# Boilerplate elements dropped (with everything inside them) before extraction.
+_STRIP_TAGS = ("script", "style", "nav", "footer", "aside", "header", "figure")
+
+_CHUNK_BYTES = 64 * 1024
+
+
+def extract_text(html: str, url: str, max_chars: int = 3000) -> str | None:
+    """Article body text from a downloaded page, or None if under 100 chars."""
+    soup = BeautifulSoup(html, "lxml")
+    for tag in soup(list(_STRIP_TAGS)):
+        tag.decompose()
+
+    # Try domain-specific selector first
+    text   = ""
+    domain = _domain(url)
+    sel    = _selector_for(domain)
+    if sel:
+        container = soup.select_one(sel)
+        if container:
+            text = " ".join(p.get_text(separator=" ") for p in container.find_all("p"))
             text = " ".join(text.split())
 
+    # Fall back to generic <p> scan
+    if len(text) < 100:
+        paragraphs = soup.find_all("p")
+        text = " ".join(p.get_text(separator=" ") for p in paragraphs)
+        text = " ".join(text.split())
+
+    if len(text) < 100:
+        return None
+    return text[:max_chars]
+
+
+# ── Streaming extraction ──────────────────────
+#
+# Same output as extract_text, but fed the page a chunk at a time through
+# lxml's incremental parser: <p> text is collected as each paragraph
+# closes, finished subtrees are freed, and parsing stops as soon as
+# max_chars of body text (at least the 100-char minimum) is in hand. Most article bodies end well before
+# the comments, related-links and script payload that make up the bulk
+# of a news page.
+
+_CLASS_CONTAINS = re.compile(r"^\[class\*=['\"]([^'\"]+)['\"]\]$")
+_CLASS_TOKEN    = re.compile(r"^\.([A-Za-z0-9_-]+)$")
+_META_CHARSET   = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.I)
+
+
+def _compile_selector(sel: str):
+    """
+    Turn a _DOMAIN_SELECTORS entry into a predicate on an element's class
+    attribute. Only the two forms used there are supported — .class and
+    [class*='substring'] — anything else returns None.
+    """
+    tests = []
+    for part in (p.strip() for p in sel.split(",")):
+        if m := _CLASS_CONTAINS.match(part):
+            tests.append(lambda cls, sub=m.group(1): sub in cls)
+        elif m := _CLASS_TOKEN.match(part):
+            tests.append(lambda cls, tok=m.group(1): tok in cls.split())
+        else:
+            return None
+    return lambda cls: any(t(cls) for t in tests)
+
+
+def _paragraph_text(p) -> str:
+    """Whitespace-normalized text of a <p>, skipping stripped tags and comments."""
+    parts: list[str] = []
+
+    def walk(el):
+        if el.text:
+            parts.append(el.text)
+        for child in el:
+            if isinstance(child.tag, str) and child.tag not in _STRIP_TAGS:
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    walk(p)
+    return " ".join(" ".join(parts).split())
+
+
+class _StreamingExtractor:
+    """Incremental counterpart of extract_text. feed() returns True once done."""
+
+    def __init__(self, url: str, max_chars: int, encoding: str | None = None):
+        self.max_chars  = max_chars
+        self._enough    = max(max_chars, 100)   # text under 100 chars is rejected, so collect at least that
+        self._matches   = None
+        sel = _selector_for(_domain(url))
+        if sel:
+            self._matches = _compile_selector(sel)
+        self._encoding   = encoding
+        self._parser     = None
+        self._strip_depth = 0
+        self._p_depth     = 0
+        self._container   = None          # first element matching the domain selector
+        self._container_closed = False
+        self._container_text: list[str] = []
+        self._container_len = 0
+        self._all_text: list[str] = []
+        self._all_len   = 0
+        self.done       = False
+
+    @staticmethod
+    def _append(parts: list[str], length: int, text: str) -> int:
+        if text:
+            parts.append(text)
+            length += len(text) + (1 if length else 0)
+        return length
+
+    def _container_settled(self) -> bool:
+        """True once the container text is final (or enough) and long enough to use."""
+        if self._container_len >= self._enough:
+            return True
+        return self._container_closed and self._container_len >= 100
+
+    def _check_done(self) -> bool:
+        if self._matches is None or self._container_closed:
+            if self._container_settled():
+                return True
+            # No selector, or the container came up short: generic <p> scan
+            return self._all_len >= self._enough
+        return self._container_len >= self._enough
+
+    def _handle(self, event: str, el) -> None:
+        tag = el.tag if isinstance(el.tag, str) else None
+        if event == "start":
+            if tag in _STRIP_TAGS:
+                self._strip_depth += 1
+            elif (self._matches is not None and self._container is None
+                  and self._strip_depth == 0 and self._matches(el.get("class", ""))):
+                self._container = el
+            if tag == "p":
+                self._p_depth += 1
+            return
+
+        if tag in _STRIP_TAGS:
+            self._strip_depth -= 1
+        if el is self._container:
+            self._container_closed = True
+        if tag == "p":
+            self._p_depth -= 1
+            if self._strip_depth == 0:
+                text = _paragraph_text(el)
+                if self._all_len < self._enough:
+                    self._all_len = self._append(self._all_text, self._all_len, text)
+                if self._container is not None and not self._container_closed:
+                    self._container_len = self._append(self._container_text, self._container_len, text)
+        # Free finished subtrees unless an open <p> still needs them
+        if self._p_depth == 0 and el is not self._container:
+            el.clear(keep_tail=True)
+            parent = el.getparent()
+            while parent is not None and el.getprevious() is not None:
+                del parent[0]
+
+    def _make_parser(self, first_chunk: bytes):
+        # Header charset, else a <meta charset> in the first bytes, else UTF-8
+        encoding = self._encoding
+        if not encoding:
+            m = _META_CHARSET.search(first_chunk[:4096])
+            encoding = m.group(1).decode("ascii") if m else "utf-8"
+        try:
+            return etree.HTMLPullParser(events=("start", "end"), encoding=encoding)
+        except LookupError:
+            return etree.HTMLPullParser(events=("start", "end"), encoding="utf-8")
+
+    def feed(self, chunk: bytes) -> bool:
+        if self.done:
+            return True
+        if self._parser is None:
+            self._parser = self._make_parser(chunk)
+        self._parser.feed(chunk)
+        for event, el in self._parser.read_events():
+            self._handle(event, el)
+        self.done = self._check_done()
+        return self.done
+
+    def result(self) -> str | None:
+        if not self.done and self._parser is not None:
+            try:
+                self._parser.close()
+            except etree.LxmlError:
+                pass
+            for event, el in self._parser.read_events():
+                self._handle(event, el)
+            self._container_closed = self._container_closed or self._container is not None
+        if self._container_settled():
+            text = " ".join(self._container_text)
+        else:
+            text = " ".join(self._all_text)
         if len(text) < 100:
             return None
-        return text[:max_chars]
+        return text[:self.max_chars]
+
+
+def _is_html(headers) -> bool:
+    ctype = (headers.get("Content-Type") or "").lower()
+    return not ctype or "html" in ctype
+
+
+def _charset(headers) -> str | None:
+    ctype = headers.get("Content-Type") or ""
+    m = re.search(r"charset=[\"']?([\w.:-]+)", ctype, re.I)
+    return m.group(1) if m else None
+
+
+def _extract_stream(chunks, url: str, max_chars: int, encoding: str | None) -> str | None:
+    """Feed up to SCRAPE_MAX_BYTES of chunks to a _StreamingExtractor."""
+    extractor = _StreamingExtractor(url, max_chars, encoding=encoding)
+    remaining = SCRAPE_MAX_BYTES
+    for chunk in chunks:
+        chunk = chunk[:remaining]
+        remaining -= len(chunk)
+        if extractor.feed(chunk) or remaining <= 0:
+            break
+    return extractor.result()
+
+
+# ── Parser process pool ───────────────────────
+#
+# With SCRAPE_PARSE_PROCESSES > 0, download and extraction are split:
+# the I/O threads (or the event loop) only read each page, capped at
+# SCRAPE_MAX_BYTES, and hand the bytes to a pool of parser processes.
+# Extraction runs there outside the GIL, using the same extract_text or
+# streaming extractor. Pages are read in full up to the cap, because the
+# streaming path's early stop happens in the parser. Callers shut the
+# pool down with shutdown_parse_pool() once they are done scraping.
+
+_parse_pool: ProcessPoolExecutor | None = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor | None:
+    """The shared parser pool, or None when parsing runs in the I/O thread."""
+    global _parse_pool
+    if SCRAPE_PARSE_PROCESSES <= 0:
+        return None
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # spawn, not fork: forking while scrape threads hold locks can deadlock the child
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=SCRAPE_PARSE_PROCESSES,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+    return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the parser processes; the next scrape starts a fresh pool. Safe to call twice."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown()
+            _parse_pool = None
+
+
+atexit.register(shutdown_parse_pool)   # backstop for callers that exit early
+
+
+def _parse_page(page: bytes | str, url: str, max_chars: int, encoding: str | None = None) -> str | None:
+    """
+    Extract article text from a downloaded page; runs in a parser process.
+    Raw bytes go through the streaming extractor and decoded text through
+    extract_text, matching the in-thread paths.
+    """
+    if isinstance(page, str):
+        return extract_text(page, url, max_chars)
+    chunks = (page[i:i + _CHUNK_BYTES] for i in range(0, len(page), _CHUNK_BYTES))
+    return _extract_stream(chunks, url, max_chars, encoding)
+
+
+# ── Selector learning ─────────────────────────
+#
+# While a domain has neither a hand-written nor a learned selector, its
+# pages are read in full (up to SCRAPE_MAX_BYTES) and, besides the normal
+# extraction, scanned for the element most likely to hold the article
+# body. The winner's .class selector is reported to learned_selectors,
+# which keeps it once enough pages agree.
+
+_CANDIDATE_TAGS      = ("div", "article", "section", "main")
+_MIN_PARAGRAPH_CHARS = 40
+_MIN_PARAGRAPHS      = 3
+
+
+def _learning(domain: str) -> bool:
+    return domain not in _DOMAIN_SELECTORS and learned_selectors.needs_learning(domain)
+
+
+def _best_container(page: bytes | str, encoding: str | None = None) -> str | None:
+    """
+    The .class selector of the element most likely to be the article body,
+    or None. Candidates are classed div/article/section/main elements with
+    at least _MIN_PARAGRAPHS real paragraphs, scored by their paragraph
+    text outside links times that text's share of all the element's text,
+    so wrappers that also hold link lists and blurbs lose to the body
+    itself. On a tie the deeper element wins.
+    The selector must pick out that same element via select_one, as
+    extract_text will.
+    """
+    if isinstance(page, bytes):
+        soup = BeautifulSoup(page, "lxml", from_encoding=encoding)
+    else:
+        soup = BeautifulSoup(page, "lxml")
+    for tag in soup(list(_STRIP_TAGS)):
+        tag.decompose()
+
+    best, best_score = None, 0.0
+    for el in soup.find_all(_CANDIDATE_TAGS, class_=True):
+        p_chars = link_chars = count = 0
+        for p in el.find_all("p"):
+            text = " ".join(p.get_text(separator=" ").split())
+            if len(text) < _MIN_PARAGRAPH_CHARS:
+                continue
+            count   += 1
+            p_chars += len(text)
+            link_chars += sum(len(" ".join(a.get_text(separator=" ").split())) for a in p.find_all("a"))
+        if count < _MIN_PARAGRAPHS:
+            continue
+        body  = p_chars - link_chars
+        total = len(" ".join(el.get_text(separator=" ").split()))
+        score = body * body / total
+        if score > 0 and score >= best_score:
+            best, best_score = el, score
+
+    if best is None:
+        return None
+    for token in best.get("class", []):
+        sel = "." + token
+        if not _CLASS_TOKEN.match(sel):
+            continue
+        try:
+            if soup.select_one(sel) is best:
+                return sel
+        except Exception:      # soupsieve rejects tokens like ".2col"
+            continue
+    return None
+
+
+def _parse_and_find(page: bytes | str, url: str, max_chars: int,
+                    encoding: str | None = None) -> tuple[str | None, str | None]:
+    """_parse_page plus _best_container; runs in a parser process when the pool is on."""
+    return _parse_page(page, url, max_chars, encoding), _best_container(page, encoding)
+
+
+def _parse_and_learn(page: bytes | str, url: str, max_chars: int, encoding: str | None = None) -> str | None:
+    pool = _get_parse_pool()
+    if pool is None:
+        text, selector = _parse_and_find(page, url, max_chars, encoding)
+    else:
+        text, selector = pool.submit(_parse_and_find, page, url, max_chars, encoding).result()
+    learned_selectors.observe(_domain(url), url, selector)
+    return text
+
+
+async def _parse_and_learn_async(page: bytes | str, url: str, max_chars: int,
+                                 encoding: str | None = None) -> str | None:
+    pool = _get_parse_pool()
+    if pool is None:
+        text, selector = await asyncio.to_thread(_parse_and_find, page, url, max_chars, encoding)
+    else:
+        text, selector = await asyncio.wrap_future(pool.submit(_parse_and_find, page, url, max_chars, encoding))
+    await asyncio.to_thread(learned_selectors.observe, _domain(url), url, selector)
+    return text
+
+
+def _read_capped(chunks) -> bytes:
+    """Join chunks up to SCRAPE_MAX_BYTES."""
+    body = bytearray()
+    for chunk in chunks:
+        body += chunk[:SCRAPE_MAX_BYTES - len(body)]
+        if len(body) >= SCRAPE_MAX_BYTES:
+            break
+    return bytes(body)
+
+
+def _cache_lookup(url: str, max_chars: int) -> dict | None:
+    if not SCRAPE_CACHE_ENABLED:
+        return None
+    try:
+        return scrape_cache.lookup(url, max_chars)
+    except Exception as e:
+        print(f"  [scraper] Cache lookup failed for {url} (non-fatal): {e}")
+        return None
+
+
+def _cache_store(url: str, text: str | None, max_chars: int, headers) -> None:
+    if not SCRAPE_CACHE_ENABLED:
+        return
+    try:
+        scrape_cache.store(url, text, max_chars, headers.get("ETag"), headers.get("Last-Modified"))
+    except Exception as e:
+        print(f"  [scraper] Cache store failed for {url} (non-fatal): {e}")
+
+
+def _cache_revalidated(url: str) -> None:
+    try:
+        scrape_cache.mark_revalidated(url)
     except Exception as e:
+        print(f"  [scraper] Cache update failed for {url} (non-fatal): {e}")
+
+
+def _counted(chunks, stats: dict):
+    """Pass chunks through, adding their size to stats["bytes"]."""
+    for chunk in chunks:
+        stats["bytes"] += len(chunk)
+        yield chunk
+
+
+def _fetch_text(url: str, max_chars: int, cached: dict | None, timeout: float, stats: dict) -> str | None:
+    """
+    Download and extract url. Raises on HTTP errors; cached is the stale
+    entry, if any. Fills stats["status"] and stats["bytes"] for fetch_metrics.
+    """
+    if not SCRAPE_STREAMING:
+        response = http.get(url, timeout=timeout, headers=scrape_cache.validators(cached))
+        stats["status"], stats["bytes"] = response.status_code, len(response.content)
+        if response.status_code == 304 and cached:
+            _cache_revalidated(url)
+            return cached["text"]
+        response.raise_for_status()
+        pool = _get_parse_pool()
+        if _learning(_domain(url)):
+            text = _parse_and_learn(response.text, url, max_chars)
+        elif pool is None:
+            text = extract_text(response.text, url, max_chars)
+        else:
+            text = pool.submit(_parse_page, response.text, url, max_chars).result()
+        _cache_store(url, text, max_chars, response.headers)
+        return text
+
+    with http.get(url, timeout=timeout, headers=scrape_cache.validators(cached), stream=True) as response:
+        stats["status"] = response.status_code
+        if response.status_code == 304 and cached:
+            _cache_revalidated(url)
+            return cached["text"]
+        response.raise_for_status()
+        if not _is_html(response.headers):
+            text = None
+        else:
+            chunks = _counted(response.iter_content(chunk_size=_CHUNK_BYTES), stats)
+            pool   = _get_parse_pool()
+            if _learning(_domain(url)):
+                text = _parse_and_learn(_read_capped(chunks), url, max_chars, _charset(response.headers))
+            elif pool is None:
+                text = _extract_stream(chunks, url, max_chars, _charset(response.headers))
+            else:
+                page = _read_capped(chunks)
+                text = pool.submit(_parse_page, page, url, max_chars, _charset(response.headers)).result()
+        _cache_store(url, text, max_chars, response.headers)
+        return text
+
+
+def _outcome(text: str | None, error: Exception | None) -> str:
+    """Classify a scrape attempt for domain_health."""
+    if error is None:
+        return "ok" if text else "short"
+    if isinstance(error, (requests.Timeout, httpx.TimeoutException)):
+        return "timeout"
+    if isinstance(error, (requests.HTTPError, httpx.HTTPStatusError)):
+        return "http_error"
+    return "error"
+
+
+def _record_scrape(url: str, domain: str, seconds: float, stats: dict, outcome: str,
+                   text: str | None, cache: str) -> None:
+    fetch_metrics.record(
+        "scrape", url=url, domain=domain, seconds=seconds, bytes=stats["bytes"],
+        status=stats["status"], outcome=outcome, chars=len(text or ""), cache=cache,
+    )
+
+
+def scrape_article(url: str, max_chars: int = 3000) -> str | None:
+    domain = _domain(url)
+    stats  = {"status": None, "bytes": 0}
+    cached = _cache_lookup(url, max_chars)
+    if cached and cached["fresh"]:
+        _record_scrape(url, domain, 0.0, stats, "ok" if cached["text"] else "short", cached["text"], "hit")
+        return cached["text"]
+    if domain_health.is_tripped(domain):
+        print(f"  [scraper] Skipping {url}: {domain} circuit open")
+        _record_scrape(url, domain, 0.0, stats, "skipped", None, "miss")
+        return None
+    start, text, error = time.monotonic(), None, None
+    try:
+        text = _fetch_text(url, max_chars, cached, domain_health.scrape_timeout(domain), stats)
+    except Exception as e:
+        error = e
         print(f"  [scraper] Could not fetch {url}: {e}")
+    seconds, outcome = time.monotonic() - start, _outcome(text, error)
+    domain_health.record(domain, seconds, outcome, len(text or ""))
+    _record_scrape(url, domain, seconds, stats, outcome, text, "revalidate" if cached else "miss")
+    return text
+
+
+async def _fetch_text_async(
+    client: httpx.AsyncClient, url: str, max_chars: int, cached: dict | None, timeout: float, stats: dict,
+) -> str | None:
+    """Async counterpart of _fetch_text. Blocking parse and cache work runs off the event loop."""
+    headers = scrape_cache.validators(cached)
+    if not SCRAPE_STREAMING:
+        response = await client.get(url, timeout=timeout, headers=headers)
+        stats["status"], stats["bytes"] = response.status_code, len(response.content)
+        if response.status_code == 304 and cached:
+            await asyncio.to_thread(_cache_revalidated, url)
+            return cached["text"]
+        response.raise_for_status()
+        pool = _get_parse_pool()
+        if _learning(_domain(url)):
+            text = await _parse_and_learn_async(response.text, url, max_chars)
+        elif pool is None:
+            text = await asyncio.to_thread(extract_text, response.text, url, max_chars)
+        else:
+            text = await asyncio.wrap_future(pool.submit(_parse_page, response.text, url, max_chars))
+        await asyncio.to_thread(_cache_store, url, text, max_chars, response.headers)
+        return text
+
+    async with client.stream("GET", url, timeout=timeout, headers=headers) as response:
+        stats["status"] = response.status_code
+        if response.status_code == 304 and cached:
+            await asyncio.to_thread(_cache_revalidated, url)
+            return cached["text"]
+        response.raise_for_status()
+        text = None
+        pool     = _get_parse_pool()
+        learning = _learning(_domain(url))
+        if _is_html(response.headers) and (pool is not None or learning):
+            page = bytearray()
+            async for chunk in response.aiter_bytes(_CHUNK_BYTES):
+                page += chunk[:SCRAPE_MAX_BYTES - len(page)]
+                if len(page) >= SCRAPE_MAX_BYTES:
+                    break
+            stats["bytes"] = len(page)
+            if learning:
+                text = await _parse_and_learn_async(bytes(page), url, max_chars, _charset(response.headers))
+            else:
+                text = await asyncio.wrap_future(
+                    pool.submit(_parse_page, bytes(page), url, max_chars, _charset(response.headers))
+                )
+        elif _is_html(response.headers):
+            extractor = _StreamingExtractor(url, max_chars, encoding=_charset(response.headers))
+            remaining = SCRAPE_MAX_BYTES
+            async for chunk in response.aiter_bytes(_CHUNK_BYTES):
+                chunk = chunk[:remaining]
+                remaining -= len(chunk)
+                stats["bytes"] += len(chunk)
+                # feed() runs lxml's parser: keep it off the event loop
+                if await asyncio.to_thread(extractor.feed, chunk) or remaining <= 0:
+                    break
+            text = await asyncio.to_thread(extractor.result)
+    await asyncio.to_thread(_cache_store, url, text, max_chars, response.headers)
+    return text
+
+
+async def scrape_article_async(client: httpx.AsyncClient, url: str, max_chars: int = 3000) -> str | None:
+    """scrape_article on a shared async client."""
+    domain = _domain(url)
+    stats  = {"status": None, "bytes": 0}
+    cached = await asyncio.to_thread(_cache_lookup, url, max_chars)
+    if cached and cached["fresh"]:
+        _record_scrape(url, domain, 0.0, stats, "ok" if cached["text"] else "short", cached["text"], "hit")
+        return cached["text"]
+    if domain_health.is_tripped(domain):
+        print(f"  [scraper] Skipping {url}: {domain} circuit open")
+        _record_scrape(url, domain, 0.0, stats, "skipped", None, "miss")
         return None
+    start, text, error = time.monotonic(), None, None
+    try:
+        text = await _fetch_text_async(client, url, max_chars, cached, domain_health.scrape_timeout(domain), stats)
+    except Exception as e:
+        error = e
+        print(f"  [scraper] Could not fetch {url}: {e}")
+    seconds, outcome = time.monotonic() - start, _outcome(text, error)
+    domain_health.record(domain, seconds, outcome, len(text or ""))
+    _record_scrape(url, domain, seconds, stats, outcome, text, "revalidate" if cached else "miss")
+    return text
+
+
+def scrape_articles(urls: list[str], max_chars: int = 3000) -> dict[str, str | None]:
+    """
+    Scrape many URLs on a bounded thread pool. Returns {url: scrape_article(url)}.
+
+    At most SCRAPE_MAX_WORKERS requests run at once, and at most
+    SCRAPE_MAX_PER_DOMAIN against any single outlet. URLs are interleaved
+    by domain before submission so one outlet's backlog doesn't park
+    every worker on its semaphore.
+    """
+    by_domain: dict[str, list[str]] = {}
+    for url in dict.fromkeys(urls):
+        by_domain.setdefault(_domain(url), []).append(url)
+    if not by_domain:
+        return {}
+
+    ordered: list[str] = []
+    queues = list(by_domain.values())
+    while queues:
+        ordered.extend(q.pop(0) for q in queues)
+        queues = [q for q in queues if q]
+
+    limits = {d: threading.BoundedSemaphore(SCRAPE_MAX_PER_DOMAIN) for d in by_domain}
+
+    def _scrape(url: str) -> str | None:
+        with limits[_domain(url)]:
+            return scrape_article(url, max_chars=max_chars)
+
+    workers = max(1, min(SCRAPE_MAX_WORKERS, len(ordered)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_scrape, ordered))
+    domain_health.flush()
+    return dict(zip(ordered, results))
+
+
+async def scrape_articles_async(
+    client: httpx.AsyncClient,
+    urls: list[str],
+    max_chars: int = 3000,
+) -> dict[str, str | None]:
+    """Async counterpart of scrape_articles; the per-domain cap still applies."""
+    urls   = list(dict.fromkeys(urls))
+    limits = {d: asyncio.Semaphore(SCRAPE_MAX_PER_DOMAIN) for d in {_domain(u) for u in urls}}
+
+    async def _scrape(url: str) -> str | None:
+        async with limits[_domain(url)]:
+            return await scrape_article_async(client, url, max_chars=max_chars)
+
+    results = await asyncio.gather(*(_scrape(u) for u in urls))
+    await asyncio.to_thread(domain_health.flush)
+    return dict(zip(urls, results))
@@ -8,7 +8,13 @@ from datetime import date, timedelta
 from config import DIGEST_DIR, ARCHIVE_DIR
 
 
-def save_digest(digest: dict, market: dict, visual: dict | None = None) -> None:
+def save_digest(digest: dict, market: dict, visual: dict | None = None, en_pending: dict | None = None) -> None:
+    """
+    Write today's digest. en_pending marks an ES-first digest saved before
+    its English edition, and holds what the archive page needs besides the
+    digest (byline, secondary tickers); main.py's duplicate-run guard
+    finishes such a digest instead of skipping the day.
+    """
     os.makedirs(DIGEST_DIR, exist_ok=True)
     today = date.today().isoformat()
     path  = os.path.join(DIGEST_DIR, f"{today}.json")
@@ -31,6 +37,8 @@ def save_digest(digest: dict, market: dict, visual: dict | None = None) -> None:
     }
     if visual is not None:
         payload["visual"] = visual
+    if en_pending is not None:
+        payload["en_pending"] = en_pending
 
     with open(path, "w", encoding="utf-8") as f:
         json.dump(payload, f, ensure_ascii=False, indent=2)
@@ -92,7 +100,33 @@ def get_recent_urls(days: int = 5) -> set[str]:
     """
     Returns all article URLs that appeared in the last N digests.
     Used by the fetcher to skip stories already covered this week.
+
+    Served by an indexed lookup on the article store's selected flag.
+    digests/ stays the source of truth: the first call against a store
+    with no selections imports all of it, and later calls import any
+    digest in the window whose date has no selections in the store yet
+    (e.g. one committed by a workflow run on another machine). If the
+    store cannot be read, the digests are scanned directly instead.
     """
+    import sqlite3
+    import article_store
+    try:
+        if not article_store.has_selections():
+            article_store.backfill_from_digests()
+        else:
+            today  = date.today()
+            window = {(today - timedelta(days=i)).isoformat() for i in range(1, days + 1)}
+            missing = window - article_store.selected_dates(min(window))
+            if missing:
+                article_store.backfill_from_digests(dates=missing)
+        return article_store.recent_selected_urls(days)
+    except sqlite3.Error as e:
+        print(f"  [store] Article store unavailable, reading digests/ instead (non-fatal): {e}")
+        return _digest_urls(days)
+
+
+def _digest_urls(days: int) -> set[str]:
+    """Story URLs of the last N digests, read from digests/."""
     urls  = set()
     today = date.today()
     for i in range(1, days + 1):
@@ -0,0 +1,198 @@
+# ─────────────────────────────────────────────
+#  story_index.py  —  Cross-day similarity index of covered stories
+#
+#  URL dedup (storage.get_recent_urls) misses the same event reported
+#  under a new URL. Every article Claude picks is stored here as a
+#  hashed bag-of-words vector of its headline (weighted double) and
+#  body: unigrams, sublinear term frequency, DIM buckets (crc32, so
+#  vectors are stable across processes), L2-normalized.
+#
+#  rank_articles() calls max_similarity() with the whole candidate list.
+#  The stories of issues dated in the last STORY_DEDUP_DAYS calendar
+#  days (today excluded) are loaded as one matrix. Candidates are
+#  vectorized a block at a time (word counts per article in Counter, each
+#  distinct word filtered and hashed once per block, the matrix built
+#  with one np.bincount), and one
+#  matrix product per block gives each candidate's cosine to its
+#  closest covered story. Candidates at STORY_DEDUP_THRESHOLD or above
+#  are demoted or dropped (see config).
+#
+#  main.py adds each issue's picks after saving the digest: the fetched
+#  article, or the digest story itself when no fetched URL matches. An empty
+#  index is backfilled from the article store's selected rows on first use.
+#
+#  CLI (run from bot/):
+#    python story_index.py --backfill
+#
+#  Default DB path: data/story_index.db (repo root).
+#  Override with STORY_INDEX_DB, or pass db_path for tests.
+# ─────────────────────────────────────────────
+
+import argparse
+import os
+import re
+import sqlite3
+import zlib
+from collections import Counter
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from config import STORY_DEDUP_DAYS
+
+DIM    = 4096
+_BLOCK = 512    # candidates vectorized per matrix product
+
+_DEFAULT_DB = os.path.join(
+    os.path.dirname(__file__), "..", "data", "story_index.db"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stories (
+    url         TEXT PRIMARY KEY,
+    title       TEXT NOT NULL,
+    issue_date  TEXT NOT NULL,
+    vector      BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_stories_issue ON stories (issue_date);
+"""
+
+_WORDS = re.compile(r"\w+", re.UNICODE)
+
+# Function words that would otherwise dominate every vector
+_STOPWORDS = frozenset("""
+    que los las del por para con una uno como más sus sobre este esta entre desde pero sin han
+    fue ser son tras ante hasta según cuando también donde porque está están muy ya
+    the and for that with from this are was has have its will into after over said says than
+    their been not but they which who more also year
+""".split())
+
+
+def _words(text: str) -> List[str]:
+    """_WORDS.findall(text), splitting on whitespace first: most tokens are whole words already."""
+    words: List[str] = []
+    for token in text.split():
+        if token.isalnum():               # same characters as \w, minus "_"
+            words.append(token)
+        else:
+            words.extend(_WORDS.findall(token))
+    return words
+
+
+def _kept(word: str) -> bool:
+    return len(word) >= 3 and word not in _STOPWORDS and not word.isdigit()
+
+
+def vectorize_many(articles: List[Dict]) -> np.ndarray:
+    """(n, DIM) matrix of unit-length hashed bag-of-words vectors of the articles' headline and body."""
+    words: List[str] = []
+    counts: List[int] = []
+    lengths = []                      # distinct words per article
+    for article in articles:
+        bag = Counter(_words((article.get("content") or "").lower()))
+        title = _words((article.get("title") or "").lower())
+        bag.update(title)
+        bag.update(title)             # headline words count double
+        words.extend(bag)
+        counts.extend(bag.values())
+        lengths.append(len(bag))
+    if not words:
+        return np.zeros((len(articles), DIM), dtype=np.float32)
+
+    # Filter and hash each distinct word once; -1 marks words that are skipped
+    bucket_of = {w: zlib.crc32(w.encode("utf-8")) % DIM if _kept(w) else -1 for w in dict.fromkeys(words)}
+    buckets = np.fromiter(map(bucket_of.__getitem__, words), dtype=np.int64, count=len(words))
+    tf      = 1 + np.log(np.fromiter(counts, dtype=np.float64, count=len(counts)))
+    rows    = np.repeat(np.arange(len(articles)), lengths)
+    mask    = buckets >= 0
+    matrix  = np.bincount(
+        rows[mask] * DIM + buckets[mask], weights=tf[mask], minlength=len(articles) * DIM,
+    ).reshape(len(articles), DIM).astype(np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=matrix, where=norms > 0)
+
+
+def vectorize(article: Dict) -> np.ndarray:
+    """Unit-length hashed bag-of-words vector of an article's headline and body."""
+    return vectorize_many([article])[0]
+
+
+def _resolve_path(db_path: Optional[str]) -> str:
+    path = (db_path or "").strip() or os.environ.get("STORY_INDEX_DB", _DEFAULT_DB)
+    parent = os.path.dirname(os.path.abspath(path))
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    return path
+
+
+def _connect(db_path: Optional[str]) -> sqlite3.Connection:
+    conn = sqlite3.connect(_resolve_path(db_path), timeout=10)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def add_stories(articles: List[Dict], issue_date: str, db_path: Optional[str] = None) -> int:
+    """Index the articles picked for the issue of issue_date (YYYY-MM-DD). Returns how many were stored."""
+    articles = [a for a in articles if a.get("url")]
+    rows = [
+        (a["url"], a.get("title", ""), issue_date, vec.tobytes())
+        for a, vec in zip(articles, vectorize_many(articles))
+    ]
+    with _connect(db_path) as conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO stories (url, title, issue_date, vector) VALUES (?,?,?,?)", rows,
+        )
+    return len(rows)
+
+
+def backfill_from_store(db_path: Optional[str] = None) -> int:
+    """Index every article the article store has marked as selected."""
+    import article_store
+    by_date: Dict[str, List[Dict]] = {}
+    for article in article_store.selected_articles():
+        by_date.setdefault(article["selected_on"], []).append(article)
+    return sum(add_stories(arts, day, db_path) for day, arts in by_date.items())
+
+
+def _window(days: int, today: date, db_path: Optional[str]) -> np.ndarray:
+    """(n, DIM) matrix of stories from issues dated in the `days` calendar days before today."""
+    since = (today - timedelta(days=days)).isoformat()
+    with _connect(db_path) as conn:
+        empty = conn.execute("SELECT 1 FROM stories LIMIT 1").fetchone() is None
+    if empty:
+        backfill_from_store(db_path)
+    with _connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT vector FROM stories WHERE issue_date >= ? AND issue_date < ?",
+            (since, today.isoformat()),
+        ).fetchall()
+    if not rows:
+        return np.zeros((0, DIM), dtype=np.float32)
+    return np.frombuffer(b"".join(v for (v,) in rows), dtype=np.float32).reshape(len(rows), DIM)
+
+
+def max_similarity(
+    articles: List[Dict],
+    days: int = STORY_DEDUP_DAYS,
+    today: Optional[date] = None,
+    db_path: Optional[str] = None,
+) -> np.ndarray:
+    """Each article's cosine similarity to its closest story from the last `days` days of issues (0 if none)."""
+    covered = _window(days, today or date.today(), db_path)
+    if not len(covered) or not articles:
+        return np.zeros(len(articles))
+    best = np.empty(len(articles))
+    for i in range(0, len(articles), _BLOCK):      # bounded memory for large pools
+        block = vectorize_many(articles[i:i + _BLOCK])
+        best[i:i + _BLOCK] = (block @ covered.T).max(axis=1)
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Story similarity index maintenance")
+    parser.add_argument("--backfill", action="store_true", help="Index the article store's selected articles")
+    args = parser.parse_args()
+
+    if args.backfill:
+        print(f"Indexed {backfill_from_store()} selected articles")
@@ -1,129 +1,284 @@
 # ─────────────────────────────────────────────
 #  summarizer.py  —  Claude generates digest
+#
+#  Request layout (prompt caching): the static instructions (voice, JSON
+#  schema, rules) are the system block, and the per-run material
+#  (recurring thread tags + articles) is the user message. The one cache
+#  breakpoint sits after the articles, so the whole prefix is written
+#  once per run and read back by the calls that resend it within the
+#  5-minute cache lifetime: the JSON-repair call, stream restarts and
+#  overload retries. The bot runs once a day, so nothing is shared
+#  between runs; the instructions alone (the ES-only ones in
+#  particular) are also under the model's minimum cacheable length.
+#  Translation calls use their own short prompt and are not cached.
+#  Cache writes/reads are logged per call.
+#
+#  SUMMARIZER_MODE=stream reads the digest as it is generated and runs
+#  it through json_stream.JsonStreamChecker. A reply that stops being a
+#  possible digest (broken syntax, wrong top-level keys) is
+#  abandoned on the spot and requested again, instead of being found
+#  after the full reply by clean_and_parse. Time to the first closed
+#  es story is logged.
+#
+#  SUMMARIZER_MODE=tool asks for the digest as a forced publish_digest
+#  tool call whose input schema is the es/en structure. The reply is
+#  already parsed, so there is no repair round-trip; it is checked
+#  against the schema locally, since the API does not enforce it.
+#
+#  ES-first (SUMMARIZER_TRANSLATE, summarize_news_es_first): Claude
+#  writes the "es" block alone, and the "en" block is translated in the
+#  background by concurrent calls on TRANSLATION_MODEL, one per section
+#  (editor note, narrative thread, each story). Everything that is not
+#  prose (URLs, tags, sentiment, quote) is copied from "es", and the
+#  merge is checked before the "en" block is handed back.
+#
+#  Article text is fitted to SUMMARIZER_ARTICLE_TOKENS by token_budget
+#  before the prompt is built, and each digest call logs the planned
+#  prompt size against the input tokens actually billed.
 # ─────────────────────────────────────────────
+import copy
 import json
 import re
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 import anthropic
-from config import ANTHROPIC_API_KEY
+from config import (
+    ANTHROPIC_API_KEY, SUMMARIZER_MODE, SUMMARIZER_MODEL, SUMMARIZER_STREAM_RETRIES,
+    TRANSLATION_MODEL, TRANSLATION_MAX_WORKERS,
+)
+from json_stream import Divergence, JsonStreamChecker
+import token_budget
 
 client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
 
-def summarize_news(articles: list[dict], active_threads: list[str] | None = None) -> dict:
-    """
-    Sends articles to Claude and returns a bilingual digest dict with:
-    - "es": { editor_note, sentiment, stories, quote }  <- Spanish (primary)
-    - "en": { editor_note, sentiment, stories, quote }  <- English translation
-    """
-    active_threads = active_threads or []
-    thread_context = ""
-    if active_threads:
-        tags_str = ", ".join(f'"{t}"' for t in active_threads)
-        thread_context = f"\nLos siguientes temas han aparecido recurrentemente esta semana: {tags_str}. Si una historia continúa alguno de estos temas, usa el mismo tag exacto en el campo thread_tag.\n"
+# Every call's usage row (_log_usage), in order, for planned-vs-billed reporting
+usage_log: list[dict] = []
 
-    parts = []
-    for i, a in enumerate(articles, 1):
-        parts.append(f"{i}. [{a['source']}] {a['title']}\nURL: {a['url']}\n{a['content']}\n\n")
-    news_text = "".join(parts)
+_MAX_TOKENS = 8000
+
+# Identical on every call — keep anything run-specific out of it, or the
+# cached prefix stops matching. Assembled from parts so the ES-first mode
+# (SUMMARIZER_TRANSLATE) can ask for the "es" block alone.
+_INTRO = """Eres un editor de noticias financieras produciendo un briefing matutino diario para una audiencia hispanohablante sofisticada. Voz: directa, seca, ocasionalmente sardónica — como un editor de mercados veterano que ha visto cada ciclo y encuentra el actual tanto alarmante como vagamente entretenido.
+
+Analiza los artículos del mensaje del usuario y devuelve un objeto JSON con EXACTAMENTE esta estructura:
 
-    prompt = f"""Eres un editor de noticias financieras produciendo un briefing matutino diario para una audiencia hispanohablante sofisticada. Voz: directa, seca, ocasionalmente sardónica — como un editor de mercados veterano que ha visto cada ciclo y encuentra el actual tanto alarmante como vagamente entretenido.
-{thread_context}
-Analiza los artículos a continuación y devuelve un objeto JSON con EXACTAMENTE esta estructura:
+"""
 
-{{
-  "es": {{
+_ES_SCHEMA = """  "es": {
     "editor_note": "2-3 oraciones abriendo el briefing del día. Siempre abre con 'Estimados humanos,' como las primeras dos palabras. Voz: directa, seca, ocasionalmente sardónica. Referencia la historia dominante. Primera persona. NO incluyas firma — se agrega por separado. Sin relleno.",
 
     "narrative_thread": "Una oración en español describiendo el tema macro dominante del día — el hilo conductor que conecta las historias más importantes.",
 
-    "sentiment": {{
+    "sentiment": {
       "label_es": "Aversión al Riesgo" | "Cauteloso" | "Apetito por Riesgo",
       "label_en": "Risk-Off" | "Cautious" | "Risk-On",
       "position": <entero 5-95 donde 5=aversión extrema, 50=neutral, 95=apetito extremo>,
       "context_es": "Una oración explicando el sentimiento de hoy en español.",
       "context_en": "One sentence explaining today's sentiment in English."
-    }},
+    },
 
     "stories": [
-      {{
+      {
         "source": "Nombre de la fuente",
         "headline": "Titular conciso y específico en español",
         "body": "Exactamente dos oraciones en español. Primera oración: hecho concreto — qué ocurrió, con un número o nombre específico. Segunda oración: qué significa — quién gana, quién pierde, o qué hay que observar a continuación. Sin resúmenes de agencia.",
         "url": "URL original del artículo",
         "tag": "Uno de: Macro | FX | México | Comercio | Tasas | Mercados | Energía | Política",
-        "context_note": {{
+        "context_note": {
           "es": "Una oración explicando por qué esta historia importa HOY — conecta con condiciones de mercado actuales, datos recientes, o eventos de la semana.",
           "en": "One sentence explaining why this story matters TODAY — connect to current market conditions, recent data, or this week's events."
-        }},
+        },
         "thread_tag": "Si esta historia continúa un tema recurrente de la semana, escribe el tag exacto (e.g. 'Banxico: tasa'). Si es independiente, escribe null."
-      }}
+      }
     ],
 
-    "quote": {{
+    "quote": {
       "text": "Una cita financiera o económica relevante que conecte temáticamente con las noticias de hoy. Debe ser real y verificable. Puede estar en español o inglés.",
       "attribution": "Nombre completo, fuente, año"
-    }}
-  }},
+    }
+  }"""
 
-  "en": {{
+_EN_SCHEMA = """  "en": {
     "editor_note": "Faithful English translation of the editor_note above. Keep the same voice and tone.",
 
     "narrative_thread": "Faithful English translation of the narrative_thread above.",
 
-    "sentiment": {{
+    "sentiment": {
       "label_es": "<same as above>",
       "label_en": "<same as above>",
       "position": <same integer as above>,
       "context_es": "<same as above>",
       "context_en": "<same as above>"
-    }},
+    },
 
     "stories": [
-      {{
+      {
         "source": "Same source name",
         "headline": "Faithful English translation of the headline",
         "body": "Faithful English translation of the body",
         "url": "Same original URL",
         "tag": "Same tag",
-        "context_note": {{
+        "context_note": {
           "es": "<same as above>",
           "en": "Faithful English translation of context_note"
-        }},
+        },
         "thread_tag": "<same as above or null>"
-      }}
+      }
     ],
 
-    "quote": {{
+    "quote": {
       "text": "<same quote as above>",
       "attribution": "<same attribution as above>"
-    }}
-  }}
-}}
+    }
+  }"""
 
-Reglas:
+_RULES = """Reglas:
 - Selecciona 5-7 historias, ordenadas por importancia
 - Diversidad temática obligatoria: cada historia debe cubrir un tema distinto. Si varios artículos tratan el mismo evento o tema central (e.g. múltiples artículos sobre el conflicto Irán/petróleo, o sobre aranceles Trump), selecciona SOLO el más completo e informativo — descarta los demás sin excepción
 - Nunca incluyas dos historias donde la pregunta central sea la misma, aunque provengan de fuentes distintas o tengan ángulos ligeramente diferentes
 - stories debe incluir la URL original de la lista de artículos
 - Responde ÚNICAMENTE con el objeto JSON, sin preámbulo, sin markdown fences
 - sentiment.position debe ser consistente con el label: Aversión al Riesgo = 5-35, Cauteloso = 36-64, Apetito por Riesgo = 65-95
-- El bloque "en" es una traducción fiel del bloque "es" — mismas historias, mismas URLs, mismo sentimiento
 - context_note debe ser sustantivo: no repitas el cuerpo de la historia, aporta contexto nuevo
 - thread_tag debe ser null si la historia es independiente; solo usa tags de la lista de temas recurrentes si aplica
+"""
+
+_EN_RULE = """- El bloque "en" es una traducción fiel del bloque "es" — mismas historias, mismas URLs, mismo sentimiento
+"""
+
+_INSTRUCTIONS    = f"{_INTRO}{{\n{_ES_SCHEMA},\n\n{_EN_SCHEMA}\n}}\n\n{_RULES}{_EN_RULE}"
+_INSTRUCTIONS_ES = f"{_INTRO}{{\n{_ES_SCHEMA}\n}}\n\n{_RULES}"
+
+_REPAIR_REQUEST = "Tu respuesta anterior contiene JSON malformado. Devuelve exactamente el mismo contenido pero como JSON válido y bien escapado. Sin preámbulo, sin markdown fences."
+
+_CACHED = {"type": "ephemeral"}
+
+# SUMMARIZER_MODE=tool: the digest comes back as the input of this tool, already
+# parsed, so no repair call is needed. The schema steers generation but the API
+# does not enforce it (no strict tool use), so _schema_errors checks the input.
+_TAGS = ["Macro", "FX", "México", "Comercio", "Tasas", "Mercados", "Energía", "Política"]
+_TEXT = {"type": "string"}
+
 
-Artículos:
-{news_text}
+def _object(**properties) -> dict:
+    return {"type": "object", "properties": properties, "required": list(properties)}
+
+
+_JSON_TYPES = {"object": dict, "array": list, "string": str, "integer": int, "null": type(None)}
+
+
+def _schema_errors(value, schema: dict, path: str = "digest") -> list[str]:
+    """Where value breaks schema (the subset the digest tool uses: types, required, enum, ranges)."""
+    types = schema.get("type")
+    types = types if isinstance(types, list) else [types]
+    if not any(isinstance(value, _JSON_TYPES[t]) and not (t == "integer" and isinstance(value, bool))
+               for t in types):
+        return [f"{path}: expected {' or '.join(types)}, got {type(value).__name__}"]
+    errors = []
+    if "enum" in schema and value not in schema["enum"]:
+        errors.append(f"{path}: {value!r} not one of {schema['enum']}")
+    if isinstance(value, int) and not schema.get("minimum", value) <= value <= schema.get("maximum", value):
+        errors.append(f"{path}: {value} out of range {schema['minimum']}-{schema['maximum']}")
+    if isinstance(value, dict):
+        for key in schema.get("required", []):
+            if key not in value:
+                errors.append(f"{path}.{key}: missing")
+            else:
+                errors.extend(_schema_errors(value[key], schema["properties"][key], f"{path}.{key}"))
+    if isinstance(value, list):
+        if len(value) < schema.get("minItems", 0):
+            errors.append(f"{path}: fewer than {schema['minItems']} items")
+        for i, item in enumerate(value):
+            errors.extend(_schema_errors(item, schema["items"], f"{path}[{i}]"))
+    return errors
+
+
+_STORY_SCHEMA = _object(
+    source=_TEXT,
+    headline=_TEXT,
+    body=_TEXT,
+    url=_TEXT,
+    tag={"type": "string", "enum": _TAGS},
+    context_note=_object(es=_TEXT, en=_TEXT),
+    thread_tag={"type": ["string", "null"]},
+)
+_EDITION_SCHEMA = _object(
+    editor_note=_TEXT,
+    narrative_thread=_TEXT,
+    sentiment=_object(
+        label_es={"type": "string", "enum": ["Aversión al Riesgo", "Cauteloso", "Apetito por Riesgo"]},
+        label_en={"type": "string", "enum": ["Risk-Off", "Cautious", "Risk-On"]},
+        position={"type": "integer", "minimum": 5, "maximum": 95},
+        context_es=_TEXT,
+        context_en=_TEXT,
+    ),
+    stories={"type": "array", "items": _STORY_SCHEMA, "minItems": 1},
+    quote=_object(text=_TEXT, attribution=_TEXT),
+)
+_DIGEST_TOOL = {
+    "name": "publish_digest",
+    "description": "Publica el briefing del día: el bloque es y su traducción fiel en el bloque en.",
+    "input_schema": _object(es=_EDITION_SCHEMA, en=_EDITION_SCHEMA),
+}
+_DIGEST_TOOL_ES = {
+    "name": "publish_digest",
+    "description": "Publica el briefing del día: el bloque es.",
+    "input_schema": _object(es=_EDITION_SCHEMA),
+}
+
+# ES-first translation calls. Each gets a JSON object of Spanish fields and
+# must return the same keys in English.
+_TRANSLATE_MAX_TOKENS  = 1500
+_TRANSLATE_INSTRUCTIONS = """You translate sections of a Spanish-language financial morning briefing into English for the archive edition.
+
+The user message is a JSON object whose values are Spanish text. Return a JSON object with exactly the same keys, each value a faithful English translation.
+
+- Keep the voice: direct, dry, occasionally sardonic. Do not soften or embellish.
+- "Estimados humanos," becomes "Dear humans,".
+- Keep figures, names, tickers, currencies and dates exactly as written.
+- Respond ONLY with the JSON object, no preamble, no markdown fences.
 """
 
-    print("  [summarizer] Sending to Claude (bilingual)...")
+
+def _system(instructions: str = _INSTRUCTIONS) -> list[dict]:
+    return [{"type": "text", "text": instructions}]
+
+
+def _user_content(articles: list[dict], active_threads: list[str]) -> list[dict]:
+    """The per-run part of the prompt: recurring thread tags, then the articles (the cache breakpoint)."""
+    thread_context = ""
+    if active_threads:
+        tags_str = ", ".join(f'"{t}"' for t in active_threads)
+        thread_context = f"Los siguientes temas han aparecido recurrentemente esta semana: {tags_str}. Si una historia continúa alguno de estos temas, usa el mismo tag exacto en el campo thread_tag.\n\n"
+
+    parts = []
+    for i, a in enumerate(articles, 1):
+        parts.append(f"{i}. [{a['source']}] {a['title']}\nURL: {a['url']}\n{a['content']}\n\n")
+    news_text = "".join(parts)
+    return [{"type": "text", "text": f"{thread_context}Artículos:\n{news_text}", "cache_control": _CACHED}]
+
+
+def _log_usage(label: str, usage) -> dict:
+    """Print one call's token usage, cache writes and reads included, and return it."""
+    row = {
+        "call":        label,
+        "input":       usage.input_tokens,
+        "cache_write": getattr(usage, "cache_creation_input_tokens", 0) or 0,
+        "cache_read":  getattr(usage, "cache_read_input_tokens", 0) or 0,
+        "output":      usage.output_tokens,
+    }
+    print(f"  [summarizer] {label}: {row['input']} input + {row['cache_write']} cache write "
+          f"+ {row['cache_read']} cache read tokens, {row['output']} output")
+    usage_log.append(row)
+    return row
+
+
+def _retrying(call):
+    """Run call(), retrying while the API is overloaded."""
     for attempt in range(4):
         try:
-            message = client.messages.create(
-                model="claude-sonnet-4-6",
-                max_tokens=8000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            break
+            return call()
         except Exception as e:
             if "overloaded" in str(e).lower() and attempt < 3:
                 wait = 30 * (attempt + 1)
@@ -132,45 +287,271 @@ Artículos:
             else:
                 raise
 
-    def clean_and_parse(text: str) -> dict:
-        """Strip markdown fences and parse JSON, raising JSONDecodeError on failure."""
-        text = text.strip()
-        # Strip markdown fences
-        if text.startswith("```"):
-            text = text.split("\n", 1)[1]
-            text = text.rsplit("```", 1)[0].strip()
-        # Trim anything before the first '{' or after the last '}'
-        start = text.find("{")
-        end   = text.rfind("}")
-        if start != -1 and end != -1:
-            text = text[start:end+1]
-        return json.loads(text)
+
+def _create(
+    label: str,
+    messages: list[dict],
+    system: list[dict] | None = None,
+    model: str = SUMMARIZER_MODEL,
+    max_tokens: int = _MAX_TOKENS,
+    **params,
+):
+    """messages.create, retrying while the API is overloaded."""
+    message = _retrying(lambda: client.messages.create(
+        model=model,
+        max_tokens=max_tokens,
+        system=system or _system(),
+        messages=messages,
+        **params,
+    ))
+    _log_usage(label, message.usage)
+    return message
+
+
+def _stream_once(
+    label: str, messages: list[dict], system: list[dict], abort: bool,
+) -> tuple[str, Divergence | None]:
+    """
+    Stream one reply through JsonStreamChecker. With abort, stops reading
+    at the first divergence and returns it; otherwise the divergence is
+    only logged and the full text is returned for clean_and_parse.
+    """
+    checker  = JsonStreamChecker()
+    parts    = []
+    diverged = None
+    start    = time.perf_counter()
+    with client.messages.stream(
+        model=SUMMARIZER_MODEL,
+        max_tokens=_MAX_TOKENS,
+        system=system,
+        messages=messages,
+    ) as stream:
+        for text in stream.text_stream:
+            parts.append(text)
+            if diverged:
+                continue
+            stories = checker.stories
+            try:
+                checker.feed(text)
+            except Divergence as e:
+                diverged = e
+                print(f"  [summarizer] Reply diverged after {time.perf_counter() - start:.1f}s: {e}")
+                if abort:
+                    _log_usage(f"{label} (aborted)", stream.current_message_snapshot.usage)
+                    return "".join(parts), diverged
+                continue
+            if checker.stories and not stories:
+                print(f"  [summarizer] First story after {time.perf_counter() - start:.1f}s")
+        message = stream.get_final_message()
+    print(f"  [summarizer] Reply complete after {time.perf_counter() - start:.1f}s")
+    _log_usage(label, message.usage)
+    return "".join(parts), None
+
+
+def _stream(label: str, messages: list[dict], system: list[dict]) -> str:
+    """Streamed reply text; a diverging reply is re-requested up to SUMMARIZER_STREAM_RETRIES times."""
+    for attempt in range(SUMMARIZER_STREAM_RETRIES + 1):
+        last = attempt == SUMMARIZER_STREAM_RETRIES
+        text, diverged = _retrying(lambda: _stream_once(label, messages, system, abort=not last))
+        if not diverged:
+            return text
+        print(f"  [summarizer] Re-requesting (attempt {attempt + 2}/{SUMMARIZER_STREAM_RETRIES + 1})...")
+    return text
+
+
+def clean_and_parse(text: str) -> dict:
+    """Strip markdown fences and parse JSON, raising JSONDecodeError on failure."""
+    text = text.strip()
+    # Strip markdown fences
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1]
+        text = text.rsplit("```", 1)[0].strip()
+    # Trim anything before the first '{' or after the last '}'
+    start = text.find("{")
+    end   = text.rfind("}")
+    if start != -1 and end != -1:
+        text = text[start:end+1]
+    return json.loads(text)
+
+
+def _text_digest(request: list[dict], system: list[dict]) -> dict:
+    """Digest from a free-text JSON reply (batch or stream), with one repair call if it does not parse."""
+    if SUMMARIZER_MODE == "stream":
+        print("  [summarizer] Streaming from Claude (bilingual)...")
+        raw = _stream("digest", request, system).strip()
+    else:
+        print("  [summarizer] Sending to Claude (bilingual)...")
+        raw = _create("digest", request, system).content[0].text.strip()
 
     # Try to parse; if malformed, re-ask Claude once with a repair prompt
-    raw = message.content[0].text.strip()
     for parse_attempt in range(2):
         try:
-            digest = clean_and_parse(raw)
-            break
+            return clean_and_parse(raw)
         except json.JSONDecodeError as e:
             if parse_attempt == 0:
                 print(f"  [summarizer] JSON parse failed ({e}), asking Claude to repair...")
-                repair_message = client.messages.create(
-                    model="claude-sonnet-4-6",
-                    max_tokens=8000,
-                    messages=[
-                        {"role": "user",    "content": prompt},
-                        {"role": "assistant", "content": raw},
-                        {"role": "user",    "content": "Tu respuesta anterior contiene JSON malformado. Devuelve exactamente el mismo contenido pero como JSON válido y bien escapado. Sin preámbulo, sin markdown fences."},
-                    ]
-                )
+                repair_message = _create("repair", request + [
+                    {"role": "assistant", "content": raw},
+                    {"role": "user",      "content": _REPAIR_REQUEST},
+                ], system)
                 raw = repair_message.content[0].text.strip()
             else:
                 raise ValueError(f"[summarizer] JSON malformado tras intento de reparación: {e}")
 
+
+def _tool_digest(request: list[dict], system: list[dict], tool: dict) -> dict:
+    """Digest as the input of a forced publish_digest tool call, checked against the tool's schema."""
+    print("  [summarizer] Sending to Claude (digest tool)...")
+    message = _create(
+        "digest", request, system,
+        tools=[tool],
+        tool_choice={"type": "tool", "name": tool["name"]},
+    )
+    for block in message.content:
+        if block.type == "tool_use" and block.name == tool["name"]:
+            if message.stop_reason == "max_tokens":
+                raise ValueError("[summarizer] Digest tool call cut off at max_tokens")
+            errors = _schema_errors(block.input, tool["input_schema"])
+            if errors:
+                raise ValueError(f"[summarizer] Digest tool input does not match the schema: {'; '.join(errors[:5])}")
+            return block.input
+    raise ValueError(f"[summarizer] No digest tool call in reply (stop_reason={message.stop_reason})")
+
+
+def _request(articles: list[dict], active_threads: list[str] | None) -> list[dict]:
+    """The digest request, with article text fitted to the token budget."""
+    articles, _ = token_budget.plan(articles)
+    return [{"role": "user", "content": _user_content(articles, active_threads or [])}]
+
+
+def _report_budget(planned: int, rows: list[dict]) -> None:
+    """Log the planned prompt size against what the last digest call was billed for."""
+    billed = [r for r in rows if r["call"] == "digest"]
+    if not billed or not planned:
+        return
+    actual = billed[-1]["input"] + billed[-1]["cache_write"] + billed[-1]["cache_read"]
+    print(f"  [budget] Prompt planned ~{planned} tokens, billed {actual} ({actual / planned - 1:+.0%})")
+
+
+def _generate(request: list[dict], instructions: str, tool: dict) -> dict:
+    """One digest in the configured SUMMARIZER_MODE."""
+    system  = _system(instructions)
+    planned = token_budget.count_tokens(instructions) + sum(
+        token_budget.count_tokens(block["text"]) for block in request[0]["content"]
+    )
+    if SUMMARIZER_MODE == "tool":
+        planned += token_budget.count_tokens(json.dumps(tool, ensure_ascii=False))
+    start = len(usage_log)
+    if SUMMARIZER_MODE == "tool":
+        digest = _tool_digest(request, system, tool)
+    else:
+        digest = _text_digest(request, system)
+    _report_budget(planned, usage_log[start:])
+    return digest
+
+
+# ── ES-first: background translation of the "en" block ──────
+
+def _translate_section(label: str, fields: dict) -> dict:
+    """English translation of a dict of Spanish strings (same keys), on TRANSLATION_MODEL."""
+    request = [{"role": "user", "content": json.dumps(fields, ensure_ascii=False)}]
+    system  = [{"type": "text", "text": _TRANSLATE_INSTRUCTIONS}]
+    for attempt in range(2):
+        message = _create(
+            f"translate {label}", request, system,
+            model=TRANSLATION_MODEL, max_tokens=_TRANSLATE_MAX_TOKENS,
+        )
+        try:
+            translated = clean_and_parse(message.content[0].text)
+        except json.JSONDecodeError as e:
+            problem = f"malformed JSON ({e})"
+        else:
+            if set(translated) == set(fields) and all(
+                isinstance(v, str) and v.strip() for v in translated.values()
+            ):
+                return translated
+            problem = f"keys {sorted(translated)} for {sorted(fields)}"
+        print(f"  [summarizer] Translation of {label} unusable: {problem}"
+              + (", retrying..." if attempt == 0 else ""))
+    raise ValueError(f"[summarizer] Could not translate {label}: {problem}")
+
+
+def _check_translation(es: dict, en: dict) -> None:
+    """Raise ValueError if the merged "en" block differs from "es" anywhere but the translated prose."""
+    if len(en.get("stories", [])) != len(es.get("stories", [])):
+        raise ValueError("[summarizer] Translated digest has a different number of stories")
+    for key in ("sentiment", "quote"):
+        if en.get(key) != es.get(key):
+            raise ValueError(f"[summarizer] Translated digest changed {key}")
+    for i, (s_es, s_en) in enumerate(zip(es["stories"], en["stories"]), 1):
+        for key in ("url", "tag", "thread_tag", "source", "context_note"):
+            if s_en.get(key) != s_es.get(key):
+                raise ValueError(f"[summarizer] Translated story {i} changed {key}")
+
+
+def translate_edition(es: dict) -> dict:
+    """
+    The "en" block for a Spanish edition: editor_note, narrative_thread and
+    each story's headline and body are translated concurrently; every
+    other field is copied.
+    """
+    sections = {
+        "editor_note":      {"editor_note": es.get("editor_note", "")},
+        "narrative_thread": {"narrative_thread": es.get("narrative_thread", "")},
+    }
+    for i, story in enumerate(es.get("stories", []), 1):
+        sections[f"story {i}"] = {"headline": story.get("headline", ""), "body": story.get("body", "")}
+    sections = {label: fields for label, fields in sections.items() if all(fields.values())}
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=TRANSLATION_MAX_WORKERS) as pool:
+        futures = {label: pool.submit(_translate_section, label, fields) for label, fields in sections.items()}
+        done    = {label: future.result() for label, future in futures.items()}
+
+    en = copy.deepcopy(es)
+    for label, fields in done.items():
+        if label.startswith("story "):
+            en["stories"][int(label.split()[1]) - 1].update(fields)
+        else:
+            en.update(fields)
+    _check_translation(es, en)
+    print(f"  [summarizer] Translated {len(done)} sections to English in {time.perf_counter() - start:.1f}s")
+    return en
+
+
+def summarize_news(articles: list[dict], active_threads: list[str] | None = None) -> dict:
+    """
+    Sends articles to Claude and returns a bilingual digest dict with:
+    - "es": { editor_note, sentiment, stories, quote }  <- Spanish (primary)
+    - "en": { editor_note, sentiment, stories, quote }  <- English translation
+    """
+    request = _request(articles, active_threads)
+    digest  = _generate(request, _INSTRUCTIONS, _DIGEST_TOOL)
+
     # Validate bilingual structure
     if "es" not in digest or "en" not in digest:
         raise ValueError(f"[summarizer] Missing bilingual keys. Got: {list(digest.keys())}")
 
     print(f"  [summarizer] Got {len(digest['es'].get('stories', []))} stories (ES+EN)")
     return digest
+
+
+def summarize_news_es_first(
+    articles: list[dict], active_threads: list[str] | None = None,
+) -> tuple[dict, Future]:
+    """
+    Has Claude write the Spanish edition only and returns it as {"es": ...}
+    at once, with a Future for the "en" block that translate_edition
+    fills in on a background thread.
+    """
+    request = _request(articles, active_threads)
+    digest  = _generate(request, _INSTRUCTIONS_ES, _DIGEST_TOOL_ES)
+    if "es" not in digest:
+        raise ValueError(f"[summarizer] Missing es block. Got: {list(digest.keys())}")
+    digest = {"es": digest["es"]}
+    print(f"  [summarizer] Got {len(digest['es'].get('stories', []))} stories (ES); translating EN in background")
+
+    translator = ThreadPoolExecutor(max_workers=1, thread_name_prefix="translate")
+    en_future  = translator.submit(translate_edition, digest["es"])
+    translator.shutdown(wait=False)
+    return digest, en_future
@@ -10,7 +10,7 @@
 # ─────────────────────────────────────────────
 
 import os
-import requests
+from utils import http
 
 _ENV = os.environ.get("ENVIRONMENT", "prod").lower()
 
@@ -51,7 +51,7 @@ def send_telegram_issue_notification(
     }
 
     try:
-        resp = requests.post(
+        resp = http.post(
             f"https://api.telegram.org/bot{token}/sendMessage",
             json=payload,
             timeout=10,
@@ -18,7 +18,7 @@ import os
 import pathlib
 import shutil
 
-import requests
+from utils import http
 
 from config import DIGEST_DIR, ARCHIVE_DIR
 from image_candidates import generate_image_candidates
@@ -51,7 +51,7 @@ def _save_offset(offset: int) -> None:
 
 def _answer_callback(token: str, callback_id: str, text: str = "") -> None:
     try:
-        requests.post(
+        http.post(
             f"https://api.telegram.org/bot{token}/answerCallbackQuery",
             json={"callback_query_id": callback_id, "text": text},
             timeout=5,
@@ -249,7 +249,7 @@ def process_telegram_updates() -> None:
     offset = _load_offset()
 
     try:
-        resp = requests.get(
+        resp = http.get(
             f"https://api.telegram.org/bot{token}/getUpdates",
             params={
                 "offset":          offset,
@@ -0,0 +1,119 @@
+# ─────────────────────────────────────────────
+#  token_budget.py  —  Input token planner for summarize_news
+#
+#  Articles reach Claude at up to MAX_ARTICLE_CHARS each, so the prompt
+#  grows with MAX_ARTICLES_FOR_CLAUDE and its size is only known from
+#  the bill. plan() holds the article text to SUMMARIZER_ARTICLE_TOKENS:
+#
+#    1. every article's content is counted with count_tokens()
+#    2. each gets min(its tokens, ARTICLE_MIN_TOKENS) up front
+#    3. the rest of the budget is shared in proportion to the article's
+#       scorer score (rank_articles sets "score"); an article that needs
+#       less than its share is capped, and the surplus goes round again
+#    4. content over its allowance is cut at the last sentence boundary
+#       that fits
+#
+#  count_tokens() runs locally (no tokenizer download, no API call): it
+#  counts letter runs, long words as several tokens, digit groups and
+#  punctuation, about 3.9 characters per token on the saved digests.
+#  Being an estimate, the summarizer logs the planned prompt size next
+#  to the tokens the API actually billed.
+# ─────────────────────────────────────────────
+
+import re
+
+from config import SUMMARIZER_ARTICLE_TOKENS, ARTICLE_MIN_TOKENS
+
+_PIECES    = re.compile(r"[^\W\d_]+|\d+|[^\w\s]", re.UNICODE)
+_SENTENCES = re.compile(r"(?<=[.!?…»\"”])\s+")
+
+
+def count_tokens(text: str) -> int:
+    """Estimated Claude tokens in text."""
+    n = 0
+    for piece in _PIECES.findall(text or ""):
+        if piece[0].isdigit():
+            n += (len(piece) + 2) // 3
+        elif piece[0].isalpha():
+            n += 1 + len(piece) // 6
+        else:
+            n += 1
+    return n
+
+
+def trim_to_tokens(text: str, budget: int) -> str:
+    """
+    The longest run of whole sentences from the start of text that fits
+    budget. If even the first sentence is over, it is cut at a word
+    boundary instead, so the article keeps its lead.
+    """
+    if count_tokens(text) <= budget:
+        return text
+    kept, used = [], 0
+    for sentence in _SENTENCES.split(text.strip()):
+        cost = count_tokens(sentence)
+        if used + cost > budget:
+            break
+        kept.append(sentence)
+        used += cost
+    if kept:
+        return " ".join(kept)
+    words = []
+    for word in text.split():
+        used += count_tokens(word)
+        if used > budget:
+            break
+        words.append(word)
+    return " ".join(words)
+
+
+def allocate(needs: list[int], weights: list[float], budget: int, floor: int = ARTICLE_MIN_TOKENS) -> list[int]:
+    """
+    Per-article token allowances summing to at most budget: the floor
+    first, then the remainder by weight, never above what an article
+    needs. Scored articles are served first; articles with no score
+    share whatever is left once those are capped, equally (and all
+    share equally when none has a score).
+    """
+    allowed = [min(need, floor) for need in needs]
+    left    = budget - sum(allowed)
+    if left < 0:                       # floor alone is over budget: scale it down
+        return [a * budget // sum(allowed) for a in allowed]
+    weights = [w if w and w > 0 else 0.0 for w in weights]
+    if not any(weights):
+        weights = [1.0] * len(needs)
+    open_ = {i for i, need in enumerate(needs) if need > allowed[i]}
+    while left > 0 and open_:
+        total = sum(weights[i] for i in open_)
+        share = {i: int(left * weights[i] / total) if total else left // len(open_) for i in open_}
+        if not any(share.values()):    # rounding leftovers: best-weighted article first
+            share[max(open_, key=lambda i: weights[i])] = left
+        for i, extra in share.items():
+            extra = min(extra, needs[i] - allowed[i])
+            allowed[i] += extra
+            left       -= extra
+        open_ = {i for i in open_ if needs[i] > allowed[i]}
+    return allowed
+
+
+def plan(articles: list[dict], budget: int = SUMMARIZER_ARTICLE_TOKENS) -> tuple[list[dict], int]:
+    """
+    Copies of articles with content trimmed to their allowance, and the
+    estimated article tokens after trimming. budget <= 0 leaves content
+    as is.
+    """
+    needs = [count_tokens(a.get("content") or "") for a in articles]
+    if budget <= 0 or sum(needs) <= budget:
+        return [dict(a) for a in articles], sum(needs)
+    allowed = allocate(needs, [a.get("score") or 0.0 for a in articles], budget)
+    planned, trimmed = [], 0
+    for article, need, allowance in zip(articles, needs, allowed):
+        article = dict(article)
+        if need > allowance:
+            article["content"] = trim_to_tokens(article.get("content") or "", allowance)
+            trimmed += 1
+        planned.append(article)
+    tokens = sum(count_tokens(a.get("content") or "") for a in planned)
+    print(f"  [budget] Article text {sum(needs)} → {tokens} tokens "
+          f"(budget {budget}, {trimmed}/{len(articles)} articles trimmed)")
+    return planned, tokens
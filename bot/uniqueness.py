@@ -0,0 +1,98 @@
+# ─────────────────────────────────────────────
+#  uniqueness.py  —  Greedy near-duplicate filter for ranked articles
+#
+#  rank_articles() walks candidates best-first and drops any whose
+#  headline shares UNIQUENESS_OVERLAP or more of its words with an
+#  already-accepted headline. The overlap is measured from the
+#  candidate's side (|candidate ∩ accepted| / |candidate|), so short
+#  headlines are filtered more aggressively than long ones. With
+#  UNIQUENESS_BODY_SHINGLES the same test also runs on body word
+#  3-shingles.
+#
+#  Comparing every candidate with every accepted article is quadratic.
+#  Instead, accepted token sets go into an inverted index, and each
+#  candidate probes it with prefix filtering: to reach the threshold it
+#  must share `need` of its n tokens. So any qualifying accepted article
+#  holds at least one of any n - need + 1 of those tokens. Only the
+#  postings of its n - need + 1 rarest tokens are read, and the few
+#  articles they name are then checked exactly. Selections are the same
+#  as the pairwise pass (bench/bench_uniqueness.py checks this on the
+#  saved digests).
+# ─────────────────────────────────────────────
+
+from config import UNIQUENESS_OVERLAP, UNIQUENESS_BODY_SHINGLES
+
+
+class _ContainmentIndex:
+    """Accepted token sets, queryable for "does any hold >= threshold of these tokens"."""
+
+    def __init__(self, threshold: float):
+        self.threshold = threshold
+        self._sets: list[set] = []
+        self._postings: dict[str, list[int]] = {}
+
+    def _needed(self, n: int) -> int:
+        """Smallest shared-token count k with k / n >= threshold (same float test as the pairwise pass)."""
+        need = max(int(self.threshold * n), 0)
+        while need > 0 and (need - 1) / n >= self.threshold:
+            need -= 1
+        while need <= n and need / n < self.threshold:
+            need += 1
+        return need
+
+    def overlaps(self, tokens: set) -> bool:
+        if not tokens or not self._sets:
+            return False
+        need = self._needed(len(tokens))
+        if need == 0:
+            return True
+        if need > len(tokens):
+            return False
+        postings = self._postings
+        probes = sorted(tokens, key=lambda t: len(postings.get(t, ())))[:len(tokens) - need + 1]
+        candidates = {i for t in probes for i in postings.get(t, ())}
+        return any(len(tokens & self._sets[i]) >= need for i in candidates)
+
+    def add(self, tokens: set) -> None:
+        i = len(self._sets)
+        self._sets.append(tokens)
+        for t in tokens:
+            self._postings.setdefault(t, []).append(i)
+
+
+def headline_words(article: dict) -> set:
+    return set(article.get("title", "").lower().split())
+
+
+def body_shingles(article: dict) -> set:
+    from fingerprint import _shingles
+    return set(_shingles(article.get("content") or ""))
+
+
+def filter_unique(
+    articles: list[dict],
+    limit: int,
+    threshold: float = UNIQUENESS_OVERLAP,
+    use_body: bool = UNIQUENESS_BODY_SHINGLES,
+) -> list[dict]:
+    """
+    Keep articles in order, skipping each one whose headline (and, with
+    use_body, body) overlaps an accepted one by threshold or more. Stops
+    at limit accepted.
+    """
+    headlines = _ContainmentIndex(threshold)
+    bodies    = _ContainmentIndex(threshold)
+    accepted: list[dict] = []
+    for article in articles:
+        words = headline_words(article)
+        if headlines.overlaps(words):
+            continue
+        shingles = body_shingles(article) if use_body else set()
+        if bodies.overlaps(shingles):
+            continue
+        accepted.append(article)
+        headlines.add(words)
+        bodies.add(shingles)
+        if len(accepted) >= limit:
+            break
+    return accepted
@@ -0,0 +1,141 @@
+# ─────────────────────────────────────────────
+#  utils/http.py  —  Shared pooled HTTP session
+#
+#  Every outbound HTTP call in bot/ goes through get() / post() here
+#  so repeated calls to the same host (Yahoo Finance, Telegram,
+#  NewsAPI, news outlets) reuse keep-alive connections instead of
+#  paying a fresh TCP+TLS handshake each time.
+#
+#  Policy applied to every request:
+#    - one browser-like User-Agent (outlets and Yahoo reject bare clients)
+#    - DEFAULT_TIMEOUT when the caller doesn't pass one
+#    - idempotent requests (GET/HEAD) retried on connect errors and
+#      429/5xx with exponential backoff; POSTs are never retried
+#    - cookies are not persisted, so one outlet's paywall meter or
+#      session never leaks into the next request
+#  async_client() applies the same policy to the httpx engine.
+# ─────────────────────────────────────────────
+
+import asyncio
+import threading
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+DEFAULT_TIMEOUT  = 10   # seconds, when the caller passes none
+POOL_HOSTS       = 32   # distinct hosts kept warm
+POOL_PER_HOST    = 16   # keep-alive connections per host (>= scrape workers)
+RETRY_TOTAL      = 2
+RETRY_BACKOFF    = 0.5  # 0.5s, 1s, ...
+RETRY_STATUSES   = (429, 500, 502, 503, 504)
+
+_session: requests.Session | None = None
+_lock = threading.Lock()
+
+
+class _TimeoutAdapter(HTTPAdapter):
+    """HTTPAdapter that fills in DEFAULT_TIMEOUT for calls made without one."""
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = DEFAULT_TIMEOUT
+        return super().send(request, **kwargs)
+
+
+def _no_cookies() -> DefaultCookiePolicy:
+    return DefaultCookiePolicy(allowed_domains=[])
+
+
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=RETRY_TOTAL,
+        read=0,  # a read timeout already cost the full timeout; don't double it
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = _TimeoutAdapter(
+        pool_connections=POOL_HOSTS,
+        pool_maxsize=POOL_PER_HOST,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    session.cookies.set_policy(_no_cookies())
+    return session
+
+
+def get_session() -> requests.Session:
+    """The process-wide pooled session. Created on first use; thread-safe."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return get_session().get(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return get_session().post(url, **kwargs)
+
+
+class _AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """
+    Retries GET/HEAD on RETRY_STATUSES with exponential backoff (or the
+    server's Retry-After), like the session's Retry. Connect errors are
+    retried by the wrapped transport.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(RETRY_TOTAL + 1):
+            response = await self._transport.handle_async_request(request)
+            if (request.method not in ("GET", "HEAD") or response.status_code not in RETRY_STATUSES
+                    or attempt == RETRY_TOTAL):
+                return response
+            await response.aclose()
+            await asyncio.sleep(_retry_delay(response, attempt))
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    try:
+        return max(float(response.headers["Retry-After"]), 0.0)
+    except (KeyError, ValueError):
+        return RETRY_BACKOFF * 2 ** attempt
+
+
+def async_client(max_connections: int = 100) -> httpx.AsyncClient:
+    """An httpx.AsyncClient with the same User-Agent, timeout, retry and cookie policy."""
+    transport = httpx.AsyncHTTPTransport(
+        retries=RETRY_TOTAL,   # connect errors
+        limits=httpx.Limits(max_connections=max_connections),
+    )
+    return httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        transport=_AsyncRetryTransport(transport),
+        cookies=CookieJar(policy=_no_cookies()),
+        timeout=DEFAULT_TIMEOUT,
+        follow_redirects=True,
+    )
@@ -1,3 +1,49 @@
 # tests/conftest.py
 import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "bot"))
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_scrape_cache(tmp_path, monkeypatch):
+    """Keep scraper tests from reading or writing the real data/scrape_cache.db."""
+    monkeypatch.setenv("SCRAPE_CACHE_DB", str(tmp_path / "scrape_cache.db"))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_domain_health(tmp_path, monkeypatch):
+    """Fresh, throwaway per-domain scrape history for every test."""
+    import domain_health
+    monkeypatch.setenv("DOMAIN_HEALTH_DB", str(tmp_path / "domain_health.db"))
+    monkeypatch.setattr(domain_health, "_history", None)
+    monkeypatch.setattr(domain_health, "_pending", [])
+
+
+@pytest.fixture(autouse=True)
+def _isolated_article_store(tmp_path, monkeypatch):
+    """Keep tests away from the real data/article_store.db."""
+    monkeypatch.setenv("ARTICLE_STORE_DB", str(tmp_path / "article_store.db"))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_fetch_metrics(tmp_path, monkeypatch):
+    """Each test starts with no recorded fetch events and a throwaway run log."""
+    import fetch_metrics
+    monkeypatch.setenv("FETCH_METRICS_LOG", str(tmp_path / "fetch_metrics.jsonl"))
+    fetch_metrics.reset()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_learned_selectors(tmp_path, monkeypatch):
+    """No learned selectors carried in from the real data/learned_selectors.db."""
+    import learned_selectors
+    monkeypatch.setenv("LEARNED_SELECTORS_DB", str(tmp_path / "learned_selectors.db"))
+    monkeypatch.setattr(learned_selectors, "_learned", None)
+    monkeypatch.setattr(learned_selectors, "_observed", None)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_story_index(tmp_path, monkeypatch):
+    """Keep ranking tests away from the real data/story_index.db."""
+    monkeypatch.setenv("STORY_INDEX_DB", str(tmp_path / "story_index.db"))
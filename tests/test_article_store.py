@@ -0,0 +1,152 @@
+"""
+Tests for article_store.py and the prefetch pass
+
+Run from repo root:
+  pytest tests/test_article_store.py
+"""
+
+import time
+from unittest.mock import patch
+
+import article_store
+import prefetch
+
+
+def _article(url: str, title: str = "t") -> dict:
+    return {"title": title, "content": "body " + url, "source": "Reuters",
+            "url": url, "publishedAt": "2026-01-01T00:00:00Z"}
+
+
+def test_add_is_idempotent_and_pool_keeps_fetch_order():
+    assert article_store.add_articles([_article("a"), _article("b")]) == 2
+    assert article_store.add_articles([_article("b"), _article("c")]) == 1
+    pool = article_store.load_pool(hours=1, exclude_urls={"c"})
+    assert [a["url"] for a in pool] == ["a", "b"]
+    assert pool[0] == _article("a")
+    assert article_store.known_urls(hours=1) == {"a", "b", "c"}
+
+
+def test_pool_window_and_prune():
+    article_store.add_articles([_article("old")])
+    with article_store._connect(None) as conn:
+        conn.execute("UPDATE articles SET fetched_at = ?", (time.time() - 400 * 86400,))
+    article_store.add_articles([_article("new")])
+    assert [a["url"] for a in article_store.load_pool(hours=24)] == ["new"]
+    assert article_store.prune() == 1
+    assert article_store.known_urls(hours=24 * 365) == {"new"}
+
+
+def test_prefetch_pass_skips_pooled_and_recent_urls():
+    article_store.add_articles([_article("pooled")])
+    with patch.object(prefetch, "get_recent_urls", return_value={"recent"}), \
+         patch.object(prefetch, "fetch_news", return_value=[_article("fresh")]) as fetch:
+        assert prefetch.prefetch_once() == 1
+    assert fetch.call_args.kwargs["prior_urls"] == {"recent", "pooled"}
+    assert [a["url"] for a in article_store.load_pool(hours=1)] == ["pooled", "fresh"]
+
+
+def test_fts_search_ranks_matches():
+    article_store.add_articles([
+        {**_article("a", "Banxico recorta la tasa"), "content": "La junta de Banxico recortó la tasa de interés."},
+        {**_article("b", "Peso cae"), "content": "El peso cayó frente al dólar."},
+    ])
+    hits = article_store.search("banxico")
+    assert [h["url"] for h in hits] == ["a"]
+    assert hits[0]["selected_on"] is None
+    assert article_store.search("dólar")[0]["url"] == "b"
+
+
+def test_selected_urls_drive_cross_day_dedup():
+    from datetime import date
+    article_store.add_articles([_article("mon"), _article("tue"), _article("old"), _article("skip")])
+    article_store.mark_selected([{"url": "mon"}], "2026-04-06")
+    article_store.mark_selected([{"url": "tue"}], "2026-04-07")
+    article_store.mark_selected([{"url": "old"}], "2026-03-01")
+    assert article_store.recent_selected_urls(5, today=date(2026, 4, 8)) == {"mon", "tue"}
+    assert article_store.recent_selected_urls(5, today=date(2026, 4, 7)) == {"mon"}
+
+
+def test_mark_selected_inserts_stories_missing_from_the_store():
+    from datetime import date
+    article_store.add_articles([_article("fetched")])
+    stories = [{"url": "fetched", "headline": "h"},
+               {"url": "https://claude-rewrote.com/x", "headline": "Paro nacional",
+                "body": "Transportistas bloquean carreteras.", "source": "El Financiero"}]
+    assert article_store.mark_selected(stories, "2026-04-06") == 1
+    assert article_store.recent_selected_urls(5, today=date(2026, 4, 7)) == {"fetched", "https://claude-rewrote.com/x"}
+    assert article_store.search("transportistas")[0]["selected_on"] == "2026-04-06"
+    assert article_store.search("body")[0]["title"] == "t"      # existing row left as fetched
+
+
+def test_recent_urls_import_digests_missing_from_the_store(tmp_path):
+    import json
+    from datetime import date, timedelta
+    from functools import partial
+    import storage
+    digests = tmp_path / "digests"
+    digests.mkdir()
+    today = date.today()
+    article_store.add_articles([_article("local")])
+    article_store.mark_selected([{"url": "local"}], (today - timedelta(days=1)).isoformat())
+    # A digest committed elsewhere for a day this store never ran
+    story = {"headline": "Paro", "body": "b", "source": "s", "url": "https://x.com/remote"}
+    (digests / f"{today - timedelta(days=2)}.json").write_text(
+        json.dumps({"digest": {"es": {"stories": [story]}}}), encoding="utf-8")
+
+    backfill = partial(article_store.backfill_from_digests, str(digests))
+    with patch.object(article_store, "backfill_from_digests", backfill):
+        assert storage.get_recent_urls(5) == {"local", "https://x.com/remote"}
+
+
+def test_recent_urls_fall_back_to_digests_when_the_store_fails(tmp_path):
+    import json
+    import sqlite3
+    from datetime import date, timedelta
+    import storage
+    story = {"headline": "Paro", "url": "https://x.com/digest"}
+    (tmp_path / f"{date.today() - timedelta(days=1)}.json").write_text(
+        json.dumps({"digest": {"es": {"stories": [story]}}}), encoding="utf-8")
+
+    with patch.object(article_store, "has_selections", side_effect=sqlite3.OperationalError("locked")), \
+         patch.object(storage, "DIGEST_DIR", str(tmp_path)):
+        assert storage.get_recent_urls(5) == {"https://x.com/digest"}
+
+
+def test_run_ids_follow_latest_run():
+    article_store.add_articles([_article("a")], run_id="prefetch-1")
+    assert article_store.add_articles([_article("a"), _article("b")], run_id="2026-04-08") == 1
+    assert [a["url"] for a in article_store.load_run("2026-04-08")] == ["a", "b"]
+    assert article_store.load_run("prefetch-1") == []
+
+
+def test_backfill_imports_digest_stories(tmp_path):
+    import json
+    digests = tmp_path / "digests"
+    digests.mkdir()
+    story = {"headline": "Paro nacional", "body": "Transportistas bloquean carreteras.",
+             "source": "El Financiero", "url": "https://x.com/1"}
+    (digests / "2026-04-06.json").write_text(
+        json.dumps({"digest": {"es": {"stories": [story]}, "en": {"stories": []}}}), encoding="utf-8")
+    (digests / "notes.json").write_text("{}", encoding="utf-8")
+
+    assert article_store.backfill_from_digests(str(digests)) == 1
+    assert article_store.has_selections()
+    assert article_store.search("transportistas")[0]["selected_on"] == "2026-04-06"
+    assert article_store.load_pool(hours=1) == []  # dated to the issue, not to now
+
+
+def test_migrates_pool_only_database(tmp_path):
+    import sqlite3
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute("""CREATE TABLE articles (id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT NOT NULL UNIQUE,
+        title TEXT NOT NULL, source TEXT NOT NULL, published_at TEXT NOT NULL DEFAULT '',
+        content TEXT NOT NULL, score REAL NOT NULL DEFAULT 0, fetched_at REAL NOT NULL)""")
+    conn.execute("INSERT INTO articles (url, title, source, content, fetched_at) VALUES "
+                 "('u', 'Aranceles', 'Reuters', 'Nuevos aranceles al acero', ?)", (time.time(),))
+    conn.commit()
+    conn.close()
+
+    assert article_store.search("acero", db_path=path)[0]["url"] == "u"
+    article_store.mark_selected([{"url": "u"}], "2026-04-06", db_path=path)
+    assert article_store.has_selections(db_path=path)
@@ -0,0 +1,109 @@
+"""
+Tests for domain_health.py and the scraper's circuit breaker
+
+Run from repo root:
+  pytest tests/test_domain_health.py
+"""
+
+import time
+from unittest.mock import patch
+
+import requests
+
+import domain_health
+import scraper
+
+
+def test_unknown_domain_uses_default_timeout_and_is_open():
+    assert domain_health.scrape_timeout("new.com") == domain_health.SCRAPE_TIMEOUT
+    assert domain_health.is_tripped("new.com") is False
+
+
+def test_fast_domain_gets_shorter_timeout():
+    for _ in range(10):
+        domain_health.record("fast.com", 0.4, "ok", 3000)
+    assert domain_health.scrape_timeout("fast.com") == domain_health.SCRAPE_TIMEOUT_FLOOR
+
+
+def test_moderate_domain_timeout_tracks_p95():
+    for latency in [1, 2, 3, 4, 4]:
+        domain_health.record("mid.com", latency, "ok", 3000)
+    assert domain_health.scrape_timeout("mid.com") == 6.0
+
+
+def test_timing_out_domain_gets_floor():
+    for outcome in ["ok", "timeout", "ok", "timeout", "ok"]:
+        domain_health.record("slow.com", 7.5, outcome)
+    assert domain_health.scrape_timeout("slow.com") == domain_health.SCRAPE_TIMEOUT_FLOOR
+
+
+def test_breaker_trips_on_repeated_failures_and_probes_after_cooldown():
+    for outcome in ["short", "http_error", "timeout", "short", "short"]:
+        domain_health.record("dead.com", 1.0, outcome)
+    assert domain_health.is_tripped("dead.com") is True
+
+    later = time.time() + (domain_health.BREAKER_COOLDOWN_HOURS + 1) * 3600
+    with patch("domain_health.time.time", return_value=later):
+        assert domain_health.is_tripped("dead.com") is False
+
+
+def test_breaker_stays_closed_with_some_successes():
+    for outcome in ["ok", "short", "ok", "short", "timeout"]:
+        domain_health.record("mixed.com", 1.0, outcome)
+    assert domain_health.is_tripped("mixed.com") is False
+
+
+def test_breaker_judges_only_the_last_breaker_window_attempts():
+    for outcome in ["timeout"] * 5 + ["ok"] * 3:
+        domain_health.record("recovering.com", 1.0, outcome)
+    with patch("domain_health.BREAKER_WINDOW", 3):
+        assert domain_health.is_tripped("recovering.com") is False
+    for _ in range(4):
+        domain_health.record("recovering.com", 1.0, "timeout")
+    with patch("domain_health.BREAKER_WINDOW", 5):
+        assert domain_health.is_tripped("recovering.com") is True
+
+
+def test_history_persists_across_processes():
+    for _ in range(5):
+        domain_health.record("dead.com", 1.0, "timeout")
+    domain_health.flush()
+    domain_health._history = None  # as if a new run started
+    assert domain_health.is_tripped("dead.com") is True
+
+
+def test_flush_prunes_to_window():
+    with patch("domain_health.DOMAIN_HEALTH_WINDOW", 3):
+        for _ in range(5):
+            domain_health.record("x.com", 1.0, "ok")
+        domain_health.flush()
+        domain_health._history = None
+        assert len(domain_health._load()["x.com"]) == 3
+
+
+def test_report_flags_blocklist_candidates():
+    for _ in range(6):
+        domain_health.record("dead.com", 8.0, "timeout")
+        domain_health.record("good.com", 0.5, "ok", 3000)
+    rows = domain_health.build_report()
+    assert rows[0]["domain"] == "dead.com"
+    assert rows[0]["tripped"] is True
+    text = domain_health.format_report(rows)
+    assert "blocklist?" in text.splitlines()[1]
+
+
+def test_scraper_skips_tripped_domain_without_network():
+    for _ in range(5):
+        domain_health.record("dead.com", 8.0, "timeout")
+    with patch("scraper.http.get") as get:
+        assert scraper.scrape_article("https://dead.com/story") is None
+    get.assert_not_called()
+
+
+def test_scraper_records_outcomes():
+    with patch("scraper.http.get", side_effect=requests.Timeout("slow")):
+        scraper.scrape_article("https://slow.com/a")
+    with patch("scraper.http.get", side_effect=requests.HTTPError("403")):
+        scraper.scrape_article("https://paywall.com/a")
+    assert domain_health._load()["slow.com"][-1][2] == "timeout"
+    assert domain_health._load()["paywall.com"][-1][2] == "http_error"
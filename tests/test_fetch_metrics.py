@@ -0,0 +1,92 @@
+"""
+Tests for fetch_metrics.py and the fetcher/scraper instrumentation
+
+Run from repo root:
+  pytest tests/test_fetch_metrics.py
+"""
+
+import io
+import json
+from unittest.mock import patch
+
+import requests
+
+import fetch_metrics
+import fetcher
+import scraper
+
+HTML = "<html><body><p>" + "Texto del artículo completo. " * 10 + "</p></body></html>"
+
+
+def _raw(url, source, title="Headline", description="desc"):
+    return {"url": url, "title": title, "description": description,
+            "source": {"name": source}, "publishedAt": "2026-04-02T10:00:00Z"}
+
+
+def _response(status=200, body=b"", content_type="text/html; charset=utf-8"):
+    resp = requests.Response()
+    resp.status_code = status
+    resp.raw = io.BytesIO(body)
+    resp.headers["Content-Type"] = content_type
+    return resp
+
+
+def test_selection_records_rejection_reasons():
+    results = {
+        "finanzas": [
+            _raw("https://a.com/1", "A"),
+            _raw("https://a.com/2", "A"),                       # source cap
+            _raw("https://seen.com/1", "S"),                    # seen URL
+            _raw("https://c.com/1", "C", title="[Removed]"),    # removed
+            _raw("https://e.com/1", "E", description=""),       # empty content
+        ],
+    }
+    scraped = {"https://a.com/1": "text", "https://e.com/1": None}
+    with patch("fetcher._query_topic", side_effect=lambda t, lang: results[t]), \
+         patch("fetcher.scrape_articles", side_effect=lambda urls, max_chars: {u: scraped[u] for u in urls}):
+        fetcher._fetch_batches(fetcher._query_batches([(["finanzas"], "es")]), {"https://seen.com/1"})
+
+    [event] = [e for e in fetch_metrics.snapshot() if e["kind"] == "select"]
+    assert event["topic"] == "finanzas"
+    assert event["accepted"] == 1
+    assert event["rejected"] == {"source_cap": 1, "seen_url": 1, "removed": 1, "empty_content": 1}
+
+
+def test_newsapi_query_records_timing_and_bytes():
+    body = json.dumps({"articles": [_raw("https://a.com/1", "A")]}).encode()
+    with patch("utils.http.get", return_value=_response(body=body, content_type="application/json")):
+        assert len(fetcher._query_topic("finanzas", "es")) == 1
+    [event] = fetch_metrics.snapshot()
+    assert event["kind"] == "newsapi"
+    assert (event["status"], event["bytes"], event["results"]) == (200, len(body), 1)
+
+
+def test_scrape_records_status_bytes_and_outcome():
+    body = HTML.encode("utf-8")
+    with patch("utils.http.get", side_effect=[_response(body=body), _response(status=404)]):
+        assert scraper.scrape_article("https://ok.com/a")
+        assert scraper.scrape_article("https://bad.com/a") is None
+    ok, bad = fetch_metrics.snapshot()
+    assert (ok["domain"], ok["status"], ok["bytes"], ok["outcome"], ok["cache"]) == \
+        ("ok.com", 200, len(body), "ok", "miss")
+    assert ok["chars"] > 100
+    assert (bad["status"], bad["outcome"]) == (404, "http_error")
+
+
+def test_report_writes_jsonl_and_resets(tmp_path, capsys):
+    fetch_metrics.record("newsapi", topic="finanzas", language="es", seconds=0.4, bytes=2048, status=200, results=5)
+    fetch_metrics.record("select", topic="finanzas", accepted=2, rejected={"source_cap": 3})
+    fetch_metrics.record("scrape", url="https://a.com/1", domain="a.com", seconds=1.2, bytes=4096,
+                         status=200, outcome="ok", chars=900, cache="miss")
+    log = tmp_path / "run.jsonl"
+    fetch_metrics.report(str(log))
+
+    lines = [json.loads(l) for l in log.read_text(encoding="utf-8").splitlines()]
+    assert [l["kind"] for l in lines] == ["newsapi", "select", "scrape"]
+    assert len({l["run"] for l in lines}) == 1
+    assert fetch_metrics.snapshot() == []
+
+    topics, domains = fetch_metrics.summarize(lines)
+    assert topics[0]["accepted"] == 2 and topics[0]["source_cap"] == 3 and topics[0]["results"] == 5
+    assert domains[0]["chars"] == 900
+    assert "finanzas" in capsys.readouterr().out
@@ -0,0 +1,379 @@
+"""
+Tests for fetcher.py
+
+Run from repo root:
+  pytest tests/test_fetcher.py
+"""
+
+import random
+import time
+from unittest.mock import patch
+
+import fetcher
+
+
+def _raw(url, source, title="Some headline", description="desc"):
+    return {
+        "url": url, "title": title, "description": description,
+        "source": {"name": source}, "publishedAt": "2026-04-02T10:00:00Z",
+    }
+
+
+RESULTS = {
+    "finanzas": [
+        _raw("https://a.com/1", "A"),
+        _raw("https://a.com/2", "A"),
+        _raw("https://b.com/1", "B", description=""),
+        _raw("https://b.com/2", "B"),
+        _raw("https://c.com/1", "C", title="[Removed]"),
+    ],
+    "economía": [
+        _raw("https://a.com/1", "A"),
+        _raw("https://d.com/1", "D"),
+        _raw("https://d.com/2", "D"),
+    ],
+}
+
+# b.com/1 fails to scrape and has no description, so its source slot stays free
+SCRAPED = {
+    "https://a.com/1": "full text a1",
+    "https://a.com/2": "full text a2",
+    "https://b.com/1": None,
+    "https://b.com/2": "full text b2",
+    "https://d.com/1": "full text d1",
+    "https://d.com/2": "full text d2",
+}
+
+
+def _serial_reference(topics, seen_urls):
+    """The original one-URL-at-a-time loop, used as the semantic reference."""
+    articles = []
+    for topic in topics:
+        counts = {}
+        for a in RESULTS[topic]:
+            url = a["url"]
+            if url in seen_urls or "[Removed]" in a["title"]:
+                continue
+            src = a["source"]["name"]
+            if counts.get(src, 0) >= fetcher.MAX_ARTICLES_PER_SOURCE:
+                continue
+            seen_urls.add(url)
+            content = SCRAPED[url] or a["description"]
+            if not content:
+                continue
+            counts[src] = counts.get(src, 0) + 1
+            articles.append({"title": a["title"], "content": content, "source": src,
+                             "url": url, "publishedAt": a["publishedAt"]})
+    return articles
+
+
+def _fetch(topics, language, seen_urls):
+    """Query, select and scrape one language batch, as fetch_news does."""
+    return fetcher._fetch_batches(fetcher._query_batches([(topics, language)]), seen_urls)[0]
+
+
+def _fake_scrape(url, max_chars=3000):
+    time.sleep(random.uniform(0, 0.01))  # finish in arbitrary order
+    return SCRAPED[url]
+
+
+def test_topic_batch_matches_serial_loop():
+    topics = ["finanzas", "economía"]
+    with patch("fetcher._query_topic", side_effect=lambda t, lang: RESULTS[t]), \
+         patch("scraper.scrape_article", side_effect=_fake_scrape):
+        for _ in range(5):
+            seen = {"https://d.com/1"}
+            got = _fetch(topics, "es", seen)
+            ref_seen = {"https://d.com/1"}
+            assert got == _serial_reference(topics, ref_seen)
+            assert seen == ref_seen
+
+
+def test_failed_scrape_without_description_frees_source_slot():
+    with patch("fetcher._query_topic", side_effect=lambda t, lang: RESULTS[t]), \
+         patch("scraper.scrape_article", side_effect=_fake_scrape) as scrape:
+        got = _fetch(["finanzas"], "es", set())
+    urls = [a["url"] for a in got]
+    assert urls == ["https://a.com/1", "https://b.com/2"]
+    scraped_urls = {c.args[0] for c in scrape.call_args_list}
+    assert "https://a.com/2" not in scraped_urls, "Capped source must not be scraped"
+
+
+def test_seen_urls_shared_across_batches():
+    with patch("fetcher._query_topic", side_effect=lambda t, lang: RESULTS[t]), \
+         patch("scraper.scrape_article", side_effect=_fake_scrape):
+        seen = set()
+        first  = _fetch(["finanzas"], "es", seen)
+        second = _fetch(["economía"], "en", seen)
+    assert "https://a.com/1" in {a["url"] for a in first}
+    assert "https://a.com/1" not in {a["url"] for a in second}
+
+
+def test_scrape_articles_respects_domain_cap():
+    import threading
+    import scraper
+
+    lock = threading.Lock()
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    def _tracked(url, max_chars=3000):
+        domain = scraper._domain(url)
+        with lock:
+            in_flight[domain] = in_flight.get(domain, 0) + 1
+            peak[domain] = max(peak.get(domain, 0), in_flight[domain])
+        time.sleep(0.01)
+        with lock:
+            in_flight[domain] -= 1
+        return url
+
+    urls = [f"https://www.slow.com/{i}" for i in range(10)] + [f"https://fast.com/{i}" for i in range(3)]
+    with patch("scraper.scrape_article", side_effect=_tracked):
+        got = scraper.scrape_articles(urls)
+    assert got == {u: u for u in urls}
+    assert peak["slow.com"] <= scraper.SCRAPE_MAX_PER_DOMAIN
+
+
+# ── Async engine ──────────────────────────────
+
+import asyncio
+import httpx
+from urllib.parse import parse_qs, urlparse
+
+_BODY = "<html><body><p>" + "Texto del artículo completo. " * 10 + "</p></body></html>"
+_FAILING = {"https://b.com/1"}
+
+
+def _newsapi_articles(url):
+    q = parse_qs(urlparse(url).query)["q"][0]
+    return RESULTS.get(q, [_raw("https://en.com/" + q.replace(" ", "-"), "EN"),
+                           _raw("https://a.com/1", "A")])
+
+
+def _fake_requests_get(url, **kwargs):
+    import io
+    import json
+    import requests
+
+    resp = requests.Response()
+    resp.url = url
+    resp.status_code = 200
+    if "newsapi.org" in url:
+        resp.raw = io.BytesIO(json.dumps({"articles": _newsapi_articles(url)}).encode())
+    elif url in _FAILING:
+        resp.status_code = 404
+        resp.raw = io.BytesIO(b"")
+    else:
+        resp.headers["Content-Type"] = "text/html; charset=utf-8"
+        resp.raw = io.BytesIO(_BODY.encode("utf-8"))
+    return resp
+
+
+def _mock_transport(request):
+    url = str(request.url)
+    if "newsapi.org" in url:
+        return httpx.Response(200, json={"articles": _newsapi_articles(url)})
+    if url in _FAILING:
+        return httpx.Response(404)
+    return httpx.Response(200, html=_BODY)
+
+
+def test_fetch_news_async_matches_fetch_news():
+    topics_es = ["finanzas", "economía"]
+    topics_en = ["tariffs", "global trade"]
+    prior = {"https://d.com/2"}
+
+    with patch("fetcher.LANGUAGE_BATCHES", [(topics_es, "es"), (topics_en, "en")]):
+        with patch("utils.http.get", side_effect=_fake_requests_get):
+            expected = fetcher.fetch_news(prior_urls=prior)
+        with patch("fetcher._async_client",
+                   lambda: httpx.AsyncClient(transport=httpx.MockTransport(_mock_transport))):
+            got = asyncio.run(fetcher.fetch_news_async(prior_urls=prior))
+
+    assert got == expected
+    assert any(a["content"].startswith("Texto del artículo") for a in got)
+
+
+# ── Pre-scrape ranking ────────────────────────
+
+def _pool_results(n):
+    return {
+        "finanzas": [
+            _raw(f"https://src{i}.com/{i}", f"Source {i}",
+                 title=f"alpha{i} beta{i} gamma{i}",
+                 description="México economía mercados" if i % 3 == 0 else "otra cosa")
+            for i in range(n)
+        ],
+    }
+
+
+def test_prescrape_scrapes_only_shortlist():
+    pool = _pool_results(40)
+    with patch("fetcher.PRESCRAPE_RANKING", True), \
+         patch("fetcher.LANGUAGE_BATCHES", [(["finanzas"], "es"), ([], "en")]), \
+         patch("fetcher._query_topic", side_effect=lambda t, lang: pool[t]), \
+         patch("scraper.scrape_article", side_effect=lambda u, max_chars=3000: "full " + u) as scrape:
+        got = fetcher.fetch_news()
+
+    limit = fetcher.MAX_ARTICLES_FOR_CLAUDE + fetcher.PRESCRAPE_MARGIN
+    assert scrape.call_count == limit
+    assert len(got) == limit
+    assert all(a["content"].startswith("full ") for a in got)
+    # Fetch order is preserved for the re-rank
+    order = [int(a["url"].rsplit("/", 1)[1]) for a in got]
+    assert order == sorted(order)
+
+
+def test_prescrape_falls_back_to_description():
+    pool = {"finanzas": [_raw("https://a.com/1", "A", description="desc a"),
+                         _raw("https://b.com/1", "B", description="")]}
+    with patch("fetcher.PRESCRAPE_RANKING", True), \
+         patch("fetcher.LANGUAGE_BATCHES", [(["finanzas"], "es"), ([], "en")]), \
+         patch("fetcher._query_topic", side_effect=lambda t, lang: pool[t]), \
+         patch("scraper.scrape_article", return_value=None):
+        got = fetcher.fetch_news()
+    assert [(a["url"], a["content"]) for a in got] == [("https://a.com/1", "desc a")]
+
+
+def test_prescrape_judges_empty_metadata_on_scraped_text():
+    pool = {"finanzas": [_raw("https://a.com/1", "A", title="", description=""),
+                         _raw("https://b.com/1", "B", title="", description="")]}
+    scraped = {"https://a.com/1": "full text a", "https://b.com/1": None}
+    with patch("fetcher.PRESCRAPE_RANKING", True), \
+         patch("fetcher.LANGUAGE_BATCHES", [(["finanzas"], "es"), ([], "en")]), \
+         patch("fetcher._query_topic", side_effect=lambda t, lang: pool[t]), \
+         patch("scraper.scrape_article", side_effect=lambda u, max_chars=3000: scraped[u]):
+        got = fetcher.fetch_news()
+    assert [(a["url"], a["content"]) for a in got] == [("https://a.com/1", "full text a")]
+
+
+# ── Query coalescing ──────────────────────────
+
+def _tagged(url, topic_word):
+    return _raw(url, url.split("/")[2], title=f"Nota sobre {topic_word}")
+
+
+def test_plan_queries_respects_group_size_and_length():
+    with patch("fetcher.COALESCE_QUERIES", True):
+        groups = fetcher._plan_queries(["a", "b", "c", "d", "e"])
+        assert groups == [["a", "b", "c", "d"], ["e"]]
+        with patch("fetcher.NEWSAPI_MAX_QUERY_CHARS", 20):
+            assert fetcher._plan_queries(["finanzas", "economía", "mercados"]) == \
+                [["finanzas"], ["economía"], ["mercados"]]
+    assert fetcher._plan_queries(["a", "b"]) == [["a"], ["b"]]
+    assert fetcher._or_query(["finanzas", "global trade"]) == "finanzas OR (global trade)"
+
+
+def test_coalesced_query_fans_out_to_matching_topics():
+    merged = [
+        _tagged("https://a.com/1", "Finanzas públicas"),
+        _tagged("https://b.com/1", "la economia y los mercados"),
+        _tagged("https://c.com/1", "algo más"),
+    ]
+    calls = []
+
+    def _fake(topic, language, page_size=fetcher.MAX_ARTICLES_PER_TOPIC):
+        calls.append((topic, page_size))
+        return merged
+
+    with patch("fetcher.COALESCE_QUERIES", True), patch("fetcher.MAX_ARTICLES_PER_TOPIC", 1), \
+         patch("fetcher._query_topic", side_effect=_fake):
+        got = dict(fetcher._query_topics(["finanzas", "economía", "mercados"], "es"))
+
+    assert calls == [("finanzas OR economía OR mercados", fetcher.COALESCED_PAGE_SIZE)]
+    assert [a["url"] for a in got["finanzas"]] == ["https://a.com/1"]
+    assert [a["url"] for a in got["economía"]] == ["https://b.com/1"]
+    assert [a["url"] for a in got["mercados"]] == ["https://b.com/1"]
+
+
+def test_starved_topic_in_full_page_gets_own_query():
+    full_page = [_tagged(f"https://a.com/{i}", "finanzas") for i in range(fetcher.COALESCED_PAGE_SIZE)]
+    own = [_tagged("https://b.com/1", "economía")]
+
+    def _fake(topic, language, page_size=fetcher.MAX_ARTICLES_PER_TOPIC):
+        return own if topic == "economía" else full_page
+
+    with patch("fetcher.COALESCE_QUERIES", True), patch("fetcher._query_topic", side_effect=_fake) as q:
+        got = dict(fetcher._query_topics(["finanzas", "economía"], "es"))
+
+    assert len(got["finanzas"]) == fetcher.MAX_ARTICLES_PER_TOPIC
+    assert got["economía"] == own
+    assert q.call_count == 2
+
+
+def test_topic_short_of_matches_in_partial_page_gets_own_query():
+    # NewsAPI may have matched an article on a body this page does not show
+    partial = [_tagged(f"https://a.com/{i}", "finanzas") for i in range(fetcher.MAX_ARTICLES_PER_TOPIC)]
+    own = [_tagged("https://b.com/1", "cuerpo sin la palabra")]
+
+    def _fake(topic, language, page_size=fetcher.MAX_ARTICLES_PER_TOPIC):
+        return own if topic == "economía" else partial
+
+    with patch("fetcher.COALESCE_QUERIES", True), patch("fetcher._query_topic", side_effect=_fake) as q:
+        got = dict(fetcher._query_topics(["finanzas", "economía"], "es"))
+
+    assert got["finanzas"] == partial
+    assert got["economía"] == own
+    assert q.call_count == 2
+
+
+def test_coalesced_async_matches_sync():
+    def _coalesced_articles(url):
+        q = parse_qs(urlparse(url).query)["q"][0]
+        return [_tagged(f"https://{w}.com/1", w) for w in ("finanzas", "tariffs", "trade")
+                if w in q] + [_raw("https://x.com/1", "X", title="finanzas y tariffs")]
+
+    def _get(url, **kwargs):
+        import io, json, requests
+        resp = requests.Response()
+        resp.status_code = 200
+        if "newsapi.org" in url:
+            resp.raw = io.BytesIO(json.dumps({"articles": _coalesced_articles(url)}).encode())
+        else:
+            resp.headers["Content-Type"] = "text/html; charset=utf-8"
+            resp.raw = io.BytesIO(_BODY.encode("utf-8"))
+        return resp
+
+    def _transport(request):
+        url = str(request.url)
+        if "newsapi.org" in url:
+            return httpx.Response(200, json={"articles": _coalesced_articles(url)})
+        return httpx.Response(200, html=_BODY)
+
+    with patch("fetcher.COALESCE_QUERIES", True), \
+         patch("fetcher.LANGUAGE_BATCHES", [(["finanzas", "economía"], "es"), (["tariffs", "global trade"], "en")]):
+        with patch("utils.http.get", side_effect=_get):
+            expected = fetcher.fetch_news()
+        with patch("fetcher._async_client",
+                   lambda: httpx.AsyncClient(transport=httpx.MockTransport(_transport))):
+            got = asyncio.run(fetcher.fetch_news_async())
+
+    assert got == expected
+    # "global trade" has no local match in its merged page, so its own query supplies trade.com
+    assert {a["url"] for a in got} == {"https://finanzas.com/1", "https://x.com/1", "https://tariffs.com/1",
+                                       "https://trade.com/1"}
+
+
+# ── Parallel language batches ─────────────────
+
+def test_language_batches_run_concurrently_and_merge_deterministically():
+    shared = _raw("https://shared.com/1", "Shared")
+    results = {
+        ("finanzas", "es"): [_raw("https://es.com/1", "ES"), shared],
+        ("tariffs", "en"):  [shared, _raw("https://en.com/1", "EN"), _raw("https://old.com/1", "Old")],
+        ("tributos", "pt"): [shared, _raw("https://pt.com/1", "PT")],
+    }
+    batches = [(["finanzas"], "es"), (["tariffs"], "en"), (["tributos"], "pt")]
+
+    def _slow_query(topic, language):
+        time.sleep(random.uniform(0, 0.02))  # batches finish in arbitrary order
+        return results[(topic, language)]
+
+    with patch("fetcher.LANGUAGE_BATCHES", batches), \
+         patch("fetcher._query_topic", side_effect=_slow_query), \
+         patch("scraper.scrape_article", side_effect=lambda u, max_chars=3000: "full " + u):
+        runs = [fetcher.fetch_news(prior_urls={"https://old.com/1"}) for _ in range(5)]
+
+    urls = [a["url"] for a in runs[0]]
+    assert urls == ["https://es.com/1", "https://shared.com/1", "https://en.com/1", "https://pt.com/1"]
+    assert all(r == runs[0] for r in runs)
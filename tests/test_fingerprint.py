@@ -0,0 +1,59 @@
+"""
+Tests for fingerprint.py near-duplicate collapsing
+
+Run from repo root:
+  pytest tests/test_fingerprint.py
+"""
+
+from fingerprint import simhash, hamming, collapse_near_duplicates, _bands
+
+WIRE = " ".join(
+    f"El banco central informó que la inflación del mes {i} subió a {i % 7}.{i % 3} por ciento, "
+    f"mientras los analistas esperaban un ritmo más lento en la región."
+    for i in range(20)
+)
+OTHER = " ".join(
+    f"Los precios del petróleo cayeron el día {i} ante señales de mayor producción de la OPEP "
+    f"y una demanda más débil en China y Europa."
+    for i in range(20)
+)
+
+
+def _article(source: str, content: str, url: str) -> dict:
+    return {"title": url, "url": url, "source": source, "content": content}
+
+
+def test_simhash_stable_and_close_for_reprints():
+    reprint = "CIUDAD DE MÉXICO (Reuters) - " + WIRE[:-150] + " Reporte de la redacción."
+    assert simhash(WIRE) == simhash(WIRE)
+    assert hamming(simhash(WIRE), simhash(reprint)) <= 3
+    assert hamming(simhash(WIRE), simhash(OTHER)) > 10
+
+
+def test_bands_cover_all_bits():
+    h = (1 << 64) - 1
+    for n in (1, 4, 6):
+        bands = _bands(h, n)
+        assert len(bands) == n
+        assert sum(v.bit_length() for _, v in bands) == 64
+
+
+def test_keeps_highest_authority_copy_in_place():
+    articles = [
+        _article("Infobae", WIRE, "a"),
+        _article("El Economista", OTHER, "b"),
+        _article("Reuters", "(Reuters) - " + WIRE, "c"),
+        _article("El Financiero", WIRE + " Fin.", "d"),
+    ]
+    kept = collapse_near_duplicates(articles)
+    assert [a["url"] for a in kept] == ["b", "c"]
+
+
+def test_tie_keeps_earliest():
+    articles = [_article("Infobae", WIRE, "a"), _article("El Financiero", WIRE, "b")]
+    assert [a["url"] for a in collapse_near_duplicates(articles)] == ["a"]
+
+
+def test_short_bodies_never_collapsed():
+    articles = [_article("Infobae", "Breve nota.", "a"), _article("Reuters", "Breve nota.", "b")]
+    assert collapse_near_duplicates(articles) == articles
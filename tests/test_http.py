@@ -0,0 +1,85 @@
+"""
+Tests for utils/http.py
+
+Run from repo root:
+  pytest tests/test_http.py
+"""
+
+from unittest.mock import patch
+
+from utils import http as http_utils
+
+
+def test_session_is_shared():
+    assert http_utils.get_session() is http_utils.get_session()
+
+
+def test_session_sets_user_agent():
+    assert http_utils.get_session().headers["User-Agent"] == http_utils.USER_AGENT
+
+
+def test_adapter_pools_and_retries_idempotent_only():
+    adapter = http_utils.get_session().get_adapter("https://query1.finance.yahoo.com/")
+    assert adapter._pool_maxsize == http_utils.POOL_PER_HOST
+    retry = adapter.max_retries
+    assert retry.total == http_utils.RETRY_TOTAL
+    assert "POST" not in retry.allowed_methods
+    assert 503 in retry.status_forcelist
+
+
+def test_default_timeout_applied():
+    adapter = http_utils.get_session().get_adapter("https://api.telegram.org/")
+    with patch("requests.adapters.HTTPAdapter.send", return_value="ok") as send:
+        adapter.send(object())
+        adapter.send(object(), timeout=3)
+    assert send.call_args_list[0].kwargs["timeout"] == http_utils.DEFAULT_TIMEOUT
+    assert send.call_args_list[1].kwargs["timeout"] == 3
+
+
+def test_cookies_not_persisted():
+    import http.client
+    from types import SimpleNamespace
+
+    import requests
+    from requests.cookies import extract_cookies_to_jar
+
+    msg = http.client.HTTPMessage()
+    msg["Set-Cookie"] = "meter=1; Path=/"
+    raw = SimpleNamespace(_original_response=SimpleNamespace(msg=msg))
+    req = requests.Request("GET", "https://elfinanciero.com.mx/").prepare()
+
+    jar = http_utils.get_session().cookies
+    extract_cookies_to_jar(jar, req, raw)
+    assert len(jar) == 0
+
+
+def test_async_client_discards_cookies():
+    import httpx
+
+    client = http_utils.async_client()
+    request = httpx.Request("GET", "https://elfinanciero.com.mx/")
+    client.cookies.extract_cookies(httpx.Response(200, headers={"Set-Cookie": "meter=1; Path=/"}, request=request))
+    assert len(client.cookies.jar) == 0
+
+
+def test_async_transport_retries_idempotent_only():
+    import asyncio
+    import httpx
+
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(503 if len(calls) == 1 else 200)
+
+    async def send(method):
+        transport = http_utils._AsyncRetryTransport(httpx.MockTransport(handler))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return (await client.request(method, "https://api.example.com/")).status_code
+
+    with patch.object(http_utils, "RETRY_BACKOFF", 0):
+        assert asyncio.run(send("GET")) == 200
+        assert calls == ["GET", "GET"]
+        calls.clear()
+        assert asyncio.run(send("POST")) == 503
+        assert calls == ["POST"]
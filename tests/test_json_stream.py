@@ -0,0 +1,66 @@
+"""
+Tests for json_stream.py incremental JSON checking
+
+Run from repo root:
+  pytest tests/test_json_stream.py
+"""
+
+import json
+
+import pytest
+
+from json_stream import Divergence, JsonStreamChecker
+
+DIGEST = {
+    lang: {"editor_note": "Estimados humanos, \"hola\".", "sentiment": {"position": 42, "label_es": None},
+           "stories": [{"headline": "a", "tags": []}, {"headline": "b", "score": -1.5e3}],
+           "quote": {"text": "q", "attribution": "a"}}
+    for lang in ("es", "en")
+}
+
+
+def _feed(text: str, size: int) -> JsonStreamChecker:
+    checker = JsonStreamChecker()
+    for i in range(0, len(text), size):
+        checker.feed(text[i:i + size])
+    return checker
+
+
+@pytest.mark.parametrize("size", [1, 7, 10_000])
+def test_valid_digest_in_any_chunking(size):
+    text = "```json\n" + json.dumps(DIGEST, ensure_ascii=False, indent=2) + "\n```"
+    checker = _feed(text, size)
+    assert checker.done
+    assert checker.stories == 2     # es stories only
+
+
+def test_first_story_is_counted_when_it_closes():
+    text = json.dumps(DIGEST)
+    cut = text.index('"b"')
+    checker = _feed(text[:cut], 5)
+    assert checker.stories == 1 and not checker.done
+
+
+def test_text_before_the_object_is_skipped_not_fatal():
+    checker = _feed('Aquí está el JSON:\n```json\n{"es": {}, "en": {}}', 4)
+    assert checker.done
+    assert checker.skipped == len("AquíestáelJSON:```json")
+
+
+@pytest.mark.parametrize("text", [
+    '{"es": {"a": 1 "b": 2}}',
+    '{"digest": {}}',
+    '{"es": {"stories": [1,]}}',
+    '{"es": {"note": "línea\nrota"}}',
+    '{"es": {"ok": tru }}',
+    '{"es": [}',
+    '{"es": {"x": "\\q"}}',
+])
+def test_divergence_is_raised_at_the_first_bad_character(text):
+    with pytest.raises(Divergence):
+        _feed(text, 3)
+
+
+def test_text_after_the_object_is_ignored():
+    checker = _feed('{"es": {}, "en": {}}\n```\nNota: listo.', 4)
+    assert checker.done
@@ -0,0 +1,96 @@
+"""
+Tests for learned_selectors.py and the scraper's container scoring
+
+Run from repo root:
+  pytest tests/test_learned_selectors.py
+"""
+
+from unittest.mock import patch
+
+import learned_selectors
+import scraper
+from scraper import extract_text, _best_container, _extract_stream
+
+PARA = "La Secretaría de Hacienda ajustó su estimación de crecimiento para este año. "
+
+
+def _page(n: int = 1) -> str:
+    body = "".join(f"<p>{PARA * 2} Nota {n}, párrafo {i}.</p>" for i in range(4))
+    related = "".join(f"<p><a href='/r{i}'>{PARA}</a></p>" for i in range(4))
+    return (
+        "<html><body><header><p>Portada</p></header>"
+        "<div class='layout wrapper'>"
+        f"<article class='story'><h1>Titular {n}</h1><p class='byline'>Por Redacción</p>"
+        f"<div class='story-text body'>{body}</div></article>"
+        f"<div class='related'>{related}</div>"
+        f"<p>Suscríbete a nuestro boletín y recibe {PARA}</p>"
+        "</div><footer><p>Aviso legal</p></footer></body></html>"
+    )
+
+
+def test_best_container_prefers_dense_body_over_wrappers_and_link_lists():
+    assert _best_container(_page()) == ".story-text"
+    assert _best_container(_page().encode("utf-8"), "utf-8") == ".story-text"
+
+
+def test_best_container_none_without_enough_paragraphs():
+    assert _best_container(f"<html><body><div class='x'><p>{PARA}</p></div></body></html>") is None
+
+
+def test_best_container_skips_tokens_that_match_an_earlier_element():
+    html = _page().replace("<div class='layout wrapper'>", "<div class='layout wrapper'><span class='story-text'></span>")
+    assert _best_container(html) == ".body"
+
+
+def test_learns_after_agreeing_pages_and_persists():
+    assert learned_selectors.needs_learning("diario.mx")
+    assert learned_selectors.observe("diario.mx", "https://diario.mx/1", ".story-text") is None
+    assert learned_selectors.observe("diario.mx", "https://diario.mx/2", None) is None
+    assert learned_selectors.observe("diario.mx", "https://diario.mx/3", ".story-text") is None
+    assert learned_selectors.observe("diario.mx", "https://diario.mx/4", ".story-text") == ".story-text"
+    assert not learned_selectors.needs_learning("diario.mx")
+
+    learned_selectors._learned = learned_selectors._observed = None   # fresh process
+    assert learned_selectors.get("diario.mx") == ".story-text"
+
+    learned_selectors.forget("diario.mx")
+    assert learned_selectors.get("diario.mx") is None
+    assert learned_selectors.needs_learning("diario.mx")
+
+
+def test_gives_up_without_consensus():
+    for i in range(learned_selectors.SELECTOR_LEARN_MAX_PAGES):
+        assert learned_selectors.observe("mixto.com", f"https://mixto.com/{i}", f".c{i % 2}") is None
+    assert not learned_selectors.needs_learning("mixto.com")
+    assert learned_selectors.get("mixto.com") is None
+
+
+def test_disabled_learning_is_inert():
+    learned_selectors.observe("diario.mx", "https://diario.mx/1", ".a")
+    with patch("learned_selectors.SELECTOR_LEARNING", False):
+        assert not learned_selectors.needs_learning("nuevo.mx")
+        assert learned_selectors.get("diario.mx") is None
+
+
+def test_scraping_an_unknown_domain_learns_its_selector():
+    pages = {f"https://www.diario.mx/nota-{n}": _page(n) for n in range(3)}
+
+    def fake_get(url, **kw):
+        from test_scraper import _html_response
+        return _html_response(pages[url])
+
+    with patch("scraper.SCRAPE_CACHE_ENABLED", False), patch("utils.http.get", side_effect=fake_get):
+        scraper.scrape_articles(list(pages))
+    assert learned_selectors.get("diario.mx") == ".story-text"
+    assert not scraper._learning("diario.mx")
+
+    # The learned selector now drives both extractors: the byline and the
+    # newsletter blurb outside the body are no longer picked up.
+    url, html = "https://www.diario.mx/nota-9", _page(9)
+    text = extract_text(html, url, 5000)
+    assert text.startswith(PARA.strip()) and "Suscríbete" not in text
+    assert _extract_stream([html.encode("utf-8")], url, 5000, "utf-8") == text
+
+
+def test_known_domains_are_not_learned():
+    assert not scraper._learning("elfinanciero.com.mx")
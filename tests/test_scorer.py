@@ -6,7 +6,7 @@ Run from repo root:
 """
 
 from datetime import datetime, timezone, timedelta
-from scorer import _freshness_score, _authority_score, _relevance_score, rank_articles
+from scorer import _freshness_score, _authority_score, _relevance_score, rank_articles, score_article, score_articles
 
 NOW = datetime(2026, 4, 2, 12, 0, 0, tzinfo=timezone.utc)
 
@@ -117,6 +117,55 @@ def test_rank_freshness_preferred():
     assert result[0]["title"] == "Breaking news on Mexico economy"
 
 
+def test_freshness_bucket_edges():
+    assert _freshness_score((NOW - timedelta(hours=6)).isoformat(), NOW) == 0.7
+    assert _freshness_score((NOW + timedelta(hours=3)).isoformat().replace("+00:00", "Z"), NOW) == 1.0
+
+
+def test_relevance_is_substring_and_case_insensitive():
+    article = {"title": "MERCADOS emergentes", "content": "la economíamexicana"}
+    assert _relevance_score(article, ["mercados", "Economía", "finanzas", "mercado"]) == 0.75
+
+
+def test_batch_scores_match_single_article_scores():
+    articles = [
+        {"title": "México economía", "source": "Reuters", "publishedAt": (NOW - timedelta(hours=2)).isoformat(), "content": "mercados"},
+        {"title": "Otra nota", "source": "El Economista", "publishedAt": "not-a-date", "content": ""},
+        {"title": "Sin fuente", "source": None, "publishedAt": None},
+    ]
+    batch = score_articles(articles, NOW)
+    assert list(batch) == [score_article(a, NOW) for a in articles]
+    assert len(score_articles([], NOW)) == 0
+
+
+def test_rank_ties_keep_input_order():
+    articles = [
+        {"title": title, "source": "Blog", "publishedAt": None, "content": ""}
+        for title in ("Alza del peso", "Cae la bolsa", "Nuevo arancel", "Récord de remesas", "Banxico recorta")
+    ]
+    assert rank_articles(articles, now=NOW) == articles
+
+
+def test_ranked_articles_carry_their_score():
+    articles = [
+        {"title": "Banxico recorta tasa", "source": "Reuters", "publishedAt": "2026-04-02T10:00:00Z", "content": "finanzas"},
+        {"title": "Récord de remesas", "source": "Blog", "publishedAt": None, "content": ""},
+    ]
+    result = rank_articles(articles, now=NOW)
+    assert [a["score"] for a in result] == [round(float(score_article(a, NOW)), 4) for a in result]
+    assert result[0]["score"] > result[1]["score"]
+
+
+def test_only_returned_articles_get_a_score():
+    articles = [
+        {"title": "Banxico recorta tasa", "source": "Reuters", "publishedAt": "2026-04-02T10:00:00Z", "content": "finanzas"},
+        {"title": "Récord de remesas", "source": "Blog", "publishedAt": None, "content": ""},
+    ]
+    result = rank_articles(articles, now=NOW, limit=1)
+    assert result == [articles[0]] and "score" in articles[0]
+    assert "score" not in articles[1]
+
+
 if __name__ == "__main__":
     tests = [
         test_freshness_very_recent, test_freshness_semi_recent, test_freshness_day_old,
@@ -126,6 +175,9 @@ if __name__ == "__main__":
         test_relevance_multiple_matches, test_relevance_no_match,
         test_rank_uniqueness_filter, test_rank_respects_max,
         test_rank_empty_input, test_rank_freshness_preferred,
+        test_freshness_bucket_edges, test_relevance_is_substring_and_case_insensitive,
+        test_batch_scores_match_single_article_scores, test_rank_ties_keep_input_order,
+        test_ranked_articles_carry_their_score, test_only_returned_articles_get_a_score,
     ]
     for t in tests:
         t()
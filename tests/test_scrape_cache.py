@@ -0,0 +1,97 @@
+"""
+Tests for scrape_cache.py and its use in scraper.scrape_article
+
+Run from repo root:
+  pytest tests/test_scrape_cache.py
+"""
+
+import io
+import time
+from unittest.mock import patch
+
+import requests
+
+import scrape_cache
+import scraper
+
+URL = "https://www.elfinanciero.com.mx/economia/nota"
+HTML = "<html><body><p>" + "Banxico recorta la tasa de referencia. " * 5 + "</p></body></html>"
+
+
+def _response(status=200, text=HTML, headers=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp.raw = io.BytesIO(text.encode("utf-8"))
+    resp.headers.update({"Content-Type": "text/html; charset=utf-8", **(headers or {})})
+    resp.url = URL
+    return resp
+
+
+def test_lookup_miss_returns_none():
+    assert scrape_cache.lookup(URL, 3000) is None
+
+
+def test_store_then_lookup_is_fresh():
+    scrape_cache.store(URL, "texto", 3000, etag='"abc"')
+    entry = scrape_cache.lookup(URL, 3000)
+    assert entry["text"] == "texto"
+    assert entry["fresh"] is True
+    assert scrape_cache.validators(entry) == {"If-None-Match": '"abc"'}
+
+
+def test_stale_entry_after_ttl():
+    scrape_cache.store(URL, "texto", 3000)
+    with patch("scrape_cache.time.time", return_value=time.time() + 13 * 3600):
+        assert scrape_cache.lookup(URL, 3000)["fresh"] is False
+
+
+def test_smaller_max_chars_entry_not_reused_for_larger_request():
+    scrape_cache.store(URL, "x" * 500, 500)
+    assert scrape_cache.lookup(URL, 3000) is None
+    assert scrape_cache.lookup(URL, 200)["text"] == "x" * 200
+
+
+def test_eviction_keeps_most_recent():
+    with patch("scrape_cache.SCRAPE_CACHE_MAX_ENTRIES", 2):
+        for i in range(3):
+            scrape_cache.store(f"{URL}/{i}", "t", 3000)
+            time.sleep(0.01)
+    assert scrape_cache.lookup(f"{URL}/0", 3000) is None
+    assert scrape_cache.lookup(f"{URL}/2", 3000) is not None
+
+
+def test_scrape_article_fresh_hit_skips_network():
+    with patch("scraper.http.get", return_value=_response()) as get:
+        first = scraper.scrape_article(URL)
+        second = scraper.scrape_article(URL)
+    assert first == second
+    assert get.call_count == 1
+
+
+def test_scrape_article_caches_short_pages():
+    with patch("scraper.http.get", return_value=_response(text="<p>paywall</p>")) as get:
+        assert scraper.scrape_article(URL) is None
+        assert scraper.scrape_article(URL) is None
+    assert get.call_count == 1
+
+
+def test_scrape_article_revalidates_stale_entry_with_304():
+    with patch("scraper.http.get", return_value=_response(headers={"ETag": '"v1"'})):
+        first = scraper.scrape_article(URL)
+
+    later = time.time() + 13 * 3600
+    with patch("scrape_cache.time.time", return_value=later), \
+         patch("scraper.http.get", return_value=_response(status=304, text="")) as get:
+        again = scraper.scrape_article(URL)
+        assert scrape_cache.lookup(URL, 3000)["fresh"] is True
+
+    assert again == first
+    assert get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_scrape_article_cache_disabled():
+    with patch("scraper.SCRAPE_CACHE_ENABLED", False), \
+         patch("scraper.http.get", return_value=_response()) as get:
+        scraper.scrape_article(URL)
+        scraper.scrape_article(URL)
+    assert get.call_count == 2
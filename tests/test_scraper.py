@@ -0,0 +1,185 @@
+"""
+Tests for scraper.py extraction
+
+Run from repo root:
+  pytest tests/test_scraper.py
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+import scraper
+from scraper import extract_text, _extract_stream, _StreamingExtractor
+
+LONG = "El peso mexicano se apreció frente al dólar tras la decisión de Banxico. " * 3
+SHORT = "Breve."
+
+
+def _page(body: str) -> str:
+    return f"<!DOCTYPE html><html><head><title>t</title><script>var x = '<p>no</p>';</script></head><body>{body}</body></html>"
+
+
+PAGES = {
+    "container": (
+        "https://www.elfinanciero.com.mx/a",
+        _page(f"<nav><p>Menu {LONG}</p></nav><div class='nota-cuerpo'><p>{LONG}</p>"
+              f"<p>Segundo <b>párrafo</b> con <!-- comentario --> texto<script>bad()</script> final.</p></div>"
+              f"<p>Relacionadas {LONG}</p><footer><p>{LONG}</p></footer>"),
+    ),
+    "container_short_falls_back": (
+        "https://elpais.com/b",
+        _page(f"<div class='a_c'><p>{SHORT}</p></div><p>{LONG}</p><p>{LONG}</p>"),
+    ),
+    "container_inside_header_ignored": (
+        "https://www.reuters.com/c",
+        _page(f"<header><div class='article-body__content-x'><p>{LONG}</p></div></header>"
+              f"<div class='ArticleBody-wrapper'><p>{LONG} real</p></div>"),
+    ),
+    "container_is_paragraph": (
+        "https://apnews.com/d",
+        _page(f"<p class='article-body'>{LONG}</p><p>{LONG} otra</p>"),
+    ),
+    "no_selector_domain": (
+        "https://unknown.example.com/e",
+        _page(f"<article><p>{LONG}</p><p>  espacios   &nbsp; raros\n\n aquí </p><figure><p>pie</p></figure></article>"),
+    ),
+    "too_short": (
+        "https://unknown.example.com/f",
+        _page(f"<p>{SHORT}</p>"),
+    ),
+    "long_body": (
+        "https://www.infobae.com/g",
+        _page("<div class='article-body'>" + "".join(f"<p>Párrafo {i}. {LONG}</p>" for i in range(60)) + "</div>"),
+    ),
+    "unclosed_tags": (
+        "https://ft.com/h",
+        _page(f"<div class='article__content'><p>{LONG}<p>{LONG}<div>suelto</div><p>{LONG}"),
+    ),
+}
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("name", sorted(PAGES))
+@pytest.mark.parametrize("chunk_size", [7, 256, 1 << 20])
+@pytest.mark.parametrize("max_chars", [50, 99, 150, 3000])
+def test_streaming_matches_full_parse(name, chunk_size, max_chars):
+    url, html = PAGES[name]
+    expected = extract_text(html, url, max_chars)
+    got = _extract_stream(_chunks(html.encode("utf-8"), chunk_size), url, max_chars, "utf-8")
+    assert got == expected
+
+
+def test_streaming_stops_early_once_enough_text():
+    url, html = PAGES["long_body"]
+    fed = []
+    chunks = _chunks(html.encode("utf-8"), 512)
+
+    def tracking():
+        for c in chunks:
+            fed.append(c)
+            yield c
+
+    _extract_stream(tracking(), url, 3000, "utf-8")
+    assert len(fed) < len(chunks) / 2
+
+
+def test_streaming_respects_byte_cap():
+    url, html = PAGES["long_body"]
+    data = html.encode("utf-8")
+    with patch("scraper.SCRAPE_MAX_BYTES", 2000):
+        got = _extract_stream(_chunks(data, 512), url, 100_000, "utf-8")
+    assert got is not None and len(got) < 2000
+
+
+def test_compile_selector_forms():
+    match = scraper._compile_selector(".a_c, [class*='article-body']")
+    assert match("a_c other")
+    assert match("x-article-body-y")
+    assert not match("a_cd")
+    assert scraper._compile_selector("div > p") is None
+
+
+def test_unsupported_selector_still_uses_generic_scan():
+    with patch.dict(scraper._DOMAIN_SELECTORS, {"odd.com": "div > p"}):
+        ex = _StreamingExtractor("https://odd.com/x", 3000)
+        ex.feed(_page(f"<p>{LONG}</p>").encode())
+        assert ex.result() == " ".join(LONG.split())
+
+
+def test_non_html_rejected_from_headers():
+    assert scraper._is_html({"Content-Type": "text/html; charset=utf-8"})
+    assert scraper._is_html({})
+    assert not scraper._is_html({"Content-Type": "application/pdf"})
+    assert scraper._charset({"Content-Type": "text/html; charset=ISO-8859-1"}) == "ISO-8859-1"
+
+
+# ── Parser process pool ───────────────────────
+
+@pytest.fixture
+def parse_pool():
+    with patch("scraper.SCRAPE_PARSE_PROCESSES", 2):
+        yield
+    scraper.shutdown_parse_pool()
+
+
+def _html_response(html: str):
+    import io
+    import requests
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.headers["Content-Type"] = "text/html; charset=utf-8"
+    resp.raw = io.BytesIO(html.encode("utf-8"))
+    return resp
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_parse_pool_matches_in_thread_extraction(parse_pool, streaming):
+    expected = {name: extract_text(html, url, 3000) for name, (url, html) in PAGES.items()}
+    urls = {url: html for url, html in PAGES.values()}
+    with patch("scraper.SCRAPE_STREAMING", streaming), \
+         patch("scraper.SCRAPE_CACHE_ENABLED", False), \
+         patch("utils.http.get", side_effect=lambda url, **kw: _html_response(urls[url])):
+        got = scraper.scrape_articles(list(urls))
+    assert scraper._parse_pool is not None
+    assert {name: got[url] for name, (url, _) in PAGES.items()} == expected
+
+
+def test_parse_pool_async(parse_pool):
+    import asyncio
+    import httpx
+    url, html = PAGES["container"]
+
+    async def _run():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, html=html))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await scraper.scrape_article_async(client, url)
+
+    with patch("scraper.SCRAPE_CACHE_ENABLED", False):
+        assert asyncio.run(_run()) == extract_text(html, url, 3000)
+
+
+def test_async_streaming_parses_off_the_event_loop():
+    import asyncio
+    import threading
+    import httpx
+    url, html = PAGES["container"]
+    threads = []
+    feed = _StreamingExtractor.feed
+
+    def _feed(self, chunk):
+        threads.append(threading.current_thread())
+        return feed(self, chunk)
+
+    async def _run():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, html=html))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await scraper.scrape_article_async(client, url)
+
+    with patch("scraper.SCRAPE_CACHE_ENABLED", False), patch("scraper.SCRAPE_STREAMING", True), \
+         patch("scraper._learning", return_value=False), patch.object(_StreamingExtractor, "feed", _feed):
+        assert asyncio.run(_run()) == extract_text(html, url, 3000)
+    assert threads and threading.main_thread() not in threads
@@ -0,0 +1,29 @@
+"""
+Quality gate over the offline scraper corpus (bench/scraper_corpus).
+
+Run from repo root:
+  pytest tests/test_scraper_corpus.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "bench"))
+
+import bench_scraper  # noqa: E402
+
+PAGES = bench_scraper.load_corpus(bench_scraper.latest_version())
+
+
+@pytest.mark.parametrize("mode", sorted(bench_scraper.EXTRACTORS))
+@pytest.mark.parametrize("page", PAGES, ids=[p["file"] for p in PAGES])
+def test_corpus_page_quality(page, mode):
+    text = bench_scraper.EXTRACTORS[mode](page)
+    assert bench_scraper.check_quality(text, page["expected"]) == []
+
+
+@pytest.mark.parametrize("page", PAGES, ids=[p["file"] for p in PAGES])
+def test_streaming_agrees_with_full_parse(page):
+    assert bench_scraper._streaming(page) == bench_scraper._full_parse(page)
@@ -0,0 +1,84 @@
+"""
+Tests for story_index.py and cross-day dedup in rank_articles
+
+Run from repo root:
+  pytest tests/test_story_index.py
+"""
+
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+import numpy as np
+
+import article_store
+import story_index
+from scorer import rank_articles
+
+NOW   = datetime(2026, 4, 2, 12, 0, 0, tzinfo=timezone.utc)
+TODAY = NOW.date()
+
+COVERED = {
+    "url": "https://a.com/banxico", "title": "Banxico recorta la tasa de interés a 9%",
+    "content": "El banco central de México recortó su tasa de referencia en un cuarto de punto, "
+               "citando una inflación moderada y la desaceleración de la economía.",
+}
+SAME_EVENT = {
+    "url": "https://b.com/tasas", "title": "Banxico recorta su tasa de interés de referencia",
+    "content": "La junta de gobierno del banco central de México recortó la tasa de referencia "
+               "un cuarto de punto ante la inflación moderada y la economía en desaceleración.",
+    "source": "Reuters", "publishedAt": NOW.isoformat(),
+}
+NEW_EVENT = {
+    "url": "https://c.com/pemex", "title": "Pemex coloca bonos por 5 mil millones",
+    "content": "La petrolera estatal colocó deuda en los mercados internacionales con alta demanda.",
+    "source": "SomeBlog", "publishedAt": NOW.isoformat(),
+}
+
+
+def test_similarity_window_excludes_today_and_old_issues():
+    story_index.add_stories([COVERED], "2026-03-30")
+    sims = story_index.max_similarity([SAME_EVENT, NEW_EVENT], days=5, today=TODAY)
+    assert sims[0] >= 0.5 > sims[1]
+
+    assert story_index.max_similarity([SAME_EVENT], days=2, today=TODAY)[0] == 0
+    assert story_index.max_similarity([SAME_EVENT], days=5, today=date(2026, 3, 30))[0] == 0
+
+
+def test_vectors_are_unit_length_and_deterministic():
+    v = story_index.vectorize(COVERED)
+    assert np.isclose(np.linalg.norm(v), 1.0)
+    assert np.array_equal(v, story_index.vectorize(dict(COVERED)))
+    assert not story_index.vectorize({"title": "", "content": ""}).any()
+
+
+def test_batch_vectors_match_single_article_vectors():
+    articles = [COVERED, {"title": "", "content": ""}, SAME_EVENT,
+                {"title": "Peso, dólar; peso (Banxico) 9.0% — «tasa»", "content": "peso. über-fuerte a_b"}]
+    batch = story_index.vectorize_many(articles)
+    assert batch.shape == (4, story_index.DIM) and batch.dtype == np.float32
+    for row, article in zip(batch, articles):
+        assert np.allclose(row, story_index.vectorize(article))
+    assert story_index.vectorize_many([]).shape == (0, story_index.DIM)
+
+
+def test_words_split_like_the_word_pattern():
+    text = "peso, dólar; a_b (Banxico) 9.0% — «tasa» x\u0301y ½ über-fuerte"
+    assert story_index._words(text) == story_index._WORDS.findall(text)
+
+
+def test_empty_index_backfills_from_article_store():
+    article_store.add_articles([COVERED], run_id="2026-03-31")
+    article_store.mark_selected([{"url": COVERED["url"]}], "2026-03-31")
+    assert story_index.max_similarity([SAME_EVENT], today=TODAY)[0] >= 0.5
+
+
+def test_rank_demotes_or_drops_covered_stories():
+    story_index.add_stories([COVERED], "2026-03-31")
+    pool = [SAME_EVENT, NEW_EVENT]     # Reuters outranks SomeBlog on authority alone
+
+    with patch("scorer.STORY_DEDUP_MODE", "off"):
+        assert rank_articles(pool, now=NOW) == [SAME_EVENT, NEW_EVENT]
+    with patch("scorer.STORY_DEDUP_MODE", "demote"):
+        assert rank_articles(pool, now=NOW) == [NEW_EVENT, SAME_EVENT]
+    with patch("scorer.STORY_DEDUP_MODE", "drop"):
+        assert rank_articles(pool, now=NOW) == [NEW_EVENT]
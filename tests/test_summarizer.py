@@ -0,0 +1,236 @@
+"""
+Tests for summarizer.py request layout (no API calls)
+
+Run from repo root:
+  pytest tests/test_summarizer.py
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import summarizer
+
+ARTICLES = [
+    {"source": "Reuters", "title": "Banxico recorta tasa", "url": "https://a.com/1", "content": "Texto uno."},
+    {"source": "El Economista", "title": "Peso se aprecia", "url": "https://b.com/2", "content": "Texto dos."},
+]
+
+STORY  = {"source": "Reuters", "headline": "h", "body": "b", "url": "https://a.com/1", "tag": "Tasas",
+          "context_note": {"es": "c", "en": "c"}, "thread_tag": None}
+DIGEST = {lang: {"editor_note": "Estimados humanos, hola.", "narrative_thread": "n",
+                 "sentiment": {"label_es": "Cauteloso", "label_en": "Cautious", "position": 50,
+                               "context_es": "c", "context_en": "c"},
+                 "stories": [STORY], "quote": {"text": "q", "attribution": "a"}}
+          for lang in ("es", "en")}
+
+
+def _message(text: str, cache_write: int = 0, cache_read: int = 0):
+    usage = SimpleNamespace(input_tokens=10, output_tokens=200,
+                            cache_creation_input_tokens=cache_write, cache_read_input_tokens=cache_read)
+    return SimpleNamespace(content=[SimpleNamespace(text=text)], usage=usage)
+
+
+def test_cache_breakpoint_follows_the_articles():
+    calls = []
+    with patch.object(summarizer.client.messages, "create",
+                      side_effect=lambda **kw: calls.append(kw) or _message(json.dumps(DIGEST))):
+        summarizer.summarize_news(ARTICLES, active_threads=["Aranceles: acero"])
+        summarizer.summarize_news(ARTICLES[:1])
+
+    first, second = calls
+    assert first["system"] == second["system"]
+    assert "cache_control" not in first["system"][-1]
+    assert "Reglas:" in first["system"][0]["text"]
+
+    user = first["messages"][0]["content"]
+    assert user[-1]["cache_control"] == {"type": "ephemeral"}
+    assert '"Aranceles: acero"' in user[0]["text"] and "https://b.com/2" in user[0]["text"]
+    assert "Aranceles: acero" not in first["system"][0]["text"]
+
+
+def test_repair_call_reuses_the_cached_prefix(capsys):
+    calls = []
+    replies = iter([_message('{"es": {broken', cache_write=1500),
+                    _message(json.dumps(DIGEST), cache_read=1500)])
+    with patch.object(summarizer.client.messages, "create",
+                      side_effect=lambda **kw: calls.append(kw) or next(replies)):
+        digest = summarizer.summarize_news(ARTICLES)
+
+    assert digest == DIGEST
+    main, repair = calls
+    assert repair["system"] == main["system"]
+    assert repair["messages"][0] == main["messages"][0]
+    assert [m["role"] for m in repair["messages"]] == ["user", "assistant", "user"]
+    out = capsys.readouterr().out
+    assert "digest: 10 input + 1500 cache write + 0 cache read tokens" in out
+    assert "repair: 10 input + 0 cache write + 1500 cache read tokens" in out
+
+
+class _FakeStream:
+    """Stands in for client.messages.stream(...): yields the chunks, then a final message."""
+
+    def __init__(self, chunks, calls):
+        self.chunks, self.calls, self.read = chunks, calls, 0
+        self.current_message_snapshot = _message("")
+
+    def __call__(self, **kw):
+        self.calls.append(kw)
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    @property
+    def text_stream(self):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+    def get_final_message(self):
+        return _message("".join(self.chunks))
+
+
+def _chunks(text: str, size: int = 20) -> list[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_stream_mode_reports_first_story(capsys):
+    calls = []
+    with patch.object(summarizer, "SUMMARIZER_MODE", "stream"), \
+         patch.object(summarizer.client.messages, "stream", _FakeStream(_chunks(json.dumps(DIGEST)), calls)):
+        digest = summarizer.summarize_news(ARTICLES)
+
+    assert digest == DIGEST
+    assert len(calls) == 1 and calls[0]["system"] == summarizer._system()
+    out = capsys.readouterr().out
+    assert "First story after" in out and "digest: 10 input" in out
+
+
+def test_stream_mode_abandons_a_diverging_reply_early(capsys):
+    broken = _FakeStream(['{"digest": '] + _chunks(json.dumps(DIGEST)), [])
+    good   = _FakeStream(_chunks(json.dumps(DIGEST)), [])
+    replies = iter([broken, good])
+    with patch.object(summarizer, "SUMMARIZER_MODE", "stream"), \
+         patch.object(summarizer.client.messages, "stream", side_effect=lambda **kw: next(replies)):
+        digest = summarizer.summarize_news(ARTICLES)
+
+    assert digest == DIGEST
+    assert broken.read == 1                 # stopped at the first chunk
+    out = capsys.readouterr().out
+    assert "Reply diverged" in out and "digest (aborted)" in out
+
+
+def _tool_message(digest: dict | None, stop_reason: str = "tool_use"):
+    message = _message("")
+    blocks = [SimpleNamespace(type="text", text="")]
+    if digest is not None:
+        blocks.append(SimpleNamespace(type="tool_use", name="publish_digest", input=digest))
+    message.content, message.stop_reason = blocks, stop_reason
+    return message
+
+
+def test_tool_mode_returns_the_tool_input_without_repair():
+    calls = []
+    with patch.object(summarizer, "SUMMARIZER_MODE", "tool"), \
+         patch.object(summarizer.client.messages, "create",
+                      side_effect=lambda **kw: calls.append(kw) or _tool_message(DIGEST)):
+        digest = summarizer.summarize_news(ARTICLES)
+
+    assert digest == DIGEST
+    (call,) = calls
+    assert call["tool_choice"] == {"type": "tool", "name": "publish_digest"}
+    schema = call["tools"][0]["input_schema"]
+    assert schema["required"] == ["es", "en"]
+    assert set(schema["properties"]["es"]["properties"]["stories"]["items"]["required"]) == set(STORY)
+    assert call["system"] == summarizer._system()
+
+
+_BROKEN = {"es": {k: v for k, v in DIGEST["es"].items() if k != "stories"},
+           "en": {**DIGEST["en"], "sentiment": {**DIGEST["en"]["sentiment"], "position": 120}}}
+
+
+@pytest.mark.parametrize("reply", [_tool_message(None, "end_turn"), _tool_message(DIGEST, "max_tokens"),
+                                   _tool_message(_BROKEN)])
+def test_tool_mode_fails_loudly_instead_of_repairing(reply):
+    with patch.object(summarizer, "SUMMARIZER_MODE", "tool"), \
+         patch.object(summarizer.client.messages, "create", return_value=reply) as create:
+        with pytest.raises(ValueError):
+            summarizer.summarize_news(ARTICLES)
+    assert create.call_count == 1
+
+
+def _fake_claude(calls):
+    """Digest calls get the ES block; translation calls get their fields back prefixed with EN:."""
+    def create(**kw):
+        calls.append(kw)
+        if kw["model"] == summarizer.TRANSLATION_MODEL:
+            fields = json.loads(kw["messages"][0]["content"])
+            return _message(json.dumps({k: f"EN: {v}" for k, v in fields.items()}))
+        return _message(json.dumps({"es": DIGEST["es"]}))
+    return create
+
+
+def test_es_first_returns_spanish_then_translates_sections():
+    calls = []
+    with patch.object(summarizer.client.messages, "create", side_effect=_fake_claude(calls)):
+        digest, en_pending = summarizer.summarize_news_es_first(ARTICLES)
+        en = en_pending.result(timeout=5)
+
+    assert digest == {"es": DIGEST["es"]}
+    es = DIGEST["es"]
+    assert en["editor_note"] == f"EN: {es['editor_note']}"
+    assert en["stories"][0]["headline"] == "EN: h" and en["stories"][0]["body"] == "EN: b"
+    assert en["stories"][0]["url"] == es["stories"][0]["url"]
+    assert en["sentiment"] == es["sentiment"] and en["quote"] == es["quote"]
+
+    main, *translations = calls
+    assert main["model"] == summarizer.SUMMARIZER_MODEL
+    assert '"en": {' not in main["system"][0]["text"] and '"es": {' in main["system"][0]["text"]
+    assert len(translations) == 3       # editor_note, narrative_thread, one story
+    assert {c["model"] for c in translations} == {summarizer.TRANSLATION_MODEL}
+
+
+def test_translation_with_wrong_keys_is_retried_then_rejected():
+    with patch.object(summarizer.client.messages, "create",
+                      return_value=_message(json.dumps({"titular": "x"}))) as create:
+        with pytest.raises(ValueError, match="Could not translate story 1"):
+            summarizer._translate_section("story 1", {"headline": "h", "body": "b"})
+    assert create.call_count == 2
+
+
+def test_translation_check_rejects_changed_urls():
+    en = json.loads(json.dumps(DIGEST["es"]))
+    en["stories"][0]["url"] = "https://elsewhere.com"
+    with pytest.raises(ValueError, match="changed url"):
+        summarizer._check_translation(DIGEST["es"], en)
+
+
+def test_planned_prompt_is_logged_against_billed_tokens(capsys):
+    with patch.object(summarizer.client.messages, "create", return_value=_message(json.dumps(DIGEST))):
+        summarizer.summarize_news(ARTICLES)
+    out = capsys.readouterr().out
+    assert "[budget] Prompt planned ~" in out and "billed 10 " in out
+
+
+def test_tool_input_is_checked_against_the_schema():
+    schema = summarizer._DIGEST_TOOL["input_schema"]
+    assert summarizer._schema_errors(DIGEST, schema) == []
+    assert summarizer._schema_errors(_BROKEN, schema) == [
+        "digest.es.stories: missing", "digest.en.sentiment.position: 120 out of range 5-95",
+    ]
+
+
+def test_stream_mode_keeps_a_reply_with_a_preamble(capsys):
+    calls = []
+    chunks = ["Claro, aquí tienes el digest:\n"] + _chunks(json.dumps(DIGEST))
+    with patch.object(summarizer, "SUMMARIZER_MODE", "stream"), \
+         patch.object(summarizer.client.messages, "stream", _FakeStream(chunks, calls)):
+        assert summarizer.summarize_news(ARTICLES) == DIGEST
+    assert len(calls) == 1
+    assert "diverged" not in capsys.readouterr().out
@@ -0,0 +1,56 @@
+"""
+Tests for token_budget.py
+
+Run from repo root:
+  pytest tests/test_token_budget.py
+"""
+
+from token_budget import allocate, count_tokens, plan, trim_to_tokens
+
+TEXT = ("Banxico recortó la tasa a 9.0%. El peso se apreció frente al dólar. "
+        "Los analistas esperan otro recorte en junio. La inflación sigue por encima de la meta.")
+
+
+def test_count_tokens_counts_words_numbers_and_punctuation():
+    assert count_tokens("") == 0
+    assert count_tokens("el peso") == 2
+    assert count_tokens("internacionalización") == 4    # long words are several tokens
+    assert count_tokens("2026") == 2 and count_tokens("9.0%") == 4
+
+
+def test_trim_keeps_whole_sentences():
+    budget = count_tokens("Banxico recortó la tasa a 9.0%. El peso se apreció frente al dólar.")
+    assert trim_to_tokens(TEXT, budget) == "Banxico recortó la tasa a 9.0%. El peso se apreció frente al dólar."
+    assert trim_to_tokens(TEXT, budget - 1) == "Banxico recortó la tasa a 9.0%."
+    assert trim_to_tokens(TEXT, 10_000) == TEXT
+
+
+def test_trim_cuts_an_oversized_first_sentence_at_a_word():
+    assert trim_to_tokens(TEXT, 5) == "Banxico recortó la"
+
+
+def test_allocate_floor_then_by_weight_capped_at_need():
+    allowed = allocate([1000, 1000, 100, 5000], [0.6, 0.3, 0.5, 0.0], budget=1500, floor=150)
+    assert allowed[2] == 100                # needs less than the floor
+    assert allowed[3] == 150                # no score: floor only
+    assert allowed[0] > allowed[1] > 150
+    assert sum(allowed) == 1500
+
+
+def test_allocate_without_scores_shares_equally_and_never_exceeds_budget():
+    assert allocate([1000, 1000], [0, 0], budget=600, floor=150) == [300, 300]
+    assert sum(allocate([500] * 10, [1] * 10, budget=1000, floor=150)) <= 1000
+
+
+def test_plan_trims_copies_and_leaves_small_pools_alone():
+    long_text = " ".join([TEXT] * 10)           # ~440 tokens
+    articles = [{"title": "a", "content": long_text, "score": 0.7},
+                {"title": "b", "content": long_text, "score": 0.2}]
+    untouched, tokens = plan(articles, budget=10_000)
+    assert [a["content"] for a in untouched] == [long_text] * 2 and tokens == 2 * count_tokens(long_text)
+
+    planned, tokens = plan(articles, budget=500)
+    assert tokens <= 500
+    assert len(planned[0]["content"]) > len(planned[1]["content"])
+    assert planned[1]["content"].endswith(".")
+    assert articles[0]["content"] == long_text  # inputs are not modified
@@ -0,0 +1,54 @@
+"""
+Tests for uniqueness.py
+
+Run from repo root:
+  pytest tests/test_uniqueness.py
+"""
+
+import random
+
+from uniqueness import filter_unique, headline_words
+
+
+def _pairwise(articles, limit, threshold=0.6):
+    accepted, accepted_words = [], []
+    for article in articles:
+        words = headline_words(article)
+        if words and accepted_words and max(len(words & w) / len(words) for w in accepted_words) >= threshold:
+            continue
+        accepted.append(article)
+        accepted_words.append(words)
+        if len(accepted) >= limit:
+            break
+    return accepted
+
+
+def test_matches_pairwise_pass_on_random_pools():
+    rng = random.Random(7)
+    vocab = [f"w{i}" for i in range(40)]
+    for _ in range(30):
+        pool = [{"title": " ".join(rng.choices(vocab, k=rng.randint(0, 8)))} for _ in range(200)]
+        for threshold in (0.6, 0.5, 1.0):
+            assert filter_unique(pool, 50, threshold) == _pairwise(pool, 50, threshold)
+
+
+def test_overlap_is_measured_from_the_candidate_side():
+    long_  = {"title": "Banxico recorta la tasa de interés a 9 por ciento"}
+    short_ = {"title": "Banxico recorta tasa"}
+    # 3/3 of the short headline's words are in the long one
+    assert filter_unique([long_, short_], 10) == [long_]
+    # but only 3/10 of the long headline's words are in the short one
+    assert filter_unique([short_, long_], 10) == [short_, long_]
+
+
+def test_stops_at_limit_and_keeps_empty_headlines():
+    pool = [{"title": ""}, {"title": "uno"}, {"title": "dos"}, {"title": "tres"}]
+    assert filter_unique(pool, 3) == pool[:3]
+
+
+def test_body_shingles_catch_reworded_headlines():
+    body = "El banco central de México recortó su tasa de referencia en un cuarto de punto este jueves"
+    a = {"title": "Banxico baja tasas", "content": body}
+    b = {"title": "Recorte monetario sorprende", "content": body + " según analistas"}
+    assert filter_unique([a, b], 10) == [a, b]
+    assert filter_unique([a, b], 10, use_body=True) == [a]